@@ -15,6 +15,39 @@ export const list = query({
     },
 });
 
+// Features pre-partitioned by status, plus the dependency edges between them,
+// so list and graph views need a single round trip.
+export const listWithGraph = query({
+    args: { projectId: v.string() },
+    handler: async (ctx, args) => {
+        const docs = await ctx.db
+            .query("features")
+            .withIndex("by_project_priority", (q) => q.eq("projectId", args.projectId))
+            .collect();
+
+        const pending = [];
+        const in_progress = [];
+        const done = [];
+        const edges = [];
+
+        for (const doc of docs) {
+            if (doc.passes) {
+                done.push(doc);
+            } else if (doc.in_progress) {
+                in_progress.push(doc);
+            } else {
+                pending.push(doc);
+            }
+
+            for (const depId of doc.dependencies ?? []) {
+                edges.push({ from: depId, to: doc.featureId });
+            }
+        }
+
+        return { pending, in_progress, done, edges };
+    },
+});
+
 export const create = mutation({
     args: {
         projectId: v.string(),
@@ -207,6 +240,62 @@ export const createBulk = mutation({
     }
 });
 
+export const addDependency = mutation({
+    args: { projectId: v.string(), featureId: v.number(), depId: v.number() },
+    handler: async (ctx, args) => {
+        if (args.featureId === args.depId) throw new Error("Cannot depend on self");
+
+        const allFeatures = await ctx.db
+            .query("features")
+            .withIndex("by_project", q => q.eq("projectId", args.projectId))
+            .collect();
+
+        const byId = new Map(allFeatures.map(f => [f.featureId, f]));
+        const existing = byId.get(args.featureId);
+        if (!existing) throw new Error(`Feature ${args.featureId} not found`);
+        if (!byId.has(args.depId)) throw new Error(`Dependency ${args.depId} not found`);
+
+        const current = existing.dependencies ?? [];
+        if (current.includes(args.depId)) return current;
+
+        // Circular if featureId is already reachable from depId
+        const seen = new Set<number>();
+        const stack = [args.depId];
+        while (stack.length > 0) {
+            const id = stack.pop()!;
+            if (id === args.featureId) throw new Error("Would create circular dependency");
+            if (seen.has(id)) continue;
+            seen.add(id);
+            stack.push(...(byId.get(id)?.dependencies ?? []));
+        }
+
+        const dependencies = [...current, args.depId];
+        await ctx.db.patch(existing._id, { dependencies });
+        return dependencies;
+    },
+});
+
+export const removeDependency = mutation({
+    args: { projectId: v.string(), featureId: v.number(), depId: v.number() },
+    handler: async (ctx, args) => {
+        const existing = await ctx.db
+            .query("features")
+            .withIndex("by_project_featureId", q => q.eq("projectId", args.projectId).eq("featureId", args.featureId))
+            .unique();
+        if (!existing) throw new Error(`Feature ${args.featureId} not found`);
+
+        const current = existing.dependencies ?? [];
+        const index = current.indexOf(args.depId);
+        if (index === -1) return current;
+
+        // addDependency never stores duplicates, so dropping the one match is enough
+        const dependencies = current.slice();
+        dependencies.splice(index, 1);
+        await ctx.db.patch(existing._id, { dependencies });
+        return dependencies;
+    },
+});
+
 // Helper: skip
 export const skip = mutation({
     args: { projectId: v.string(), featureId: v.number() },
@@ -77,6 +77,11 @@ DEFAULT_YOLO_MODE = False
 SQLITE_TIMEOUT = 30  # seconds to wait for database lock
 SQLITE_MAX_RETRIES = 3  # number of retry attempts on busy database
 
+# Project names: ASCII letters, digits, hyphens, underscores (1-50 chars).
+# \A...\Z (not ^...$) so a trailing newline is rejected. Also used by the
+# server's validators, so both accept exactly the same names.
+PROJECT_NAME_RE = re.compile(r'\A[a-zA-Z0-9_-]{1,50}\Z')
+
 
 # =============================================================================
 # Exceptions
@@ -276,7 +281,7 @@ def register_project(name: str, path: Path) -> None:
         RegistryError: If a project with that name already exists.
     """
     # Validate name
-    if not re.match(r'^[a-zA-Z0-9_-]{1,50}$', name):
+    if not PROJECT_NAME_RE.match(name):
         raise ValueError(
             "Invalid project name. Use only letters, numbers, hyphens, "
             "and underscores (1-50 chars)."
@@ -429,7 +434,7 @@ def rename_project(old_name: str, new_name: str, new_path: Path) -> None:
         RegistryError: If new name already exists or old project not found.
     """
     # Validate new name
-    if not re.match(r'^[a-zA-Z0-9_-]{1,50}$', new_name):
+    if not PROJECT_NAME_RE.match(new_name):
         raise ValueError(
             "Invalid project name. Use only letters, numbers, hyphens, "
             "and underscores (1-50 chars)."
@@ -14,15 +14,18 @@ Options:
     --project NAME  Migrate only the specified project
 """
 
-import argparse
-import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from registry import list_registered_projects, get_project_path
+from server.hooks.metadata_templates import ensure_metadata
+
+# Projects are migrated concurrently
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def create_metadata_files(project_dir: Path, dry_run: bool = False) -> list[str]:
@@ -36,135 +39,123 @@ def create_metadata_files(project_dir: Path, dry_run: bool = False) -> list[str]
     Returns:
         List of created file paths (relative to project_dir)
     """
-    xaheen_dir = project_dir / ".xaheen"
-    created = []
-    
-    # Define metadata files and their default content
-    files_to_create = {
-        "ideation.md": "# Project Ideation\n\n## Initial Vision\n\n## Design Decisions\n\n## Future Ideas\n\n",
-        "context.json": json.dumps({
-            "techStack": {},
-            "constraints": [],
-            "conventions": {
-                "fileNaming": "kebab-case",
-                "componentStyle": "functional"
-            }
-        }, indent=2),
-        "roadmap.json": json.dumps({
-            "phases": [],
-            "milestones": [],
-            "currentPhase": None
-        }, indent=2),
-    }
-    
-    # Create .xaheen directory
-    if not xaheen_dir.exists():
-        if not dry_run:
-            xaheen_dir.mkdir(parents=True, exist_ok=True)
-        created.append(".xaheen/")
-    
-    # Create metadata files
-    for filename, default_content in files_to_create.items():
-        file_path = xaheen_dir / filename
-        if not file_path.exists():
-            if not dry_run:
-                file_path.write_text(default_content, encoding="utf-8")
-            created.append(f".xaheen/{filename}")
-    
-    # Create kb directory
-    kb_dir = xaheen_dir / "kb"
-    if not kb_dir.exists():
-        if not dry_run:
-            kb_dir.mkdir(parents=True, exist_ok=True)
-            # Create initial KB files
-            (kb_dir / "architecture.md").write_text(
-                "# Architecture Decisions\n\n## Overview\n\n## Key Patterns\n\n",
-                encoding="utf-8"
-            )
-            (kb_dir / "gotchas.md").write_text(
-                "# Known Issues & Gotchas\n\n## Common Pitfalls\n\n## Workarounds\n\n",
-                encoding="utf-8"
-            )
-        created.append(".xaheen/kb/")
-        if not dry_run:
-            created.append(".xaheen/kb/architecture.md")
-            created.append(".xaheen/kb/gotchas.md")
-    
-    return created
-
-
-def migrate_project(project_name: str, project_dir: Path, dry_run: bool = False) -> dict:
+    return [f".xaheen/{item}" for item in ensure_metadata(project_dir, dry_run)]
+
+
+def migrate_project(project_name: str, project_dir: Path, dry_run: bool = False) -> tuple[dict, list[str]]:
     """
     Migrate a single project.
     
+    Output is collected rather than printed so concurrent migrations can
+    each be flushed as one block.
+    
     Returns:
-        Dict with migration status and created files
+        Tuple of (dict with migration status and created files, log lines)
     """
-    print(f"{'[DRY RUN] ' if dry_run else ''}Migrating {project_name}...")
+    lines = [f"{'[DRY RUN] ' if dry_run else ''}Migrating {project_name}..."]
     
     try:
         created = create_metadata_files(project_dir, dry_run)
-        
-        if created:
-            print(f"  ✓ Created {len(created)} items:")
-            for item in created:
-                print(f"    - {item}")
-        else:
-            print(f"  ℹ Already has metadata structure")
-        
-        return {
-            "success": True,
-            "project": project_name,
-            "created": created
-        }
     except Exception as e:
-        print(f"  ✗ Failed: {e}")
+        lines.append(f"  ✗ Failed: {e}")
         return {
             "success": False,
             "project": project_name,
             "error": str(e)
-        }
+        }, lines
+    
+    if created:
+        lines.append(f"  ✓ Created {len(created)} items:")
+        lines.extend(f"    - {item}" for item in created)
+    else:
+        lines.append(f"  ℹ Already has metadata structure")
+    
+    return {
+        "success": True,
+        "project": project_name,
+        "created": created
+    }, lines
+
+
+def parse_args(argv: list[str]) -> tuple[bool, str | None]:
+    """
+    Parse command-line arguments (see module docstring for usage).
+    
+    Hand-rolled instead of argparse to keep interpreter startup cheap.
+    
+    Returns:
+        Tuple of (dry_run, project_name)
+    """
+    dry_run = False
+    project = None
+    
+    args = iter(argv)
+    for arg in args:
+        if arg == "--dry-run":
+            dry_run = True
+        elif arg == "--project":
+            project = next(args, None)
+            if project is None:
+                print("error: --project requires a project name", file=sys.stderr)
+                sys.exit(2)
+        elif arg.startswith("--project="):
+            project = arg.partition("=")[2]
+        elif arg in ("-h", "--help"):
+            print(__doc__)
+            sys.exit(0)
+        else:
+            print(f"error: unrecognized argument: {arg}\n{__doc__}", file=sys.stderr)
+            sys.exit(2)
+    
+    return dry_run, project
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Migrate projects to new metadata structure")
-    parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
-    parser.add_argument("--project", type=str, help="Migrate only the specified project")
-    args = parser.parse_args()
+    dry_run, project = parse_args(sys.argv[1:])
+    
+    # Deferred so argument errors and --help don't pay for the registry import
+    from registry import list_registered_projects
     
     print("=" * 60)
     print("AutoForge Metadata Migration")
     print("=" * 60)
     
-    if args.dry_run:
+    if dry_run:
         print("\n⚠️  DRY RUN MODE - No files will be created\n")
     
     # Get projects to migrate
     all_projects = list_registered_projects()
     
-    if args.project:
-        if args.project not in all_projects:
-            print(f"❌ Project '{args.project}' not found in registry")
+    if project:
+        if project not in all_projects:
+            print(f"❌ Project '{project}' not found in registry")
             sys.exit(1)
-        projects_to_migrate = {args.project: all_projects[args.project]}
+        projects_to_migrate = {project: all_projects[project]}
     else:
         projects_to_migrate = all_projects
     
     print(f"Found {len(projects_to_migrate)} project(s) to migrate\n")
     
-    # Migrate each project
-    results = []
+    # Skip projects whose directory no longer exists
+    to_migrate = {}
     for project_name, info in projects_to_migrate.items():
         project_dir = Path(info["path"])
-        
-        # Skip if path doesn't exist
         if not project_dir.exists():
             print(f"⚠️  Skipping {project_name}: directory not found at {project_dir}")
             continue
-        
-        result = migrate_project(project_name, project_dir, args.dry_run)
-        results.append(result)
-        print()
+        to_migrate[project_name] = project_dir
+    
+    # Migrate projects in parallel; the work is independent per directory
+    results = []
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(migrate_project, project_name, project_dir, dry_run)
+            for project_name, project_dir in to_migrate.items()
+        ]
+        for future in as_completed(futures):
+            result, log_lines = future.result()
+            results.append(result)
+            sys.stdout.write("\n".join(log_lines) + "\n\n")
     
     # Summary
     print("=" * 60)
@@ -185,7 +176,7 @@ def main():
     total_created = sum(len(r.get("created", [])) for r in successful)
     print(f"\nTotal items created: {total_created}")
     
-    if args.dry_run:
+    if dry_run:
         print("\n⚠️  This was a DRY RUN. Run without --dry-run to apply changes.")
     else:
         print("\n✅ Migration complete!")
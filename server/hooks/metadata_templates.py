@@ -0,0 +1,134 @@
+"""
+Project Metadata Templates
+Single source of the default .xaheen/ metadata layout, shared by the
+pre-session hook and scripts/migrate_to_metadata.py.
+"""
+
+import json
+import os
+from pathlib import Path
+
+# Default file contents keyed by path relative to .xaheen/,
+# serialized once at import time
+TEMPLATES: dict[str, bytes] = {
+    "ideation.md": b"""# Project Ideation
+
+## Vision
+[Describe the project vision and goals]
+
+## Key Ideas
+- [Idea 1]
+- [Idea 2]
+
+## Design Decisions
+- [Decision 1]
+- [Decision 2]
+""",
+    "context.json": json.dumps({
+        "techStack": {},
+        "constraints": [],
+        "conventions": {},
+        "environment": {}
+    }, indent=2).encode("utf-8"),
+    "roadmap.json": json.dumps({
+        "phases": [],
+        "milestones": [],
+        "currentPhase": None
+    }, indent=2).encode("utf-8"),
+    "kb/architecture.md": b"# Architecture\n\n[Document system architecture]\n",
+    "kb/gotchas.md": b"# Common Gotchas\n\n[Document known issues and workarounds]\n",
+}
+
+# Top-level entries that must exist in .xaheen/
+REQUIRED_ENTRIES = ("ideation.md", "context.json", "roadmap.json", "kb")
+
+# Written once the metadata layout is complete; bump the version if it changes
+METADATA_MARKER = ".metadata_v1"
+
+_KB_FILES = tuple(name for name in TEMPLATES if name.startswith("kb/"))
+
+
+def list_metadata_dir(project_dir: Path) -> set[str]:
+    """Return the entry names in .xaheen/, or an empty set if it doesn't exist."""
+    try:
+        return set(os.listdir(os.path.join(project_dir, ".xaheen")))
+    except FileNotFoundError:
+        return set()
+
+
+def touch_marker(project_dir: Path) -> None:
+    """Record that project_dir/.xaheen/ has the complete metadata layout."""
+    with open(os.path.join(project_dir, ".xaheen", METADATA_MARKER), "ab"):
+        pass
+
+
+def has_marker(project_dir: Path) -> bool:
+    """Return True if the metadata marker exists for project_dir."""
+    return os.path.exists(os.path.join(project_dir, ".xaheen", METADATA_MARKER))
+
+
+def _write_if_absent(path: str, content: bytes) -> bool:
+    """
+    Create path with content unless it already exists.
+    Uses O_CREAT|O_EXCL so the existence check and the write are one syscall.
+    Returns True if the file was created.
+    """
+    try:
+        with open(path, "xb") as f:
+            f.write(content)
+    except FileExistsError:
+        return False
+    return True
+
+
+def ensure_metadata(
+    project_dir: Path,
+    dry_run: bool = False,
+    missing: set[str] | None = None,
+) -> list[str]:
+    """
+    Create any missing metadata under project_dir/.xaheen/.
+
+    A kb/ directory that already exists is left untouched.
+
+    Args:
+        project_dir: Path to project directory
+        dry_run: If True, only report what would be created
+        missing: Entry names (from REQUIRED_ENTRIES) already known to be
+            absent; only those are created. None means try every entry.
+
+    Returns:
+        List of created (or, for dry runs, missing) paths relative to .xaheen/
+    """
+    # Plain string paths: this runs once per project during bulk migrations
+    xaheen_dir = os.path.join(project_dir, ".xaheen")
+
+    if dry_run:
+        existing = list_metadata_dir(project_dir)
+        missing = [name for name in REQUIRED_ENTRIES if name not in existing]
+        return [f"{name}/" if name == "kb" else name for name in missing]
+
+    os.makedirs(xaheen_dir, exist_ok=True)
+    created = []
+
+    wanted = REQUIRED_ENTRIES if missing is None else [n for n in REQUIRED_ENTRIES if n in missing]
+
+    # Create ideation.md, context.json and roadmap.json if missing
+    for name in wanted:
+        if name != "kb" and _write_if_absent(os.path.join(xaheen_dir, name), TEMPLATES[name]):
+            created.append(name)
+
+    # Create kb/ directory with its starter items if missing
+    if "kb" in wanted:
+        try:
+            os.mkdir(os.path.join(xaheen_dir, "kb"))
+        except FileExistsError:
+            pass
+        else:
+            for name in _KB_FILES:
+                with open(os.path.join(xaheen_dir, name), "wb") as f:
+                    f.write(TEMPLATES[name])
+            created.append("kb/")
+
+    touch_marker(project_dir)
+    return created
@@ -25,7 +25,7 @@ load_dotenv()
 
 from fastapi import FastAPI, HTTPException, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from .routers import (
@@ -44,6 +44,7 @@ from .routers import (
 )
 from .schemas import SetupStatus
 from .services.assistant_chat_session import cleanup_all_sessions as cleanup_assistant_sessions
+from .services.backend.factory import BackendFactory
 from .services.chat_constants import ROOT_DIR
 from .services.dev_server_manager import (
     cleanup_all_devservers,
@@ -66,6 +67,14 @@ async def lifespan(app: FastAPI):
     cleanup_orphaned_locks()
     cleanup_orphaned_devserver_locks()
 
+    # Build the shared persistence backend (and its connection pools) up
+    # front; a misconfiguration still surfaces on the first request
+    try:
+        backend = BackendFactory.get_backend()
+        await asyncio.to_thread(backend.warm_up)
+    except Exception:
+        logger.exception("Failed to initialize persistence backend")
+
     # Start the scheduler service
     scheduler = get_scheduler()
     await scheduler.start()
@@ -80,6 +89,8 @@ async def lifespan(app: FastAPI):
     await cleanup_all_expand_sessions()
     await cleanup_all_terminals()
     await cleanup_all_devservers()
+    # Last, so nothing above still needs the backend
+    BackendFactory.close()
 
 
 # Create FastAPI app
@@ -88,6 +99,7 @@ app = FastAPI(
     description="Web UI for the Autonomous Coding Agent",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Module logger
@@ -144,6 +156,23 @@ if not ALLOW_REMOTE:
         return await call_next(request)
 
 
+# ============================================================================
+# Error Handling
+# ============================================================================
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    Return a fixed 500 body for unhandled errors.
+
+    Starlette re-raises the exception after sending this response, and the
+    ASGI server logs it with its traceback, so it isn't logged here too. The
+    exception text stays in that log: it can carry paths, SQL or upstream
+    error bodies that shouldn't reach the client.
+    """
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+
 # ============================================================================
 # Include Routers
 # ============================================================================
@@ -6,13 +6,18 @@ API endpoints for feature/test case management.
 Delegates persistence to Pluggable Backend Architecture.
 """
 
+import hashlib
 import logging
 from typing import Literal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from server.services.backend.factory import BackendFactory
+from server.services.backend.factory import BackendDep
 from server.schemas import (
+    DependencyBulkResponse,
+    DependencyBulkUpdate,
     DependencyGraphEdge,
     DependencyGraphNode,
     DependencyGraphResponse,
@@ -24,11 +29,16 @@ from server.schemas import (
     FeatureResponse,
     FeatureUpdate,
 )
+from ..utils.etag import etag_matches
 from ..utils.validation import validate_project_name
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/projects/{project_name}/features", tags=["features"])
+router = APIRouter(
+    prefix="/api/projects/{project_name}/features",
+    tags=["features"],
+    default_response_class=ORJSONResponse,
+)
 
 
 def _handle_backend_error(e: Exception):
@@ -42,14 +52,30 @@ def _handle_backend_error(e: Exception):
     raise HTTPException(status_code=500, detail=f"Internal error: {msg}")
 
 
-@router.get("", response_model=FeatureListResponse)
-async def list_features(project_name: str):
+def _features_etag(backend, project_name: str, kind: str) -> str | None:
+    """Build a strong ETag for a features view from the backend's version token."""
+    version = backend.get_features_version(project_name)
+    if version is None:
+        return None
+    digest = hashlib.blake2b(f"{kind}:{version}".encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+@router.get("", response_model=FeatureListResponse, response_model_exclude_none=True)
+async def list_features(project_name: str, request: Request, response: Response, backend: BackendDep):
     """
     List all features for a project organized by status.
+
+    Supports conditional GET: a matching If-None-Match returns 304.
     """
     try:
-        backend = BackendFactory.get_backend()
-        result = backend.list_features(project_name)
+        etag = await run_in_threadpool(_features_etag, backend, project_name, "list")
+        if etag:
+            if etag_matches(request, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+
+        result = await run_in_threadpool(backend.list_features, project_name)
         return FeatureListResponse(
             pending=result["pending"],
             in_progress=result["in_progress"],
@@ -60,21 +86,19 @@ async def list_features(project_name: str):
 
 
 @router.post("", response_model=FeatureResponse)
-async def create_feature(project_name: str, feature: FeatureCreate):
+async def create_feature(project_name: str, feature: FeatureCreate, backend: BackendDep):
     """Create a new feature/test case manually."""
     try:
-        backend = BackendFactory.get_backend()
-        return backend.create_feature(project_name, feature)
+        return await run_in_threadpool(backend.create_feature, project_name, feature)
     except Exception as e:
         _handle_backend_error(e)
 
 
 @router.post("/bulk", response_model=FeatureBulkCreateResponse)
-async def create_features_bulk(project_name: str, bulk: FeatureBulkCreate):
+async def create_features_bulk(project_name: str, bulk: FeatureBulkCreate, backend: BackendDep):
     """Create multiple features at once."""
     try:
-        backend = BackendFactory.get_backend()
-        created = backend.create_features_bulk(project_name, bulk)
+        created = await run_in_threadpool(backend.create_features_bulk, project_name, bulk)
         return FeatureBulkCreateResponse(
             created=len(created),
             features=created
@@ -83,22 +107,36 @@ async def create_features_bulk(project_name: str, bulk: FeatureBulkCreate):
         _handle_backend_error(e)
 
 
-@router.get("/graph", response_model=DependencyGraphResponse)
-async def get_dependency_graph(project_name: str):
-    """Return dependency graph data for visualization."""
+@router.get("/graph", response_model=DependencyGraphResponse, response_model_exclude_none=True)
+async def get_dependency_graph(project_name: str, request: Request, response: Response, backend: BackendDep):
+    """Return dependency graph data for visualization (supports conditional GET)."""
+    try:
+        etag = await run_in_threadpool(_features_etag, backend, project_name, "graph")
+        if etag:
+            if etag_matches(request, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+
+        return await run_in_threadpool(backend.get_dependency_graph, project_name)
+    except Exception as e:
+        _handle_backend_error(e)
+
+
+@router.post("/dependencies/bulk", response_model=DependencyBulkResponse)
+async def apply_dependency_ops(project_name: str, bulk: DependencyBulkUpdate, backend: BackendDep):
+    """Apply many dependency add/remove operations in one request."""
     try:
-        backend = BackendFactory.get_backend()
-        return backend.get_dependency_graph(project_name)
+        deps = await run_in_threadpool(backend.apply_dependency_ops, project_name, bulk.ops)
+        return DependencyBulkResponse(success=True, dependencies=deps)
     except Exception as e:
         _handle_backend_error(e)
 
 
 @router.get("/{feature_id}", response_model=FeatureResponse)
-async def get_feature(project_name: str, feature_id: int):
+async def get_feature(project_name: str, feature_id: int, backend: BackendDep):
     """Get details of a specific feature."""
     try:
-        backend = BackendFactory.get_backend()
-        feature = backend.get_feature(project_name, feature_id)
+        feature = await run_in_threadpool(backend.get_feature, project_name, feature_id)
         if not feature:
             raise HTTPException(status_code=404, detail=f"Feature {feature_id} not found")
         return feature
@@ -109,31 +147,28 @@ async def get_feature(project_name: str, feature_id: int):
 
 
 @router.patch("/{feature_id}", response_model=FeatureResponse)
-async def update_feature(project_name: str, feature_id: int, update: FeatureUpdate):
+async def update_feature(project_name: str, feature_id: int, update: FeatureUpdate, backend: BackendDep):
     """Update a feature's details."""
     try:
-        backend = BackendFactory.get_backend()
-        return backend.update_feature(project_name, feature_id, update)
+        return await run_in_threadpool(backend.update_feature, project_name, feature_id, update)
     except Exception as e:
         _handle_backend_error(e)
 
 
 @router.delete("/{feature_id}")
-async def delete_feature(project_name: str, feature_id: int):
+async def delete_feature(project_name: str, feature_id: int, backend: BackendDep):
     """Delete a feature and clean up references."""
     try:
-        backend = BackendFactory.get_backend()
-        return backend.delete_feature(project_name, feature_id)
+        return await run_in_threadpool(backend.delete_feature, project_name, feature_id)
     except Exception as e:
         _handle_backend_error(e)
 
 
 @router.patch("/{feature_id}/skip")
-async def skip_feature(project_name: str, feature_id: int):
+async def skip_feature(project_name: str, feature_id: int, backend: BackendDep):
     """Mark a feature as skipped by moving it to the end of the priority queue."""
     try:
-        backend = BackendFactory.get_backend()
-        backend.skip_feature(project_name, feature_id)
+        await run_in_threadpool(backend.skip_feature, project_name, feature_id)
         return {"success": True, "message": f"Feature {feature_id} moved to end of queue"}
     except Exception as e:
         _handle_backend_error(e)
@@ -144,33 +179,30 @@ async def skip_feature(project_name: str, feature_id: int):
 # ============================================================================
 
 @router.post("/{feature_id}/dependencies/{dep_id}")
-async def add_dependency(project_name: str, feature_id: int, dep_id: int):
+async def add_dependency(project_name: str, feature_id: int, dep_id: int, backend: BackendDep):
     """Add a dependency relationship between features."""
     try:
-        backend = BackendFactory.get_backend()
-        deps = backend.add_dependency(project_name, feature_id, dep_id)
+        deps = await run_in_threadpool(backend.add_dependency, project_name, feature_id, dep_id)
         return {"success": True, "feature_id": feature_id, "dependencies": deps}
     except Exception as e:
         _handle_backend_error(e)
 
 
 @router.delete("/{feature_id}/dependencies/{dep_id}")
-async def remove_dependency(project_name: str, feature_id: int, dep_id: int):
+async def remove_dependency(project_name: str, feature_id: int, dep_id: int, backend: BackendDep):
     """Remove a dependency from a feature."""
     try:
-        backend = BackendFactory.get_backend()
-        deps = backend.remove_dependency(project_name, feature_id, dep_id)
+        deps = await run_in_threadpool(backend.remove_dependency, project_name, feature_id, dep_id)
         return {"success": True, "feature_id": feature_id, "dependencies": deps}
     except Exception as e:
         _handle_backend_error(e)
 
 
 @router.put("/{feature_id}/dependencies")
-async def set_dependencies(project_name: str, feature_id: int, update: DependencyUpdate):
+async def set_dependencies(project_name: str, feature_id: int, update: DependencyUpdate, backend: BackendDep):
     """Set all dependencies for a feature at once."""
     try:
-        backend = BackendFactory.get_backend()
-        deps = backend.set_dependencies(project_name, feature_id, update.dependency_ids)
+        deps = await run_in_threadpool(backend.set_dependencies, project_name, feature_id, update.dependency_ids)
         return {"success": True, "feature_id": feature_id, "dependencies": deps}
     except Exception as e:
         _handle_backend_error(e)
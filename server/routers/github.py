@@ -9,7 +9,7 @@ Supports cloning, initializing, and managing remote repositories.
 import logging
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from ..schemas import (
     GitInitRequest,
@@ -26,8 +26,7 @@ from ..services.github_service import (
     setup_remote,
     validate_git_url,
 )
-from ..utils.project_helpers import get_project_path as _get_project_path
-from ..utils.validation import validate_project_name
+from ..utils.project_helpers import resolve_project_dir
 
 logger = logging.getLogger(__name__)
 
@@ -35,27 +34,19 @@ router = APIRouter(prefix="/api/projects/{project_name}/git", tags=["git"])
 
 
 @router.get("/info", response_model=GitRepoInfo)
-async def get_git_info(project_name: str):
+async def get_git_info(project_dir: Path = Depends(resolve_project_dir)):
     """Get git repository information for a project."""
-    project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir or not project_dir.exists():
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found")
-
     info = get_repo_info(project_dir)
     return GitRepoInfo(**info)
 
 
 @router.post("/init", response_model=GitActionResponse)
-async def initialize_git(project_name: str, request: GitInitRequest = GitInitRequest()):
+async def initialize_git(
+    project_name: str,
+    request: GitInitRequest = GitInitRequest(),
+    project_dir: Path = Depends(resolve_project_dir),
+):
     """Initialize a git repository for a project."""
-    project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir or not project_dir.exists():
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found")
-
     try:
         init_repo(project_dir, default_branch=request.default_branch)
         return GitActionResponse(
@@ -67,14 +58,12 @@ async def initialize_git(project_name: str, request: GitInitRequest = GitInitReq
 
 
 @router.post("/remote", response_model=GitActionResponse)
-async def configure_remote(project_name: str, request: GitRemoteRequest):
+async def configure_remote(
+    project_name: str,
+    request: GitRemoteRequest,
+    project_dir: Path = Depends(resolve_project_dir),
+):
     """Configure a git remote for a project."""
-    project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir or not project_dir.exists():
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found")
-
     if not validate_git_url(request.remote_url):
         raise HTTPException(status_code=400, detail=f"Invalid git URL: {request.remote_url}")
 
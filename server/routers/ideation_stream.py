@@ -4,71 +4,99 @@ SSE streaming endpoint for ideation generation with progress updates.
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
-from typing import Generator
+from typing import AsyncGenerator
 import asyncio
 
 router = APIRouter()
 
+# Insight text shown alongside each stage in the UI
+_STAGE_THOUGHTS = {
+    "analyzing": "Scanning codebase to understand the project architecture",
+    "context": "Analyzing recent changes and project documentation",
+    "generating": "Considering UI improvements, performance optimizations, and new features",
+}
 
-async def generate_ideas_stream(project_name: str) -> Generator[str, None, None]:
+
+async def generate_ideas_stream(project_name: str) -> AsyncGenerator[bytes, None]:
     """
     Stream ideation generation progress using Server-Sent Events.
-    
-    Yields SSE-formatted progress updates.
+
+    Context gathering and the AI call each run in a worker thread; progress
+    events are emitted as the workers actually reach each stage. The AI call
+    holds a slot of the shared LLM semaphore, like the non-streaming
+    generate endpoints.
+
+    Yields pre-encoded SSE progress updates.
     """
     from ..services.ai_assistant import AIAssistant
+    from ..services.context_manager import ContextManager
     from ..services.ideation import IdeationManager
+    from ..utils.llm_limit import LLM_SEMAPHORE
+    from ..utils.project_helpers import get_project_path
     from ..utils.sse import progress_event, complete_event, error_event
-    from ...registry import get_project_path
-    
-    try:
-        # Stage 1: Analyzing Project
-        yield progress_event(
-            stage="analyzing",
-            progress=25,
-            message="Reading project structure and dependencies...",
-            thought="Scanning codebase to understand the project architecture"
-        )
-        await asyncio.sleep(0.5)  # Allow UI to update
-        
-        # Stage 2: Understanding Context
-        yield progress_event(
-            stage="context",
-            progress=50,
-            message="Processing README and git history...",
-            thought="Analyzing recent changes and project documentation"
-        )
-        await asyncio.sleep(0.5)
-        
-        # Stage 3: Generating Ideas
-        yield progress_event(
-            stage="generating",
-            progress=75,
-            message="AI is brainstorming improvement ideas...",
-            thought="Considering UI improvements, performance optimizations, and new features"
+
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    def report(stage: str, progress: int, message: str) -> None:
+        """Queue a progress event from the worker thread."""
+        event = progress_event(
+            stage=stage,
+            progress=progress,
+            message=message,
+            thought=_STAGE_THOUGHTS.get(stage, "")
         )
-        
+        loop.call_soon_threadsafe(events.put_nowait, event)
+
+    def in_worker(fn, *args) -> asyncio.Future:
+        """Run fn in a thread, queueing the end-of-stage sentinel when it returns."""
+        def run():
+            try:
+                return fn(*args)
+            finally:
+                loop.call_soon_threadsafe(events.put_nowait, None)
+        return asyncio.ensure_future(asyncio.to_thread(run))
+
+    def gather_context() -> tuple:
         # Get project directory
         project_dir = get_project_path(project_name)
         if not project_dir:
-            yield error_event(f"Project '{project_name}' not found")
-            return
-        
-        # Generate ideas
-        ai = AIAssistant(use_mock=False)
-        ideas = ai.generate_ideas(str(project_dir))
-        
-        # Save ideas
-        ideation_mgr = IdeationManager(project_dir)
-        for idea in ideas:
-            ideation_mgr.save_idea(idea)
-        
+            raise ValueError(f"Project '{project_name}' not found")
+
+        # Stage 1: Analyzing Project
+        report("analyzing", 25, "Reading project structure and dependencies...")
+        context_mgr = ContextManager(project_dir)
+        context = context_mgr.get_comprehensive_context()
+
+        # Stage 2: Understanding Context (done), Stage 3 reported by the assistant
+        report("context", 50, "Processing README and git history...")
+        return project_dir, context
+
+    def generate(context: dict) -> list:
+        ai = AIAssistant(use_mock=False, progress_callback=report)
+        return ai.generate_ideas(context)
+
+    try:
+        task = in_worker(gather_context)
+        while (event := await events.get()) is not None:
+            yield event
+        project_dir, context = await task
+
+        async with LLM_SEMAPHORE:
+            task = in_worker(generate, context)
+            while (event := await events.get()) is not None:
+                yield event
+            ideas = await task
+
+        # Save ideas: one read and one write for the whole batch
+        await asyncio.to_thread(IdeationManager(project_dir).save_ideas, ideas)
+
         # Stage 4: Complete
         yield complete_event({
             "ideas": ideas,
             "count": len(ideas)
         })
-        
+
     except Exception as e:
         yield error_event(str(e))
 
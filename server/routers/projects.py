@@ -6,13 +6,23 @@ API endpoints for project management.
 Uses project registry for path lookups instead of fixed generations/ directory.
 """
 
+import asyncio
+import importlib
+import logging
+import os
 import re
 import shutil
+import sqlite3
+import stat
 import sys
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 
 from ..schemas import (
     ProjectCreate,
@@ -25,142 +35,205 @@ from ..schemas import (
     ProjectSummary,
     ProjectContextNotes,
     ProjectContextConfig,
+    Idea,
     IdeaSave,
     FeatureStatusUpdate,
-    FeatureUpdate,
+    RoadmapFeatureUpdate,
+)
+from ..services.ai_assistant import AIAssistant
+from ..services.backend.factory import BackendDep
+from ..services.context_manager import ContextManager
+from ..services.convex_init import (
+    ConvexInitError,
+    check_convex_initialized,
+    initialize_convex_for_project,
+)
+from ..services.ideation import IdeationManager
+from ..services.roadmap import RoadmapManager
+from ..utils.etag import etag_matches, file_etag
+from ..utils.llm_limit import LLM_SEMAPHORE
+from ..utils.project_helpers import get_project_path, invalidate_project_path, resolve_project_dir
+from ..utils.validation import validate_project_name
+from .filesystem import is_path_blocked
+
+# Make the project root importable (one-shot, at module import)
+_ROOT = str(Path(__file__).parent.parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from registry import (
+    get_project_concurrency,
+    list_registered_projects,
+    register_project,
+    rename_project,
+    set_project_concurrency,
+    unregister_project,
+)
+from xaheen_paths import (
+    get_assistant_db_path,
+    get_claude_assistant_settings_path,
+    get_claude_settings_path,
+    get_features_db_path,
+    get_prompts_dir,
+    has_agent_running,
 )
 
-# Lazy imports to avoid circular dependencies
-# These are initialized by _init_imports() before first use.
-_imports_initialized = False
-_check_spec_exists: Callable[..., Any] | None = None
-_scaffold_project_prompts: Callable[..., Any] | None = None
-_get_project_prompts_dir: Callable[..., Any] | None = None
-_count_passing_tests: Callable[..., Any] | None = None
-
-
-def _init_imports():
-    """Lazy import of project-level modules."""
-    global _imports_initialized, _check_spec_exists
-    global _scaffold_project_prompts, _get_project_prompts_dir
-    global _count_passing_tests
-
-    if _imports_initialized:
-        return
-
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-
-    from progress import count_passing_tests
-    from prompts import get_project_prompts_dir, scaffold_project_prompts
-    from start import check_spec_exists
-
-    _check_spec_exists = check_spec_exists
-    _scaffold_project_prompts = scaffold_project_prompts
-    _get_project_prompts_dir = get_project_prompts_dir
-    _count_passing_tests = count_passing_tests
-    _imports_initialized = True
-
-
-def _get_registry_functions():
-    """Get registry functions with lazy import."""
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-
-    from registry import (
-        get_project_concurrency,
-        get_project_path,
-        list_registered_projects,
-        register_project,
-        rename_project,
-        set_project_concurrency,
-        unregister_project,
-        validate_project_path,
-    )
-    return (
-        register_project,
-        unregister_project,
-        get_project_path,
-        list_registered_projects,
-        validate_project_path,
-        get_project_concurrency,
-        set_project_concurrency,
-        rename_project,
-    )
+# Project-level helpers imported on first use: name -> (module, attribute)
+_LAZY = {
+    "check_spec_exists": ("start", "check_spec_exists"),
+    "count_passing_tests": ("progress", "count_passing_tests"),
+    "dispose_assistant_engine": ("server.services.assistant_database", "dispose_engine"),
+    "dispose_features_engine": ("api.database", "dispose_engine"),
+    "get_project_prompts_dir": ("prompts", "get_project_prompts_dir"),
+    "scaffold_project_prompts": ("prompts", "scaffold_project_prompts"),
+}
 
 
-router = APIRouter(prefix="/api/projects", tags=["projects"])
+class _LazyImports:
+    """
+    Namespace that imports a helper from _LAZY on first attribute access.
+    The result is stored as a plain attribute, so later lookups never
+    reach __getattr__.
+    """
+    def __getattr__(self, name: str) -> Any:
+        try:
+            module_name, attr = _LAZY[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = getattr(importlib.import_module(module_name), attr)
+        setattr(self, name, value)
+        return value
 
 
-def validate_project_name(name: str) -> str:
-    """Validate and sanitize project name to prevent path traversal."""
-    if not re.match(r'^[a-zA-Z0-9_-]{1,50}$', name):
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid project name. Use only letters, numbers, hyphens, and underscores (1-50 chars)."
-        )
-    return name
+_lazy = _LazyImports()
+
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/projects",
+    tags=["projects"],
+    default_response_class=ORJSONResponse,
+)
+
+# pydantic-core serializers for the ideation/roadmap write paths, bound once;
+# calling them directly skips model_dump's per-call wrapper
+_dump_idea = Idea.__pydantic_serializer__.to_python
+_dump_feature_update = RoadmapFeatureUpdate.__pydantic_serializer__.to_python
+
+# Knowledge-base filenames: a slug plus .md. \Z (not $) so a trailing
+# newline is rejected.
+_KNOWLEDGE_FILENAME_RE = re.compile(r'\A[a-zA-Z0-9_-]+\.md\Z')
+
+
+# Cached ProjectStats per project directory, keyed by the features.db file
+# signature. Holds one entry per registered project.
+_stats_cache: dict[Path, tuple[tuple[int, int, int, int], ProjectStats]] = {}
+
+
+def _features_db_signature(project_dir: Path) -> tuple[int, int, int, int]:
+    """(mtime_ns, size) of features.db and its WAL; zeros for missing files."""
+    db_path = str(get_features_db_path(project_dir))
+    sig: list[int] = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            st = os.stat(path)
+        except OSError:
+            sig += (0, 0)
+        else:
+            sig += (st.st_mtime_ns, st.st_size)
+    return (sig[0], sig[1], sig[2], sig[3])
+
+
+def _invalidate_project_stats(project_dir: Path) -> None:
+    """Drop the cached stats for project_dir."""
+    _stats_cache.pop(project_dir, None)
+
+
+def validate_knowledge_filename(filename: str) -> str:
+    """Return filename if it is a safe knowledge-base name (``<slug>.md``), else raise 400."""
+    if not _KNOWLEDGE_FILENAME_RE.match(filename):
+        raise HTTPException(status_code=400, detail="Invalid filename")
+    return filename
+
+
+def _resolve_project_dir(name: str) -> Path:
+    """FastAPI dependency: the validated, existing directory for the {name} path parameter."""
+    return resolve_project_dir(name)
+
+
+# Handlers declare ``project_dir: ProjectDirDep`` instead of resolving {name} themselves
+ProjectDirDep = Annotated[Path, Depends(_resolve_project_dir)]
 
 
 def get_project_stats(project_dir: Path) -> ProjectStats:
-    """Get statistics for a project."""
-    _init_imports()
-    assert _count_passing_tests is not None  # guaranteed by _init_imports()
-    passing, in_progress, total = _count_passing_tests(project_dir)
+    """Get statistics for a project (cached until features.db changes)."""
+    signature = _features_db_signature(project_dir)
+    cached = _stats_cache.get(project_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    passing, in_progress, total = _lazy.count_passing_tests(project_dir)
     percentage = (passing / total * 100) if total > 0 else 0.0
-    return ProjectStats(
+    stats = ProjectStats.model_construct(
         passing=passing,
         in_progress=in_progress,
         total=total,
         percentage=round(percentage, 1)
     )
+    _stats_cache[project_dir] = (signature, stats)
+    return stats
 
 
-@router.get("", response_model=list[ProjectSummary])
-async def list_projects():
-    """List all registered projects."""
-    _init_imports()
-    assert _check_spec_exists is not None  # guaranteed by _init_imports()
-    (_, _, _, list_registered_projects, validate_project_path,
-     get_project_concurrency, _, _) = _get_registry_functions()
+def _load_project_summary(name: str, info: dict[str, Any]) -> ProjectSummary | None:
+    """Build the summary for one registered project, or None if its path is gone."""
+    path = info["path"]
 
-    projects = list_registered_projects()
-    result = []
+    # Skip if path no longer exists or isn't usable. Same checks as
+    # registry.validate_project_path, on the plain string: registry paths
+    # are stored resolved, so there's no Path building or resolve() per project.
+    if not (os.path.isdir(path) and os.access(path, os.R_OK | os.W_OK)):
+        return None
 
-    for name, info in projects.items():
-        project_dir = Path(info["path"])
+    project_dir = Path(path)
+    # All fields come from the registry or our own helpers; skip re-validation
+    return ProjectSummary.model_construct(
+        name=name,
+        path=path,
+        has_spec=_lazy.check_spec_exists(project_dir),
+        stats=get_project_stats(project_dir),
+        default_concurrency=info.get("default_concurrency", 3),
+    )
 
-        # Skip if path no longer exists
-        is_valid, _ = validate_project_path(project_dir)
-        if not is_valid:
-            continue
 
-        has_spec = _check_spec_exists(project_dir)
-        stats = get_project_stats(project_dir)
+# Last list_projects result and its serialized JSON body
+_list_cache: tuple[list[ProjectSummary], bytes] | None = None
 
-        result.append(ProjectSummary(
-            name=name,
-            path=info["path"],
-            has_spec=has_spec,
-            stats=stats,
-            default_concurrency=info.get("default_concurrency", 3),
-        ))
 
-    return result
+@router.get("", response_model=list[ProjectSummary])
+async def list_projects():
+    """List all registered projects."""
+    global _list_cache
+
+    projects = await asyncio.to_thread(list_registered_projects)
+
+    # Per-project filesystem/DB work runs concurrently in the default thread pool
+    summaries = await asyncio.gather(*(
+        asyncio.to_thread(_load_project_summary, name, info)
+        for name, info in projects.items()
+    ))
+    result = [summary for summary in summaries if summary is not None]
+
+    # Unchanged since the last poll: reuse the encoded body
+    if _list_cache is None or _list_cache[0] != result:
+        body = orjson.dumps([summary.model_dump(mode="json") for summary in result])
+        _list_cache = (result, body)
+    return Response(content=_list_cache[1], media_type="application/json")
 
 
 @router.post("", response_model=ProjectSummary)
-async def create_project(project: ProjectCreate):
+def create_project(project: ProjectCreate):
     """Create a new project at the specified path."""
-    _init_imports()
-    assert _scaffold_project_prompts is not None  # guaranteed by _init_imports()
-    (register_project, _, get_project_path, list_registered_projects,
-     _, _, _, _) = _get_registry_functions()
-
     name = validate_project_name(project.name)
     project_path = Path(project.path).resolve()
 
@@ -172,38 +245,32 @@ async def create_project(project: ProjectCreate):
             detail=f"Project '{name}' already exists at {existing}"
         )
 
-    # Check if path already registered under a different name
-    all_projects = list_registered_projects()
-    for existing_name, info in all_projects.items():
-        existing_path = Path(info["path"]).resolve()
-        # Case-insensitive comparison on Windows
-        if sys.platform == "win32":
-            paths_match = str(existing_path).lower() == str(project_path).lower()
-        else:
-            paths_match = existing_path == project_path
-
-        if paths_match:
-            raise HTTPException(
-                status_code=409,
-                detail=f"Path '{project_path}' is already registered as project '{existing_name}'"
-            )
+    # Check if path already registered under a different name.
+    # Registry paths are stored resolved, so normalized string comparison
+    # suffices (normcase folds case and separators on Windows).
+    target = os.path.normcase(os.path.normpath(project_path))
+    by_norm = {
+        os.path.normcase(os.path.normpath(info["path"])): existing_name
+        for existing_name, info in list_registered_projects().items()
+    }
+    existing_name = by_norm.get(target)
+    if existing_name is not None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Path '{project_path}' is already registered as project '{existing_name}'"
+        )
 
     # Security: Check if path is in a blocked location
-    from .filesystem import is_path_blocked
     if is_path_blocked(project_path):
         raise HTTPException(
             status_code=403,
             detail="Cannot create project in system or sensitive directory"
         )
 
-    # Validate the path is usable
-    if project_path.exists():
-        if not project_path.is_dir():
-            raise HTTPException(
-                status_code=400,
-                detail="Path exists but is not a directory"
-            )
-    else:
+    # Validate the path is usable (one stat covers exists + is-dir)
+    try:
+        st = os.stat(project_path)
+    except FileNotFoundError:
         # Create the directory
         try:
             project_path.mkdir(parents=True, exist_ok=True)
@@ -212,9 +279,15 @@ async def create_project(project: ProjectCreate):
                 status_code=500,
                 detail=f"Failed to create directory: {e}"
             )
+    else:
+        if not stat.S_ISDIR(st.st_mode):
+            raise HTTPException(
+                status_code=400,
+                detail="Path exists but is not a directory"
+            )
 
     # Scaffold prompts
-    _scaffold_project_prompts(project_path)
+    _lazy.scaffold_project_prompts(project_path)
 
     # Register in registry
     try:
@@ -224,24 +297,20 @@ async def create_project(project: ProjectCreate):
             status_code=500,
             detail=f"Failed to register project: {e}"
         )
+    invalidate_project_path(name)
 
-    return ProjectSummary(
+    return ProjectSummary.model_construct(
         name=name,
         path=project_path.as_posix(),
         has_spec=False,  # Just created, no spec yet
-        stats=ProjectStats(passing=0, total=0, percentage=0.0),
+        stats=ProjectStats.model_construct(passing=0, total=0, percentage=0.0),
         default_concurrency=3,
     )
 
 
 @router.get("/{name}", response_model=ProjectDetail)
-async def get_project(name: str):
+def get_project(name: str):
     """Get detailed information about a project."""
-    _init_imports()
-    assert _check_spec_exists is not None  # guaranteed by _init_imports()
-    assert _get_project_prompts_dir is not None  # guaranteed by _init_imports()
-    (_, _, get_project_path, _, _, get_project_concurrency, _, _) = _get_registry_functions()
-
     name = validate_project_name(name)
     project_dir = get_project_path(name)
 
@@ -251,11 +320,11 @@ async def get_project(name: str):
     if not project_dir.exists():
         raise HTTPException(status_code=404, detail=f"Project directory no longer exists: {project_dir}")
 
-    has_spec = _check_spec_exists(project_dir)
+    has_spec = _lazy.check_spec_exists(project_dir)
     stats = get_project_stats(project_dir)
-    prompts_dir = _get_project_prompts_dir(project_dir)
+    prompts_dir = _lazy.get_project_prompts_dir(project_dir)
 
-    return ProjectDetail(
+    return ProjectDetail.model_construct(
         name=name,
         path=project_dir.as_posix(),
         has_spec=has_spec,
@@ -265,6 +334,14 @@ async def get_project(name: str):
     )
 
 
+def _move_dir(src: Path, dst: Path) -> None:
+    """Move a directory: a single rename on the same filesystem, copy+delete across devices."""
+    try:
+        os.rename(src, dst)
+    except OSError:
+        shutil.move(str(src), str(dst))
+
+
 @router.post("/{name}/rename", response_model=ProjectSummary)
 async def rename_project_endpoint(name: str, payload: ProjectRename):
     """
@@ -272,12 +349,6 @@ async def rename_project_endpoint(name: str, payload: ProjectRename):
 
     Moves the project directory and updates the registry and internal databases.
     """
-    _init_imports()
-    assert _check_spec_exists is not None
-    (register_project, _, get_project_path, list_registered_projects,
-     validate_project_path, get_project_concurrency, _,
-     rename_project) = _get_registry_functions()
-
     old_name = validate_project_name(name)
     new_name = validate_project_name(payload.new_name)
     
@@ -305,32 +376,31 @@ async def rename_project_endpoint(name: str, payload: ProjectRename):
         raise HTTPException(status_code=409, detail=f"Destination directory already exists: {new_path}")
 
     # 4. Check if agent is running
-    from xaheen_paths import has_agent_running
     if has_agent_running(old_path):
         raise HTTPException(
             status_code=409, detail="Cannot rename project while agent is running. Stop the agent first."
         )
 
     # 5. Dispose DB engines to unlock files (Windows compat)
-    from api.database import dispose_engine as dispose_features_engine, get_database_url
-    from server.services.assistant_database import dispose_engine as dispose_assistant_engine
-    
-    dispose_features_engine(old_path)
-    dispose_assistant_engine(old_path)
+    _lazy.dispose_features_engine(old_path)
+    _lazy.dispose_assistant_engine(old_path)
 
     # 6. Move directory
     try:
-        shutil.move(str(old_path), str(new_path))
+        await asyncio.to_thread(_move_dir, old_path, new_path)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to move project directory: {e}")
 
     # 7. Update Registry
     try:
         rename_project(old_name, new_name, new_path)
+        invalidate_project_path(old_name)
+        invalidate_project_path(new_name)
+        _invalidate_project_stats(old_path)
     except Exception as e:
         # Rollback move if registry update fails
         try:
-            shutil.move(str(new_path), str(old_path))
+            await asyncio.to_thread(_move_dir, new_path, old_path)
         except:
             pass # Critical failure if rollback fails
         raise HTTPException(status_code=500, detail=f"Failed to update registry: {e}")
@@ -338,36 +408,26 @@ async def rename_project_endpoint(name: str, payload: ProjectRename):
     # 8. Update Internal Databases
     # features.db -> schedules table -> project_name
     try:
-        from sqlalchemy import create_engine, text
-        
-        # Connect to DB at VALID NEW PATH
-        db_url = get_database_url(new_path)
-        engine = create_engine(db_url)
-        
-        with engine.connect() as conn:
-            # Update project_name in schedules table
-            # Check if table exists first? It should.
+        # A single UPDATE doesn't need a SQLAlchemy engine/pool; open the
+        # DB at the NEW path directly (mode=rw: never create a missing file)
+        db_uri = get_features_db_path(new_path).as_uri() + "?mode=rw"
+        with closing(sqlite3.connect(db_uri, uri=True, timeout=30)) as conn:
             conn.execute(
-                text("UPDATE schedules SET project_name = :new_name WHERE project_name = :old_name"),
-                {"new_name": new_name, "old_name": old_name}
+                "UPDATE schedules SET project_name = ? WHERE project_name = ?",
+                (new_name, old_name),
             )
             conn.commit()
-        
-        engine.dispose()
     except Exception as e:
         # Log warning but don't fail the request check - directory and registry are moved.
         # This is a minor consistency issue that can be fixed manually or auto-healed later.
-        print(f"Warning: Failed to update project_name in features.db: {e}", file=sys.stderr)
+        logger.warning("Failed to update project_name in features.db: %s", e)
 
     # 9. Return new summary
-    # Refresh imports for stats
-    _init_imports()
-    
     # We need to re-validate the new path exists (it should)
-    has_spec = _check_spec_exists(new_path)
+    has_spec = _lazy.check_spec_exists(new_path)
     stats = get_project_stats(new_path)
 
-    return ProjectSummary(
+    return ProjectSummary.model_construct(
         name=new_name,
         path=new_path.as_posix(),
         has_spec=has_spec,
@@ -385,9 +445,6 @@ async def delete_project(name: str, delete_files: bool = False):
         name: Project name to delete
         delete_files: If True, also delete the project directory and files
     """
-    _init_imports()
-    (_, unregister_project, get_project_path, _, _, _, _, _) = _get_registry_functions()
-
     name = validate_project_name(name)
     project_dir = get_project_path(name)
 
@@ -395,7 +452,6 @@ async def delete_project(name: str, delete_files: bool = False):
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
 
     # Check if agent is running
-    from xaheen_paths import has_agent_running
     if has_agent_running(project_dir):
         raise HTTPException(
             status_code=409,
@@ -405,12 +461,14 @@ async def delete_project(name: str, delete_files: bool = False):
     # Optionally delete files
     if delete_files and project_dir.exists():
         try:
-            shutil.rmtree(project_dir)
+            await asyncio.to_thread(shutil.rmtree, project_dir)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to delete project files: {e}")
 
     # Unregister from registry
     unregister_project(name)
+    invalidate_project_path(name)
+    _invalidate_project_stats(project_dir)
 
     return {
         "success": True,
@@ -419,90 +477,97 @@ async def delete_project(name: str, delete_files: bool = False):
 
 
 @router.get("/{name}/prompts", response_model=ProjectPrompts)
-async def get_project_prompts(name: str):
+async def get_project_prompts(project_dir: ProjectDirDep):
     """Get the content of project prompt files."""
-    _init_imports()
-    assert _get_project_prompts_dir is not None  # guaranteed by _init_imports()
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
 
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    prompts_dir: Path = _get_project_prompts_dir(project_dir)
+    prompts_dir: Path = _lazy.get_project_prompts_dir(project_dir)
 
     def read_file(filename: str) -> str:
-        filepath = prompts_dir / filename
-        if filepath.exists():
-            try:
-                return filepath.read_text(encoding="utf-8")
-            except Exception:
-                return ""
-        return ""
+        # Missing or unreadable files read as empty
+        try:
+            return (prompts_dir / filename).read_text(encoding="utf-8")
+        except Exception:
+            return ""
+
+    # Read the three files concurrently in worker threads
+    app_spec, initializer_prompt, coding_prompt = await asyncio.gather(
+        asyncio.to_thread(read_file, "app_spec.txt"),
+        asyncio.to_thread(read_file, "initializer_prompt.md"),
+        asyncio.to_thread(read_file, "coding_prompt.md"),
+    )
 
     return ProjectPrompts(
-        app_spec=read_file("app_spec.txt"),
-        initializer_prompt=read_file("initializer_prompt.md"),
-        coding_prompt=read_file("coding_prompt.md"),
+        app_spec=app_spec,
+        initializer_prompt=initializer_prompt,
+        coding_prompt=coding_prompt,
     )
 
 
 @router.put("/{name}/prompts")
-async def update_project_prompts(name: str, prompts: ProjectPromptsUpdate):
+async def update_project_prompts(project_dir: ProjectDirDep, prompts: ProjectPromptsUpdate):
     """Update project prompt files."""
-    _init_imports()
-    assert _get_project_prompts_dir is not None  # guaranteed by _init_imports()
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
 
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    prompts_dir = _get_project_prompts_dir(project_dir)
+    prompts_dir = _lazy.get_project_prompts_dir(project_dir)
     prompts_dir.mkdir(parents=True, exist_ok=True)
 
-    def write_file(filename: str, content: str | None):
-        if content is not None:
-            filepath = prompts_dir / filename
-            filepath.write_text(content, encoding="utf-8")
+    def write_file(filename: str, content: str):
+        filepath = prompts_dir / filename
+        filepath.write_text(content, encoding="utf-8")
 
-    write_file("app_spec.txt", prompts.app_spec)
-    write_file("initializer_prompt.md", prompts.initializer_prompt)
-    write_file("coding_prompt.md", prompts.coding_prompt)
+    updates = {
+        "app_spec.txt": prompts.app_spec,
+        "initializer_prompt.md": prompts.initializer_prompt,
+        "coding_prompt.md": prompts.coding_prompt,
+    }
+    await asyncio.gather(*(
+        asyncio.to_thread(write_file, filename, content)
+        for filename, content in updates.items()
+        if content is not None
+    ))
 
     return {"success": True, "message": "Prompts updated"}
 
 
 @router.get("/{name}/stats", response_model=ProjectStats)
-async def get_project_stats_endpoint(name: str):
+def get_project_stats_endpoint(project_dir: ProjectDirDep):
     """Get current progress statistics for a project."""
-    _init_imports()
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
 
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
+    return get_project_stats(project_dir)
 
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
 
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+@lru_cache(maxsize=128)
+def _reset_file_paths(project_dir: Path) -> tuple[Path, ...]:
+    """
+    Files removed by a project reset.
 
-    return get_project_stats(project_dir)
+    Path helpers give the current locations; the explicit root-level
+    entries are old-location fallbacks kept for backward compatibility.
+    """
+    db_path = get_features_db_path(project_dir)
+    asst_path = get_assistant_db_path(project_dir)
+    return (
+        db_path,
+        db_path.with_suffix(".db-wal"),
+        db_path.with_suffix(".db-shm"),
+        asst_path,
+        asst_path.with_suffix(".db-wal"),
+        asst_path.with_suffix(".db-shm"),
+        get_claude_settings_path(project_dir),
+        get_claude_assistant_settings_path(project_dir),
+        # Also clean old root-level locations if they exist
+        project_dir / "features.db",
+        project_dir / "features.db-wal",
+        project_dir / "features.db-shm",
+        project_dir / "assistant.db",
+        project_dir / "assistant.db-wal",
+        project_dir / "assistant.db-shm",
+        project_dir / ".claude_settings.json",
+        project_dir / ".claude_assistant_settings.json",
+    )
 
 
 @router.post("/{name}/reset")
-async def reset_project(name: str, full_reset: bool = False):
+async def reset_project(name: str, project_dir: ProjectDirDep, full_reset: bool = False):
     """
     Reset a project to its initial state.
 
@@ -513,20 +578,8 @@ async def reset_project(name: str, full_reset: bool = False):
     Returns:
         Dictionary with list of deleted files and reset type
     """
-    _init_imports()
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
 
     # Check if agent is running
-    from xaheen_paths import has_agent_running
     if has_agent_running(project_dir):
         raise HTTPException(
             status_code=409,
@@ -534,48 +587,25 @@ async def reset_project(name: str, full_reset: bool = False):
         )
 
     # Dispose of database engines to release file locks (required on Windows)
-    # Import here to avoid circular imports
-    from api.database import dispose_engine as dispose_features_engine
-    from server.services.assistant_database import dispose_engine as dispose_assistant_engine
-
-    dispose_features_engine(project_dir)
-    dispose_assistant_engine(project_dir)
+    _lazy.dispose_features_engine(project_dir)
+    _lazy.dispose_assistant_engine(project_dir)
+    _invalidate_project_stats(project_dir)
 
     deleted_files: list[str] = []
+    reset_files = _reset_file_paths(project_dir)
+    # Prompts may live in either location (full reset only)
+    prompts_dirs = (get_prompts_dir(project_dir), project_dir / "prompts") if full_reset else ()
 
-    from xaheen_paths import (
-        get_assistant_db_path,
-        get_claude_assistant_settings_path,
-        get_claude_settings_path,
-        get_features_db_path,
-    )
-
-    # Build list of files to delete using path helpers (finds files at current location)
-    # Plus explicit old-location fallbacks for backward compatibility
-    db_path = get_features_db_path(project_dir)
-    asst_path = get_assistant_db_path(project_dir)
-    reset_files: list[Path] = [
-        db_path,
-        db_path.with_suffix(".db-wal"),
-        db_path.with_suffix(".db-shm"),
-        asst_path,
-        asst_path.with_suffix(".db-wal"),
-        asst_path.with_suffix(".db-shm"),
-        get_claude_settings_path(project_dir),
-        get_claude_assistant_settings_path(project_dir),
-        # Also clean old root-level locations if they exist
-        project_dir / "features.db",
-        project_dir / "features.db-wal",
-        project_dir / "features.db-shm",
-        project_dir / "assistant.db",
-        project_dir / "assistant.db-wal",
-        project_dir / "assistant.db-shm",
-        project_dir / ".claude_settings.json",
-        project_dir / ".claude_assistant_settings.json",
-    ]
+    # One directory listing per parent instead of a stat per candidate path
+    present: dict[Path, set[str]] = {}
+    for parent in {path.parent for path in (*reset_files, *prompts_dirs)}:
+        try:
+            present[parent] = set(os.listdir(parent))
+        except OSError:
+            present[parent] = set()
 
     for file_path in reset_files:
-        if file_path.exists():
+        if file_path.name in present[file_path.parent]:
             try:
                 relative = file_path.relative_to(project_dir)
                 file_path.unlink()
@@ -583,18 +613,15 @@ async def reset_project(name: str, full_reset: bool = False):
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Failed to delete {file_path.name}: {e}")
 
-    # Full reset: also delete prompts directory
-    if full_reset:
-        from xaheen_paths import get_prompts_dir
-        # Delete prompts from both possible locations
-        for prompts_dir in [get_prompts_dir(project_dir), project_dir / "prompts"]:
-            if prompts_dir.exists():
-                try:
-                    relative = prompts_dir.relative_to(project_dir)
-                    shutil.rmtree(prompts_dir)
-                    deleted_files.append(f"{relative}/")
-                except Exception as e:
-                    raise HTTPException(status_code=500, detail=f"Failed to delete prompts: {e}")
+    # Full reset: also delete prompts directory from both possible locations
+    for prompts_dir in prompts_dirs:
+        if prompts_dir.name in present[prompts_dir.parent]:
+            try:
+                relative = prompts_dir.relative_to(project_dir)
+                await asyncio.to_thread(shutil.rmtree, prompts_dir)
+                deleted_files.append(f"{relative}/")
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Failed to delete prompts: {e}")
 
     return {
         "success": True,
@@ -605,22 +632,8 @@ async def reset_project(name: str, full_reset: bool = False):
 
 
 @router.patch("/{name}/settings", response_model=ProjectDetail)
-async def update_project_settings(name: str, settings: ProjectSettingsUpdate):
+def update_project_settings(name: str, project_dir: ProjectDirDep, settings: ProjectSettingsUpdate):
     """Update project-level settings (concurrency, etc.)."""
-    _init_imports()
-    assert _check_spec_exists is not None  # guaranteed by _init_imports()
-    assert _get_project_prompts_dir is not None  # guaranteed by _init_imports()
-    (_, _, get_project_path, _, _, get_project_concurrency,
-     set_project_concurrency, _) = _get_registry_functions()
-
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
 
     # Update concurrency if provided
     if settings.default_concurrency is not None:
@@ -629,11 +642,11 @@ async def update_project_settings(name: str, settings: ProjectSettingsUpdate):
             raise HTTPException(status_code=500, detail="Failed to update concurrency")
 
     # Return updated project details
-    has_spec = _check_spec_exists(project_dir)
+    has_spec = _lazy.check_spec_exists(project_dir)
     stats = get_project_stats(project_dir)
-    prompts_dir = _get_project_prompts_dir(project_dir)
+    prompts_dir = _lazy.get_project_prompts_dir(project_dir)
 
-    return ProjectDetail(
+    return ProjectDetail.model_construct(
         name=name,
         path=project_dir.as_posix(),
         has_spec=has_spec,
@@ -644,7 +657,7 @@ async def update_project_settings(name: str, settings: ProjectSettingsUpdate):
 
 
 @router.post("/{name}/initialize-convex")
-async def initialize_convex(name: str):
+async def initialize_convex(name: str, project_dir: ProjectDirDep):
     """
     Initialize Convex backend for a project.
     
@@ -655,20 +668,7 @@ async def initialize_convex(name: str):
     
     Returns deployment information including the Convex URL.
     """
-    _init_imports()
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
     # Check if already initialized
-    from server.services.convex_init import check_convex_initialized, initialize_convex_for_project, ConvexInitError
     
     if await check_convex_initialized(project_dir):
         raise HTTPException(
@@ -697,78 +697,58 @@ async def initialize_convex(name: str):
 # ============================================================================
 
 @router.get("/{name}/context")
-async def get_project_context(name: str):
+def get_project_context(project_dir: ProjectDirDep, request: Request, response: Response):
     """Get all project context data (notes, analysis, config)."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
-    from ..services.context_manager import ContextManager
     context_mgr = ContextManager(project_dir)
     
+    etag = file_etag("context", context_mgr.notes_file, context_mgr.analysis_file, context_mgr.config_file)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
     return context_mgr.get_all_context()
 
 
 @router.put("/{name}/context/notes")
-async def update_project_notes(name: str, body: ProjectContextNotes):
+def update_project_notes(project_dir: ProjectDirDep, body: ProjectContextNotes):
     """Update project notes."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
-    from ..services.context_manager import ContextManager
     context_mgr = ContextManager(project_dir)
     context_mgr.save_notes(body.notes)
     
     return {"success": True, "message": "Notes updated"}
 
 
+# Upper bound on the AI insights call. The worker thread can't be killed, but
+# the request stops waiting and returns 504.
+_AI_INSIGHTS_TIMEOUT = 180  # seconds
+
+
 @router.post("/{name}/context/analyze")
-async def analyze_project_codebase(name: str):
+async def analyze_project_codebase(name: str, project_dir: ProjectDirDep):
     """Run codebase analysis and generate AI summary."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
     try:
-        from ..services.context_manager import ContextManager
-        from ..services.ai_assistant import AIAssistant
-        
-        print("🔍 Starting codebase analysis...")
+        logger.info("Starting codebase analysis for %s", name)
         
-        # Run codebase analysis
+        # Run codebase analysis (file-tree walk) off the event loop
         context_mgr = ContextManager(project_dir)
-        analysis = context_mgr.analyze_codebase()
+        analysis = await asyncio.to_thread(context_mgr.analyze_codebase)
         
-        print(f"✅ Analysis complete: {analysis.get('total_files', 0)} files, {len(analysis.get('languages', {}))} languages")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Analysis complete: %s files, %s languages",
+                analysis.get('total_files', 0), len(analysis.get('languages', {})),
+            )
         
         # Generate AI insights
-        print("🤖 Generating AI insights...")
+        logger.info("Generating AI insights for %s", name)
         ai = AIAssistant(use_mock=False)
-        insights = ai.analyze_codebase(analysis)
+        async with LLM_SEMAPHORE:
+            insights = await asyncio.wait_for(
+                asyncio.to_thread(ai.analyze_codebase, analysis),
+                timeout=_AI_INSIGHTS_TIMEOUT,
+            )
         
-        print(f"✅ AI insights generated")
+        logger.info("AI insights generated for %s", name)
         
         # Combine analysis and insights
         result = {
@@ -777,29 +757,18 @@ async def analyze_project_codebase(name: str):
         }
         
         return {"success": True, "analysis": result}
+    except asyncio.TimeoutError:
+        logger.warning("AI insights for %s timed out after %ss", name, _AI_INSIGHTS_TIMEOUT)
+        raise HTTPException(status_code=504, detail="Timed out generating AI insights")
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"❌ Error analyzing codebase: {str(e)}")
-        print(error_details)
+        # Traceback is formatted by the logging handler, only when emitted
+        logger.exception("Error analyzing codebase for %s", name)
         raise HTTPException(status_code=500, detail=f"Error analyzing codebase: {str(e)}")
 
 
 @router.put("/{name}/context/config")
-async def update_context_config(name: str, body: ProjectContextConfig):
+def update_context_config(project_dir: ProjectDirDep, body: ProjectContextConfig):
     """Update context configuration."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
-    from ..services.context_manager import ContextManager
     context_mgr = ContextManager(project_dir)
     
     # Only update fields that were provided
@@ -813,101 +782,49 @@ async def update_context_config(name: str, body: ProjectContextConfig):
 # ============================================================================
 
 @router.post("/{name}/ideation/generate")
-async def generate_ideas(name: str):
+async def generate_ideas(project_dir: ProjectDirDep):
     """
     Generate AI-powered improvement ideas for the project.
     Uses comprehensive context including README, dependencies, and git history.
     """
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
+    # Get comprehensive context for better AI generation
+    context_mgr = ContextManager(project_dir)
+    context = await asyncio.to_thread(context_mgr.get_comprehensive_context)
     
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
+    # Generate ideas using AI (REAL AI, not mock!)
+    ai = AIAssistant(use_mock=False)
+    async with LLM_SEMAPHORE:
+        ideas = await asyncio.to_thread(ai.generate_ideas, context)
     
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
+    # Save generated ideas to file: one read and one write for the whole batch
+    ideation_mgr = IdeationManager(project_dir)
+    saved_count = await asyncio.to_thread(ideation_mgr.save_ideas, ideas)
     
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    logger.debug("Generated %d ideas, saved %d to %s", len(ideas), saved_count, ideation_mgr.ideas_file)
     
-    try:
-        from ..services.context_manager import ContextManager
-        from ..services.ai_assistant import AIAssistant
-        from ..services.ideation import IdeationManager
-        
-        # Get comprehensive context for better AI generation
-        context_mgr = ContextManager(project_dir)
-        context = context_mgr.get_comprehensive_context()
-        
-        # Generate ideas using AI (REAL AI, not mock!)
-        ai = AIAssistant(use_mock=False)
-        ideas = ai.generate_ideas(context)
-        
-        print(f"🔍 Generated {len(ideas)} ideas, now saving...")
-        
-        # Save generated ideas to file
-        ideation_mgr = IdeationManager(project_dir)
-        saved_count = 0
-        for i, idea in enumerate(ideas):
-            success = ideation_mgr.save_idea(idea)
-            if success:
-                saved_count += 1
-            else:
-                print(f"⚠️  Failed to save idea {i+1}: {idea.get('title', 'Unknown')}")
-        
-        print(f"✅ Generated {len(ideas)} ideas, saved {saved_count} to {ideation_mgr.ideas_file}")
-        
-        return {"success": True, "ideas": ideas}
-    except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"❌ Error generating ideas: {str(e)}")
-        print(error_details)
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Failed to generate ideas: {str(e)}"
-        )
+    return {"success": True, "ideas": ideas}
 
 
 @router.get("/{name}/ideation/ideas")
-async def get_saved_ideas(name: str):
+def get_saved_ideas(project_dir: ProjectDirDep, request: Request, response: Response):
     """Get all saved ideas."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    ideation_mgr = IdeationManager(project_dir)
     
-    from ..services.ideation import IdeationManager
+    etag = file_etag("ideas", ideation_mgr.ideas_file)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
-    ideation_mgr = IdeationManager(project_dir)
     ideas = ideation_mgr.get_saved_ideas()
     
     return {"ideas": ideas}
 
 
 @router.post("/{name}/ideation/ideas")
-async def save_idea(name: str, body: IdeaSave):
+def save_idea(project_dir: ProjectDirDep, body: IdeaSave):
     """Save an idea."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
-    from ..services.ideation import IdeationManager
-    
     ideation_mgr = IdeationManager(project_dir)
-    success = ideation_mgr.save_idea(body.idea.model_dump())
+    success = ideation_mgr.save_idea(_dump_idea(body.idea))
     
     if not success:
         raise HTTPException(status_code=500, detail="Failed to save idea")
@@ -916,21 +833,8 @@ async def save_idea(name: str, body: IdeaSave):
 
 
 @router.delete("/{name}/ideation/ideas/{idea_id}")
-async def delete_idea(name: str, idea_id: str):
+def delete_idea(project_dir: ProjectDirDep, idea_id: str):
     """Delete a saved idea."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
-    from ..services.ideation import IdeationManager
-    
     ideation_mgr = IdeationManager(project_dir)
     success = ideation_mgr.delete_idea(idea_id)
     
@@ -941,22 +845,15 @@ async def delete_idea(name: str, idea_id: str):
 
 
 @router.get("/{name}/ideation/stats")
-async def get_idea_stats(name: str):
+def get_idea_stats(project_dir: ProjectDirDep, request: Request, response: Response):
     """Get idea statistics."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    ideation_mgr = IdeationManager(project_dir)
     
-    from ..services.ideation import IdeationManager
+    etag = file_etag("idea-stats", ideation_mgr.ideas_file)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
-    ideation_mgr = IdeationManager(project_dir)
     stats = ideation_mgr.get_idea_stats()
     
     return stats
@@ -967,92 +864,48 @@ async def get_idea_stats(name: str):
 # ============================================================================
 
 @router.post("/{name}/roadmap/generate")
-async def generate_roadmap(name: str):
+async def generate_roadmap(project_dir: ProjectDirDep):
     """
     Generate AI-powered roadmap for the project.
     Uses comprehensive context including README, dependencies, and git history.
     """
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
+    # Get comprehensive context for better AI generation
+    context_mgr = ContextManager(project_dir)
+    context = await asyncio.to_thread(context_mgr.get_comprehensive_context)
     
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
+    # Add timeframe (default to 6 months)
+    context['timeframe'] = '6_months'
     
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
+    # Generate roadmap using AI (REAL AI, not mock!)
+    ai = AIAssistant(use_mock=False)
+    async with LLM_SEMAPHORE:
+        roadmap = await asyncio.to_thread(ai.generate_roadmap, context)
     
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    # Save roadmap
+    roadmap_mgr = RoadmapManager(project_dir)
+    await asyncio.to_thread(roadmap_mgr.save_roadmap, roadmap)
     
-    try:
-        from ..services.context_manager import ContextManager
-        from ..services.ai_assistant import AIAssistant
-        from ..services.roadmap import RoadmapManager
-        
-        # Get comprehensive context for better AI generation
-        context_mgr = ContextManager(project_dir)
-        context = context_mgr.get_comprehensive_context()
-        
-        # Add timeframe (default to 6 months)
-        context['timeframe'] = '6_months'
-        
-        # Generate roadmap using AI (REAL AI, not mock!)
-        ai = AIAssistant(use_mock=False)
-        roadmap = ai.generate_roadmap(context)
-        
-        # Save roadmap
-        roadmap_mgr = RoadmapManager(project_dir)
-        roadmap_mgr.save_roadmap(roadmap)
-        
-        return {"success": True, "roadmap": roadmap}
-    except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"❌ Error generating roadmap: {str(e)}")
-        print(error_details)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to generate roadmap: {str(e)}"
-        )
+    return {"success": True, "roadmap": roadmap}
 
 
 @router.get("/{name}/roadmap")
-async def get_roadmap(name: str):
+def get_roadmap(project_dir: ProjectDirDep, request: Request, response: Response):
     """Get current roadmap."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    roadmap_mgr = RoadmapManager(project_dir)
     
-    from ..services.roadmap import RoadmapManager
+    etag = file_etag("roadmap", roadmap_mgr.roadmap_file)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
-    roadmap_mgr = RoadmapManager(project_dir)
     roadmap = roadmap_mgr.get_roadmap()
     
     return roadmap
 
 
 @router.put("/{name}/roadmap/features/{feature_id}/status")
-async def update_feature_status(name: str, feature_id: str, body: FeatureStatusUpdate):
+def update_feature_status(project_dir: ProjectDirDep, feature_id: str, body: FeatureStatusUpdate):
     """Update feature status."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
-    from ..services.roadmap import RoadmapManager
-    
     roadmap_mgr = RoadmapManager(project_dir)
     success = roadmap_mgr.update_feature_status(feature_id, body.status)
     
@@ -1063,23 +916,10 @@ async def update_feature_status(name: str, feature_id: str, body: FeatureStatusU
 
 
 @router.put("/{name}/roadmap/features/{feature_id}")
-async def update_feature(name: str, feature_id: str, body: FeatureUpdate):
+def update_feature(project_dir: ProjectDirDep, feature_id: str, body: RoadmapFeatureUpdate):
     """Update feature details."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
-    from ..services.roadmap import RoadmapManager
-    
     roadmap_mgr = RoadmapManager(project_dir)
-    updates = body.model_dump(exclude_none=True)
+    updates = _dump_feature_update(body, exclude_none=True)
     success = roadmap_mgr.update_feature(feature_id, updates)
     
     if not success:
@@ -1088,48 +928,36 @@ async def update_feature(name: str, feature_id: str, body: FeatureUpdate):
     return {"success": True, "message": "Feature updated"}
 
 
+_EXPORT_MEDIA_TYPES = {
+    'markdown': 'text/markdown; charset=utf-8',
+    'json': 'application/json',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
 @router.get("/{name}/roadmap/export")
-async def export_roadmap(name: str, format: str = 'markdown'):
+def export_roadmap(project_dir: ProjectDirDep, format: str = 'markdown'):
     """Export roadmap in specified format."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-    
-    from ..services.roadmap import RoadmapManager
-    
     roadmap_mgr = RoadmapManager(project_dir)
     
     try:
-        exported = roadmap_mgr.export_roadmap(format)
-        return {"success": True, "format": format, "content": exported}
+        chunks = roadmap_mgr.iter_export(format)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    
+    return StreamingResponse(chunks, media_type=_EXPORT_MEDIA_TYPES[format])
 
 
 @router.get("/{name}/roadmap/stats")
-async def get_roadmap_stats(name: str):
+def get_roadmap_stats(project_dir: ProjectDirDep, request: Request, response: Response):
     """Get roadmap statistics."""
-    (_, _, get_project_path, _, _, _, _, _) = _get_registry_functions()
-    
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-    
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    roadmap_mgr = RoadmapManager(project_dir)
     
-    from ..services.roadmap import RoadmapManager
+    etag = file_etag("roadmap-stats", roadmap_mgr.roadmap_file)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
-    roadmap_mgr = RoadmapManager(project_dir)
     stats = roadmap_mgr.get_roadmap_stats()
     
     return stats
@@ -1140,12 +968,9 @@ async def get_roadmap_stats(name: str):
 # ============================================================================
 
 @router.get("/{name}/metadata/ideation")
-async def get_ideation(name: str):
+def get_ideation(name: str, backend: BackendDep):
     """Get project ideation notes."""
-    from ..services.backend.factory import BackendFactory
-    
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
     try:
         content = backend.get_ideation(name)
@@ -1155,12 +980,9 @@ async def get_ideation(name: str):
 
 
 @router.put("/{name}/metadata/ideation")
-async def update_ideation(name: str, body: dict):
+def update_ideation(name: str, body: dict, backend: BackendDep):
     """Update project ideation notes."""
-    from ..services.backend.factory import BackendFactory
-    
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
     content = body.get("content", "")
     
@@ -1172,12 +994,9 @@ async def update_ideation(name: str, body: dict):
 
 
 @router.get("/{name}/metadata/context")
-async def get_context(name: str):
+def get_context(name: str, backend: BackendDep):
     """Get project context metadata."""
-    from ..services.backend.factory import BackendFactory
-    
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
     try:
         context = backend.get_context(name)
@@ -1187,12 +1006,9 @@ async def get_context(name: str):
 
 
 @router.put("/{name}/metadata/context")
-async def update_context(name: str, body: dict):
+def update_context(name: str, body: dict, backend: BackendDep):
     """Update project context metadata."""
-    from ..services.backend.factory import BackendFactory
-    
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
     try:
         updated = backend.update_context(name, body)
@@ -1202,12 +1018,9 @@ async def update_context(name: str, body: dict):
 
 
 @router.get("/{name}/metadata/knowledge")
-async def list_knowledge(name: str):
+def list_knowledge(name: str, backend: BackendDep):
     """List all knowledge base items."""
-    from ..services.backend.factory import BackendFactory
-    
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
     try:
         items = backend.list_knowledge_items(name)
@@ -1217,18 +1030,28 @@ async def list_knowledge(name: str):
 
 
 @router.get("/{name}/metadata/knowledge/{filename}")
-async def get_knowledge_item(name: str, filename: str):
-    """Get a specific knowledge base item."""
-    from ..services.backend.factory import BackendFactory
+def get_knowledge_item(name: str, filename: str, request: Request, backend: BackendDep):
+    """
+    Get a specific knowledge base item.
     
+    Clients that accept text/markdown get the raw file, sent without
+    buffering it; everyone else gets {"filename", "content"} JSON.
+    """
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
-    # Validate filename (security)
-    if not re.match(r'^[a-zA-Z0-9_-]+\.md$', filename):
-        raise HTTPException(status_code=400, detail="Invalid filename")
+    filename = validate_knowledge_filename(filename)
     
     try:
+        if "text/markdown" in request.headers.get("accept", ""):
+            path = backend.get_knowledge_item_path(name, filename)
+            if path is not None:
+                return FileResponse(
+                    path,
+                    media_type="text/markdown; charset=utf-8",
+                    filename=filename,
+                    content_disposition_type="inline",
+                )
+        
         content = backend.get_knowledge_item(name, filename)
         if not content:
             raise HTTPException(status_code=404, detail="Knowledge item not found")
@@ -1240,16 +1063,11 @@ async def get_knowledge_item(name: str, filename: str):
 
 
 @router.put("/{name}/metadata/knowledge/{filename}")
-async def save_knowledge_item(name: str, filename: str, body: dict):
+def save_knowledge_item(name: str, filename: str, body: dict, backend: BackendDep):
     """Save a knowledge base item."""
-    from ..services.backend.factory import BackendFactory
-    
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
-    # Validate filename (security)
-    if not re.match(r'^[a-zA-Z0-9_-]+\.md$', filename):
-        raise HTTPException(status_code=400, detail="Invalid filename")
+    filename = validate_knowledge_filename(filename)
     
     content = body.get("content", "")
     
@@ -1261,16 +1079,11 @@ async def save_knowledge_item(name: str, filename: str, body: dict):
 
 
 @router.delete("/{name}/metadata/knowledge/{filename}")
-async def delete_knowledge_item(name: str, filename: str):
+def delete_knowledge_item(name: str, filename: str, backend: BackendDep):
     """Delete a knowledge base item."""
-    from ..services.backend.factory import BackendFactory
-    
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
-    # Validate filename (security)
-    if not re.match(r'^[a-zA-Z0-9_-]+\.md$', filename):
-        raise HTTPException(status_code=400, detail="Invalid filename")
+    filename = validate_knowledge_filename(filename)
     
     try:
         success = backend.delete_knowledge_item(name, filename)
@@ -1284,12 +1097,9 @@ async def delete_knowledge_item(name: str, filename: str):
 
 
 @router.get("/{name}/metadata/roadmap")
-async def get_roadmap_metadata(name: str):
+def get_roadmap_metadata(name: str, backend: BackendDep):
     """Get project roadmap metadata."""
-    from ..services.backend.factory import BackendFactory
-    
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
     try:
         roadmap = backend.get_roadmap(name)
@@ -1299,12 +1109,9 @@ async def get_roadmap_metadata(name: str):
 
 
 @router.put("/{name}/metadata/roadmap")
-async def update_roadmap_metadata(name: str, body: dict):
+def update_roadmap_metadata(name: str, body: dict, backend: BackendDep):
     """Update project roadmap metadata."""
-    from ..services.backend.factory import BackendFactory
-    
     name = validate_project_name(name)
-    backend = BackendFactory.get_backend()
     
     try:
         updated = backend.update_roadmap(name, body)
@@ -6,6 +6,7 @@ API endpoints for managing automated agent schedules.
 Delegates persistence to Pluggable Backend Architecture.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
@@ -24,7 +25,7 @@ except ImportError:
         def get_job(self, *args): return None
     agent_scheduler = MockScheduler()
 
-from server.services.backend.factory import BackendFactory
+from server.services.backend.factory import BackendDep
 from server.schemas import (
     ScheduleCreate,
     ScheduleResponse,
@@ -48,33 +49,44 @@ def _handle_backend_error(e: Exception):
     raise HTTPException(status_code=500, detail=f"Internal error: {msg}")
 
 
+def _reschedule(project_name: str, schedule: ScheduleResponse) -> None:
+    """Replace the scheduler job for schedule, dropping it if disabled."""
+    agent_scheduler.remove_project_schedule(schedule.id)
+    if schedule.enabled:
+        agent_scheduler.add_project_schedule(
+            project_name,
+            schedule.id,
+            schedule.start_time,
+            schedule.days_of_week
+        )
+
+
 @router.get("", response_model=list[ScheduleResponse])
-async def list_schedules(project_name: str):
+def list_schedules(project_name: str, backend: BackendDep):
     """List all schedules for a project."""
     try:
-        backend = BackendFactory.get_backend()
         return backend.list_schedules(project_name)
     except Exception as e:
         _handle_backend_error(e)
 
 
 @router.post("", response_model=ScheduleResponse)
-async def create_schedule(project_name: str, schedule: ScheduleCreate):
+async def create_schedule(project_name: str, schedule: ScheduleCreate, backend: BackendDep):
     """Create a new schedule."""
     try:
-        backend = BackendFactory.get_backend()
         
         # persistence
-        created_schedule = backend.create_schedule(project_name, schedule)
+        created_schedule = await asyncio.to_thread(backend.create_schedule, project_name, schedule)
 
         # Side effect: Add to scheduler
         if created_schedule.enabled:
             try:
-                agent_scheduler.add_project_schedule(
-                   project_name,
-                   created_schedule.id,
-                   created_schedule.start_time,
-                   created_schedule.days_of_week
+                await asyncio.to_thread(
+                    agent_scheduler.add_project_schedule,
+                    project_name,
+                    created_schedule.id,
+                    created_schedule.start_time,
+                    created_schedule.days_of_week,
                 )
             except Exception as e:
                 logger.error(f"Failed to schedule job for {created_schedule.id}: {e}")
@@ -85,10 +97,9 @@ async def create_schedule(project_name: str, schedule: ScheduleCreate):
 
 
 @router.get("/{schedule_id}", response_model=ScheduleResponse)
-async def get_schedule(project_name: str, schedule_id: int):
+def get_schedule(project_name: str, schedule_id: int, backend: BackendDep):
     """Get a specific schedule."""
     try:
-        backend = BackendFactory.get_backend()
         schedule = backend.get_schedule(project_name, schedule_id)
         if not schedule:
             raise HTTPException(status_code=404, detail=f"Schedule {schedule_id} not found")
@@ -100,45 +111,36 @@ async def get_schedule(project_name: str, schedule_id: int):
 
 
 @router.patch("/{schedule_id}", response_model=ScheduleResponse)
-async def update_schedule(project_name: str, schedule_id: int, update: ScheduleUpdate):
+async def update_schedule(project_name: str, schedule_id: int, update: ScheduleUpdate, backend: BackendDep):
     """
     Update a schedule.
     Restart scheduler job if meaningful fields changed.
     """
     try:
-        backend = BackendFactory.get_backend()
         
         # Update persistence
-        updated_schedule = backend.update_schedule(project_name, schedule_id, update)
-        
-        # Side effect: Update scheduler
-        agent_scheduler.remove_project_schedule(updated_schedule.id)
-        
-        if updated_schedule.enabled:
-            agent_scheduler.add_project_schedule(
-                project_name,
-                updated_schedule.id,
-                updated_schedule.start_time,
-                updated_schedule.days_of_week
-            )
-            
+        updated_schedule = await asyncio.to_thread(backend.update_schedule, project_name, schedule_id, update)
+
+        # Side effect: Update scheduler. Remove and re-add target the same
+        # job id, so they run in order within one worker thread.
+        await asyncio.to_thread(_reschedule, project_name, updated_schedule)
+
         return updated_schedule
     except Exception as e:
         _handle_backend_error(e)
 
 
 @router.delete("/{schedule_id}")
-async def delete_schedule(project_name: str, schedule_id: int):
+async def delete_schedule(project_name: str, schedule_id: int, backend: BackendDep):
     """Delete a schedule."""
     try:
-        backend = BackendFactory.get_backend()
         
-        success = backend.delete_schedule(project_name, schedule_id)
+        success = await asyncio.to_thread(backend.delete_schedule, project_name, schedule_id)
         if not success:
              raise HTTPException(status_code=404, detail="Schedule not found")
 
         # Side effect: Remove from scheduler
-        agent_scheduler.remove_project_schedule(schedule_id)
+        await asyncio.to_thread(agent_scheduler.remove_project_schedule, schedule_id)
 
         return {"success": True, "message": "Schedule deleted"}
     except HTTPException:
@@ -148,14 +150,13 @@ async def delete_schedule(project_name: str, schedule_id: int):
 
 
 @router.get("/{schedule_id}/next-run")
-async def get_next_run(project_name: str, schedule_id: int):
+async def get_next_run(project_name: str, schedule_id: int, backend: BackendDep):
     """
     Calculate the next scheduled run time.
     """
     try:
         # Check existence via backend first
-        backend = BackendFactory.get_backend()
-        schedule = backend.get_schedule(project_name, schedule_id)
+        schedule = await asyncio.to_thread(backend.get_schedule, project_name, schedule_id)
         if not schedule:
             raise HTTPException(status_code=404, detail="Schedule not found")
             
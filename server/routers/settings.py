@@ -13,6 +13,7 @@ import sys
 from fastapi import APIRouter
 
 from ..schemas import ModelInfo, ModelsResponse, ProviderInfo, ProvidersResponse, SettingsResponse, SettingsUpdate
+from ..services.ai_assistant import AIAssistant
 from ..services.chat_constants import ROOT_DIR
 
 # Mimetype fix for Windows - must run before StaticFiles is mounted
@@ -168,6 +169,9 @@ async def update_settings(update: SettingsUpdate):
     if update.github_token is not None:
         set_setting("github_token", update.github_token)
 
+    # AI generation caches the provider settings changed above
+    AIAssistant.reload_config()
+
     # Return updated settings
     all_settings = get_all_settings()
     api_provider = all_settings.get("api_provider", "claude")
@@ -181,6 +181,24 @@ class DependencyUpdate(BaseModel):
     dependency_ids: list[int] = Field(..., max_length=20)  # Security: limit
 
 
+class DependencyBulkOp(BaseModel):
+    """A single dependency edge change within a bulk update."""
+    feature_id: int
+    dep_id: int
+    op: Literal["add", "remove"]
+
+
+class DependencyBulkUpdate(BaseModel):
+    """Request schema for applying many dependency edge changes at once."""
+    ops: list[DependencyBulkOp] = Field(..., max_length=500)  # Security: limit
+
+
+class DependencyBulkResponse(BaseModel):
+    """Response for a bulk dependency update."""
+    success: bool
+    dependencies: dict[int, list[int]]  # feature_id -> updated dependency list
+
+
 # ============================================================================
 # Agent Schemas
 # ============================================================================
@@ -736,7 +754,7 @@ class RoadmapFeature(BaseModel):
     priority: int
     effort: str  # 'small', 'medium', 'large'
     status: str = 'planned'  # 'planned', 'in-progress', 'completed'
-    dependencies: List[str] = []
+    dependencies: list[str] = []
     milestone: str
     estimated_days: int
     created_at: str | None = None
@@ -753,8 +771,8 @@ class RoadmapMilestone(BaseModel):
 
 class Roadmap(BaseModel):
     """Full roadmap."""
-    features: List[RoadmapFeature]
-    milestones: List[RoadmapMilestone]
+    features: list[RoadmapFeature]
+    milestones: list[RoadmapMilestone]
     generated_at: str | None = None
     updated_at: str | None = None
     total_estimated_days: int = 0
@@ -765,8 +783,8 @@ class FeatureStatusUpdate(BaseModel):
     status: str  # 'planned', 'in-progress', 'completed'
 
 
-class FeatureUpdate(BaseModel):
-    """Request schema for updating feature details."""
+class RoadmapFeatureUpdate(BaseModel):
+    """Request schema for updating roadmap feature details."""
     title: str | None = None
     description: str | None = None
     priority: int | None = None
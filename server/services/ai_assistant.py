@@ -7,18 +7,429 @@ Now uses REAL AI providers (Anthropic Claude) instead of mock responses.
 """
 
 from typing import Any, Dict, List, Optional, Callable
+import base64
+import hashlib
+import http.client
+import logging
 import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from itertools import islice
 from datetime import datetime, UTC
 from pathlib import Path
-import json
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
 import sys
 
+import orjson
+
 # Add root to path for registry import
 ROOT_DIR = Path(__file__).parent.parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from registry import get_setting, get_effective_sdk_env
+from registry import get_config_dir, get_setting, get_effective_sdk_env
+
+logger = logging.getLogger(__name__)
+
+# Markdown code block around a JSON payload: ```json\n{...}\n``` or ```\n{...}\n```
+_FENCE_RE = re.compile(r'```(?:json)?\s*\n?(.*?)\n?```', re.DOTALL)
+
+# With XAHEEN_AI_CACHE=1, responses to identical AI requests are reused from
+# ~/.xaheen/ai_cache.db for this long. Off by default: a user who clicks
+# "Generate" again expects a fresh generation, not the previous one replayed.
+# XAHEEN_AI_NOCACHE=1 turns the cache off even when XAHEEN_AI_CACHE is set.
+_AI_CACHE_TTL = 7 * 86400  # seconds
+
+_TRUTHY = ("1", "true", "yes")
+
+
+def _ai_cache_enabled() -> bool:
+    return (
+        os.environ.get("XAHEEN_AI_CACHE", "").lower() in _TRUTHY
+        and os.environ.get("XAHEEN_AI_NOCACHE", "").lower() not in _TRUTHY
+    )
+
+
+def _ai_cache_key(*parts: Any) -> str:
+    """SHA-256 over the request fields that determine the response."""
+    return hashlib.sha256(orjson.dumps(parts)).hexdigest()
+
+
+def _ai_cache_connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(get_config_dir() / "ai_cache.db", timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS ai_cache "
+        "(key TEXT PRIMARY KEY, text TEXT NOT NULL, expires_at REAL NOT NULL)"
+    )
+    return conn
+
+
+def _ai_cache_get(key: str) -> Optional[str]:
+    """Return the cached response text for key, or None on a miss or error."""
+    try:
+        with closing(_ai_cache_connect()) as conn:
+            row = conn.execute(
+                "SELECT text FROM ai_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def _ai_cache_set(key: str, text: str) -> None:
+    """Store a response and drop expired ones; failures only cost the cache."""
+    now = time.time()
+    try:
+        with closing(_ai_cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, text, expires_at) VALUES (?, ?, ?)",
+                (key, text, now + _AI_CACHE_TTL),
+            )
+            conn.execute("DELETE FROM ai_cache WHERE expires_at <= ?", (now,))
+    except sqlite3.Error:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _sdk_env_snapshot() -> Dict[str, str]:
+    """API provider environment, read from the registry once until reload_config()."""
+    return get_effective_sdk_env()
+
+
+# Idle keep-alive connections per (scheme, host, port, proxy), so back-to-back
+# AI calls skip the TCP and TLS handshakes
+_HTTP_POOL_SIZE = 4
+_http_pool: Dict[tuple, List[http.client.HTTPConnection]] = {}
+_http_pool_lock = threading.Lock()
+
+# Failures that mean a reused keep-alive connection was closed by the server
+# before it answered; the request never reached it, so resending is safe.
+# Timeouts are deliberately absent: the request may already be in progress.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _proxy_for(scheme: str, host: str):
+    """
+    Proxy URL (as a SplitResult) for requests to host, or None.
+
+    Honors HTTP_PROXY/HTTPS_PROXY/NO_PROXY the way urllib.request.urlopen does.
+    """
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(host):
+        return None
+    if '://' not in proxy:
+        proxy = 'http://' + proxy
+    return urlsplit(proxy)
+
+
+def _proxy_auth_header(proxy) -> Dict[str, str]:
+    """Proxy-Authorization header for credentials embedded in the proxy URL."""
+    if proxy.username is None:
+        return {}
+    creds = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    return {'Proxy-Authorization': 'Basic ' + base64.b64encode(creds.encode()).decode('ascii')}
+
+
+def _http_post(
+    url: str,
+    body: bytes,
+    headers: Dict[str, str],
+    timeout: float = 60,
+    on_line: Optional[Callable[[bytes], None]] = None,
+) -> tuple:
+    """
+    POST body to url over a pooled keep-alive connection.
+    
+    Environment proxy settings are honored: HTTPS is tunnelled through the
+    proxy with CONNECT, plain HTTP is sent to the proxy directly.
+    
+    A request on a reused connection that the server had already closed
+    (see _STALE_CONNECTION_ERRORS) is retried once on a fresh connection.
+    Nothing else is retried, so a slow call is never sent twice.
+    
+    If on_line is given, a successful response body is passed to it line by
+    line as it arrives instead of being returned; error bodies are always
+    returned whole.
+    
+    Returns:
+        (status, response body bytes)
+    
+    Raises:
+        OSError, http.client.HTTPException: On network or protocol errors
+    """
+    parts = urlsplit(url)
+    https = parts.scheme == 'https'
+    port = parts.port or (443 if https else 80)
+    proxy = _proxy_for(parts.scheme, parts.hostname)
+    key = (parts.scheme, parts.hostname, port, proxy.geturl() if proxy else None)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    if proxy is not None and not https:
+        # Plain HTTP goes to the proxy with the absolute URL as the target
+        path = url
+        headers = {**headers, **_proxy_auth_header(proxy)}
+    
+    def connect() -> http.client.HTTPConnection:
+        conn_cls = http.client.HTTPSConnection if https else http.client.HTTPConnection
+        if proxy is None:
+            return conn_cls(parts.hostname, port, timeout=timeout)
+        proxy_port = proxy.port or (443 if proxy.scheme == 'https' else 80)
+        if not https:
+            return http.client.HTTPConnection(proxy.hostname, proxy_port, timeout=timeout)
+        conn = conn_cls(proxy.hostname, proxy_port, timeout=timeout)
+        conn.set_tunnel(parts.hostname, port, headers=_proxy_auth_header(proxy))
+        return conn
+    
+    with _http_pool_lock:
+        idle = _http_pool.get(key)
+        conn = idle.pop() if idle else None
+    reused = conn is not None
+    
+    while True:
+        if conn is None:
+            conn = connect()
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        
+        try:
+            conn.request('POST', path, body=body, headers=headers)
+            response = conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            conn, reused = None, False
+            continue
+        except BaseException:
+            conn.close()
+            raise
+        break
+    
+    try:
+        if on_line is not None and response.status < 400:
+            for line in response:
+                on_line(line)
+            data = b''
+        else:
+            data = response.read()
+    except BaseException:
+        conn.close()
+        raise
+    
+    if response.will_close:
+        conn.close()
+    else:
+        with _http_pool_lock:
+            idle = _http_pool.setdefault(key, [])
+            if len(idle) < _HTTP_POOL_SIZE:
+                idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+    return response.status, data
+
+
+# Field defaults for AI-generated ideas that omit them
+_IDEA_DEFAULTS = {
+    'title': 'Untitled',
+    'description': '',
+    'category': 'feature',
+    'priority': 'medium',
+    'effort': 'medium',
+}
+
+
+# Sort rank for feature priorities; unknown priorities rank as medium
+_PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+
+
+# Response validators for _call_ai: a response is only cached once the caller
+# would accept it, so a bad generation isn't replayed until the cache expires.
+# Each takes the JSON text from _extract_json_from_response.
+
+def _parses(json_text: str) -> bool:
+    try:
+        orjson.loads(json_text)
+    except orjson.JSONDecodeError:
+        return False
+    return True
+
+
+def _ideas_usable(ideas: Any) -> bool:
+    return isinstance(ideas, list) and len(ideas) >= 5
+
+
+def _roadmap_usable(roadmap: Any) -> bool:
+    if not isinstance(roadmap, dict):
+        return False
+    milestones = roadmap.get('milestones', [])
+    return sum(len(m.get('features', [])) for m in milestones) >= 5
+
+
+def _valid_ideas(json_text: str) -> bool:
+    try:
+        return _ideas_usable(orjson.loads(json_text))
+    except orjson.JSONDecodeError:
+        return False
+
+
+def _valid_roadmap(json_text: str) -> bool:
+    try:
+        return _roadmap_usable(orjson.loads(json_text))
+    except orjson.JSONDecodeError:
+        return False
+
+
+# Prompt templates. Literal braces in the JSON examples are doubled for str.format.
+
+_ANALYZE_PROMPT_TMPL = """Analyze this codebase and provide insights:
+
+Total Files: {total_files}
+Languages: {languages}
+Dependencies: {n_deps}
+
+Provide:
+1. Overall assessment (1-2 sentences)
+2. Key strengths (2-3 points)
+3. Areas for improvement (2-3 points)
+4. Recommended next steps (2-3 actions)
+
+Format as JSON with keys: assessment, strengths (array), improvements (array), next_steps (array)"""
+
+_ANALYZE_SYSTEM = "You are an expert software architect analyzing codebases. Provide concise, actionable insights."
+
+_IDEAS_PROMPT_TMPL = """Analyze this project and generate 10-15 specific, actionable improvement ideas.
+
+## Project Context
+
+**Project**: {project_name}
+**Languages**: {lang_summary}
+**Total Files**: {total_files}
+
+**README Summary**:
+{readme}
+
+**Dependencies**:{dep_summary}
+
+**Project Notes**:
+{notes}
+
+## Task
+
+Generate 10-15 improvement ideas across these categories:
+1. **Low-Hanging Fruit** (3-4 ideas): Quick wins that build on existing patterns
+2. **UI/UX Improvements** (3-4 ideas): Visual and interaction enhancements
+3. **High-Value Features** (4-6 ideas): Strategic features that serve target users
+4. **Technical Debt** (2-3 ideas): Refactoring, optimization, or bug fixes
+
+## Requirements
+
+For each idea:
+- **title**: Concise, actionable (max 60 chars)
+- **description**: Clear explanation with specific details (2-3 sentences)
+- **category**: One of [feature, refactor, optimization, bug-fix]
+- **priority**: One of [high, medium, low] based on impact and urgency
+- **effort**: One of [small, medium, large] based on implementation complexity
+
+## Output Format
+
+Return ONLY a JSON array of objects. Each object must have: title, description, category, priority, effort
+
+Example:
+[
+  {{
+    "title": "Add dark mode support",
+    "description": "Implement dark mode theme with user preference persistence. Improves accessibility and reduces eye strain for users.",
+    "category": "feature",
+    "priority": "medium",
+    "effort": "medium"
+  }}
+]"""
+
+_IDEAS_SYSTEM = """You are an expert software consultant with deep expertise in product development.
+Analyze the project context carefully and generate specific, actionable ideas that:
+1. Build on existing patterns and technologies
+2. Address real user needs
+3. Are technically feasible
+4. Provide clear value
+
+Be specific - avoid generic suggestions. Reference actual technologies, patterns, or features from the context."""
+
+_ROADMAP_PROMPT_TMPL = """Analyze this project and create a strategic {timeframe} roadmap.
+
+## Project Context
+
+**Project**: {project_name}
+**Languages**: {lang_summary}
+**README Summary**:
+{readme}
+
+**Project Notes**:
+{notes}
+
+## Task
+
+Create a comprehensive roadmap with 10-15 features organized into quarterly milestones.
+
+### Requirements:
+
+1. **Milestones**: Organize features into quarterly milestones (Q1 2026, Q2 2026, etc.)
+2. **Features per Milestone**: 3-5 features each
+3. **Feature Details**:
+   - **title**: Clear, actionable name (max 60 chars)
+   - **description**: What it accomplishes and why it matters (2-3 sentences)
+   - **effort**: One of [small, medium, large]
+   - **priority**: One of [high, medium, low]
+   - **dependencies**: Array of feature IDs this depends on (use empty array [] if none)
+
+4. **Prioritization**: Use MoSCoW framework:
+   - **Must Have**: Critical features for Q1
+   - **Should Have**: Important features for Q2
+   - **Could Have**: Nice-to-have features for Q3+
+
+5. **Dependencies**: Map logical dependencies (e.g., "User Dashboard" depends on "User Authentication")
+
+## Output Format
+
+Return ONLY a JSON object with this structure:
+
+{{
+  "milestones": [
+    {{
+      "quarter": "Q1 2026",
+      "features": [
+        {{
+          "title": "User Authentication System",
+          "description": "Implement secure JWT-based authentication with email/password and OAuth providers. Foundation for all user-specific features.",
+          "effort": "large",
+          "priority": "high",
+          "dependencies": []
+        }}
+      ]
+    }}
+  ]
+}}
+
+**IMPORTANT**: Generate 10-15 total features across all milestones."""
+
+_ROADMAP_SYSTEM = """You are an expert product strategist and technical architect.
+Create realistic, achievable roadmaps that:
+1. Build features in logical dependency order
+2. Balance quick wins with strategic initiatives
+3. Consider technical constraints and existing architecture
+4. Provide clear business value"""
 
 
 class AIAssistant:
@@ -34,9 +445,69 @@ class AIAssistant:
         """
         self.use_mock = use_mock
         self.progress_callback = progress_callback
+        
+        self._api_key: Optional[str] = None
+        self._endpoint: Optional[str] = None
+        self._model: Optional[str] = None
+        self._headers: Dict[str, str] = {}
+        if not use_mock:
+            self._load_config()
+    
+    def _load_config(self) -> None:
+        """Resolve the API endpoint, model and headers, falling back to mock if unconfigured."""
+        # Get SDK environment from registry (cached until reload_config)
+        try:
+            sdk_env = _sdk_env_snapshot()
+        except Exception as e:
+            logger.warning("Could not read API settings: %s. Using mock responses.", e)
+            self.use_mock = True
+            return
+        
+        # Get API configuration
+        api_key = sdk_env.get("ANTHROPIC_API_KEY") or sdk_env.get("ANTHROPIC_AUTH_TOKEN")
+        base_url = sdk_env.get("ANTHROPIC_BASE_URL")
+        
+        if not api_key:
+            logger.warning("No API key configured. Using mock responses.")
+            self.use_mock = True
+            return
+        
+        if not base_url:
+            logger.warning("No API base URL configured. Using mock responses.")
+            self.use_mock = True
+            return
+        
+        self._api_key = api_key
+        self._model = sdk_env.get("ANTHROPIC_DEFAULT_OPUS_MODEL") or "claude-sonnet-4-20250514"
+        
+        # Construct API endpoint
+        # Remove trailing slash and add /v1/messages
+        self._endpoint = base_url.rstrip('/') + '/v1/messages'
+        
+        self._headers = {
+            "Content-Type": "application/json",
+            "x-api-key": api_key,
+            "anthropic-version": "2023-06-01"
+        }
+
+    @staticmethod
+    def reload_config() -> None:
+        """Re-read API provider settings on the next AI call."""
+        _sdk_env_snapshot.cache_clear()
 
+    def _report_progress(self, stage: str, progress: int, message: str) -> None:
+        """Forward a progress update to the registered callback, if any."""
+        if self.progress_callback is not None:
+            self.progress_callback(stage, progress, message)
     
-    def _call_ai(self, prompt: str, system: str = "", max_tokens: int = 4000) -> str:
+    def _call_ai(
+        self,
+        prompt: str,
+        system: str = "",
+        max_tokens: int = 4000,
+        stream: bool = False,
+        validate: Optional[Callable[[str], bool]] = None,
+    ) -> str:
         """
         Make a direct AI API call using HTTP requests.
         Works with any Anthropic-compatible API (Claude, GLM, etc.)
@@ -45,6 +516,11 @@ class AIAssistant:
             prompt: User prompt
             system: System prompt
             max_tokens: Maximum tokens to generate
+            stream: Stream the response and report progress while it arrives.
+                Only takes effect when a progress callback is registered.
+            validate: Called with the extracted JSON text; the response is
+                only cached if it returns True. Responses cut off at
+                max_tokens are never cached.
             
         Returns:
             AI response text
@@ -53,35 +529,18 @@ class AIAssistant:
             return ""
         
         try:
-            import json
-            import urllib.request
-            import urllib.error
-            
-            # Get SDK environment from registry
-            sdk_env = get_effective_sdk_env()
-            
-            # Get API configuration
-            api_key = sdk_env.get("ANTHROPIC_API_KEY") or sdk_env.get("ANTHROPIC_AUTH_TOKEN")
-            base_url = sdk_env.get("ANTHROPIC_BASE_URL")
-            model = sdk_env.get("ANTHROPIC_DEFAULT_OPUS_MODEL") or "claude-sonnet-4-20250514"
-            
-            if not api_key:
-                print("⚠️  No API key configured. Using mock responses.")
-                self.use_mock = True
-                return ""
-            
-            if not base_url:
-                print("⚠️  No API base URL configured. Using mock responses.")
-                self.use_mock = True
-                return ""
-            
-            # Construct API endpoint
-            # Remove trailing slash and add /v1/messages
-            endpoint = base_url.rstrip('/') + '/v1/messages'
+            # Identical requests to the same endpoint reuse the stored response
+            cache_key = _ai_cache_key(self._endpoint, self._model, system, prompt, max_tokens) if _ai_cache_enabled() else None
+            if cache_key is not None:
+                cached = _ai_cache_get(cache_key)
+                if cached is not None:
+                    if stream:
+                        self._report_progress("generating", 89, "Using cached AI response...")
+                    return cached
             
             # Build request payload
             payload = {
-                "model": model,
+                "model": self._model,
                 "max_tokens": max_tokens,
                 "messages": [{"role": "user", "content": prompt}]
             }
@@ -89,55 +548,122 @@ class AIAssistant:
             if system:
                 payload["system"] = system
             
-            # Make HTTP request
-            headers = {
-                "Content-Type": "application/json",
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01"
-            }
-            
-            print(f"🔍 Making AI request to: {endpoint}")
-            print(f"🔍 Model: {model}")
-            
-            request = urllib.request.Request(
-                endpoint,
-                data=json.dumps(payload).encode('utf-8'),
-                headers=headers,
-                method='POST'
-            )
+            logger.debug("Making AI request to: %s (model %s)", self._endpoint, self._model)
             
-            with urllib.request.urlopen(request, timeout=60) as response:
-                response_text = response.read().decode('utf-8')
-                print(f"🔍 API Response (first 500 chars): {response_text[:500]}")
+            if stream and self.progress_callback is not None:
+                text, stop_reason = self._call_ai_streaming(payload, max_tokens)
+            else:
+                # Make HTTP request
+                status, response_body = _http_post(self._endpoint, orjson.dumps(payload), self._headers, timeout=60)
                 
-                result = json.loads(response_text)
+                if status >= 400:
+                    logger.warning(
+                        "AI API call failed (HTTP %s): %s. Falling back to mock response for this request.",
+                        status, response_body.decode('utf-8', 'replace'),
+                    )
+                    return ""
                 
-                # Extract text from response
-                if 'content' in result and len(result['content']) > 0:
-                    return result['content'][0].get('text', '')
+                # Raw bytes go straight to orjson; the body is only sliced and
+                # decoded for the debug log when that level is enabled
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("API response (first 500 bytes): %s", response_body[:500].decode('utf-8', 'replace'))
+                
+                result = orjson.loads(response_body)
                 
-                print(f"⚠️  Unexpected response structure: {result.keys()}")
-                return ""
+                # Extract text from response
+                if 'content' not in result or len(result['content']) == 0:
+                    logger.warning("Unexpected response structure: %s", list(result))
+                    return ""
+                text = result['content'][0].get('text', '')
+                stop_reason = result.get('stop_reason')
             
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8') if e.fp else str(e)
-            print(f"⚠️  AI API call failed (HTTP {e.code}): {error_body}")
-            print("   Falling back to mock response for this request.")
-            return ""
-        except urllib.error.URLError as e:
-            print(f"⚠️  AI API call failed (Network error): {e.reason}")
-            print("   Falling back to mock response for this request.")
+            if stop_reason == 'max_tokens':
+                logger.warning("AI response was truncated at %d tokens", max_tokens)
+            elif text and cache_key is not None and (
+                validate is None or validate(self._extract_json_from_response(text))
+            ):
+                _ai_cache_set(cache_key, text)
+            return text
+            
+        except (OSError, http.client.HTTPException) as e:
+            logger.warning("AI API call failed (Network error): %s. Falling back to mock response for this request.", e)
             return ""
-        except json.JSONDecodeError as e:
-            print(f"⚠️  Failed to parse API response as JSON: {e}")
-            print(f"   Response was: {response_text[:200] if 'response_text' in locals() else 'N/A'}")
-            print("   Falling back to mock response for this request.")
+        except orjson.JSONDecodeError as e:
+            logger.warning(
+                "Failed to parse API response as JSON: %s. Falling back to mock response for this request.", e
+            )
+            if logger.isEnabledFor(logging.DEBUG) and 'response_body' in locals():
+                logger.debug("Response was: %s", response_body[:200].decode('utf-8', 'replace'))
             return ""
         except Exception as e:
-            print(f"⚠️  AI API call failed: {e}")
-            print("   Falling back to mock response for this request.")
+            logger.warning("AI API call failed: %s. Falling back to mock response for this request.", e)
             return ""
     
+    def _call_ai_streaming(self, payload: Dict[str, Any], max_tokens: int) -> tuple:
+        """
+        Make a streaming AI API call and report progress as text arrives.
+        
+        Reads the server-sent event stream of the messages API, collecting
+        text deltas, so long generations show progress from the first token
+        instead of appearing stalled until the whole response is in.
+        
+        Args:
+            payload: Request payload built by _call_ai
+            max_tokens: Maximum tokens requested, used to scale progress
+            
+        Returns:
+            (AI response text, stop reason); the text is "" if the request
+            or stream failed
+        """
+        parts: List[str] = []
+        received = 0
+        reported = 0
+        errors: List[Any] = []
+        stop_reasons: List[Any] = []
+        # Progress runs from 75% towards 90%, assuming ~4 characters per token
+        expected_chars = max_tokens * 4
+        
+        def on_line(line: bytes) -> None:
+            nonlocal received, reported
+            if not line.startswith(b'data:'):
+                return
+            data = line[5:].strip()
+            if not data or data == b'[DONE]':
+                return
+            event = orjson.loads(data)
+            event_type = event.get('type')
+            if event_type == 'content_block_delta':
+                delta = event.get('delta', {}).get('text', '')
+                parts.append(delta)
+                received += len(delta)
+                # One progress update per ~2KB of text
+                if received - reported >= 2048:
+                    reported = received
+                    progress = 75 + min(14, 14 * received // expected_chars)
+                    self._report_progress("generating", progress, f"Receiving AI response ({received} characters)...")
+            elif event_type == 'message_delta':
+                stop_reasons.append(event.get('delta', {}).get('stop_reason'))
+            elif event_type == 'error':
+                errors.append(event.get('error'))
+        
+        headers = {**self._headers, "Accept": "text/event-stream"}
+        status, response_body = _http_post(
+            self._endpoint, orjson.dumps({**payload, "stream": True}), headers, timeout=60, on_line=on_line,
+        )
+        
+        if status >= 400:
+            logger.warning(
+                "AI API call failed (HTTP %s): %s. Falling back to mock response for this request.",
+                status, response_body.decode('utf-8', 'replace'),
+            )
+            return "", None
+        
+        if errors:
+            logger.warning("AI API stream failed: %s. Falling back to mock response for this request.", errors[0])
+            return "", None
+        
+        return ''.join(parts), stop_reasons[-1] if stop_reasons else None
+    
     def _extract_json_from_response(self, text: str) -> str:
         """
         Extract JSON from AI response, handling markdown code blocks.
@@ -154,21 +680,61 @@ class AIAssistant:
         if not text:
             return text
         
-        # Remove markdown code blocks (```json ... ``` or ``` ... ```)
-        import re
+        stripped = text.strip()
+        
+        # Bare JSON needs no unwrapping, and most responses have no code
+        # block; skip the regex scan for both
+        if stripped[:1] in ('{', '[') or '```' not in stripped:
+            return stripped
         
-        # Pattern: ```json\n{...}\n``` or ```\n{...}\n```
-        pattern = r'```(?:json)?\s*\n?(.*?)\n?```'
-        match = re.search(pattern, text, re.DOTALL)
+        # Remove markdown code blocks (```json ... ``` or ``` ... ```)
+        match = _FENCE_RE.search(stripped)
         
         if match:
             return match.group(1).strip()
         
         # If no code block, return as-is
-        return text.strip()
+        return stripped
 
 
     
+    @staticmethod
+    def _dependency_summary(dependencies: Dict[str, Any]) -> str:
+        """Top Node.js and Python dependencies, one line per ecosystem."""
+        dep_summary = ''
+        if dependencies.get('node'):
+            node_deps = ', '.join(dependencies['node'].get('dependencies', [])[:10])
+            dep_summary += f"\nNode.js: {node_deps}"
+        if dependencies.get('python'):
+            py_deps = ', '.join(dependencies['python'][:10])
+            dep_summary += f"\nPython: {py_deps}"
+        return dep_summary
+    
+    @staticmethod
+    def _stamp_ideas(ideas_raw: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Normalize AI-generated ideas and give them IDs and timestamps."""
+        # One clock read for the batch; the index keeps IDs unique within it
+        now = datetime.now(UTC)
+        ts = now.timestamp()
+        created_at = now.isoformat() + 'Z'
+        return [
+            {**_IDEA_DEFAULTS, **idea, 'id': f'idea_{ts}_{i}', 'created_at': created_at, 'saved': False}
+            for i, idea in enumerate(ideas_raw)
+        ]
+    
+    @staticmethod
+    def _stamp_roadmap(roadmap_data: Dict[str, Any]) -> int:
+        """Give AI-generated roadmap features IDs and status in place; returns the feature count."""
+        # One timestamp per roadmap; the running count keeps IDs unique
+        ts = datetime.now(UTC).timestamp()
+        total_features = 0
+        for milestone in roadmap_data.get('milestones', []):
+            for feature in milestone.get('features', []):
+                feature['id'] = f'roadmap_{ts}_{total_features}'
+                feature['status'] = 'planned'
+                total_features += 1
+        return total_features
+    
     def analyze_codebase(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze codebase structure and provide insights.
@@ -183,23 +749,13 @@ class AIAssistant:
             return self._mock_analyze_codebase(analysis)
         
         # Build prompt for AI
-        prompt = f"""Analyze this codebase and provide insights:
-
-Total Files: {analysis.get('total_files', 0)}
-Languages: {', '.join(analysis.get('languages', []))}
-Dependencies: {len(analysis.get('dependencies', []))}
-
-Provide:
-1. Overall assessment (1-2 sentences)
-2. Key strengths (2-3 points)
-3. Areas for improvement (2-3 points)
-4. Recommended next steps (2-3 actions)
-
-Format as JSON with keys: assessment, strengths (array), improvements (array), next_steps (array)"""
-
-        system = "You are an expert software architect analyzing codebases. Provide concise, actionable insights."
+        prompt = _ANALYZE_PROMPT_TMPL.format(
+            total_files=analysis.get('total_files', 0),
+            languages=', '.join(analysis.get('languages', [])),
+            n_deps=len(analysis.get('dependencies', [])),
+        )
         
-        response_text = self._call_ai(prompt, system)
+        response_text = self._call_ai(prompt, _ANALYZE_SYSTEM, validate=_parses)
         
         if not response_text:
             # Fallback to mock if AI call failed
@@ -210,9 +766,9 @@ Format as JSON with keys: assessment, strengths (array), improvements (array), n
         
         try:
             # Parse JSON response
-            result = json.loads(json_text)
+            result = orjson.loads(json_text)
             return result
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # If not valid JSON, return structured fallback
             return {
                 "assessment": response_text[:200],
@@ -244,109 +800,45 @@ Format as JSON with keys: assessment, strengths (array), improvements (array), n
         notes = context.get('notes', 'No notes')[:300]
         
         # Build rich context prompt
-        lang_summary = ', '.join([f"{lang} ({count} files)" for lang, count in list(languages.items())[:5]])
-        dep_summary = ''
-        if dependencies.get('node'):
-            node_deps = ', '.join(dependencies['node'].get('dependencies', [])[:10])
-            dep_summary += f"\nNode.js: {node_deps}"
-        if dependencies.get('python'):
-            py_deps = ', '.join(dependencies['python'][:10])
-            dep_summary += f"\nPython: {py_deps}"
+        lang_summary = ', '.join(f"{lang} ({count} files)" for lang, count in islice(languages.items(), 5))
+        dep_summary = self._dependency_summary(dependencies)
         
-        prompt = f"""Analyze this project and generate 10-15 specific, actionable improvement ideas.
-
-## Project Context
-
-**Project**: {project_name}
-**Languages**: {lang_summary}
-**Total Files**: {total_files}
-
-**README Summary**:
-{readme}
-
-**Dependencies**:{dep_summary}
-
-**Project Notes**:
-{notes}
-
-## Task
-
-Generate 10-15 improvement ideas across these categories:
-1. **Low-Hanging Fruit** (3-4 ideas): Quick wins that build on existing patterns
-2. **UI/UX Improvements** (3-4 ideas): Visual and interaction enhancements
-3. **High-Value Features** (4-6 ideas): Strategic features that serve target users
-4. **Technical Debt** (2-3 ideas): Refactoring, optimization, or bug fixes
-
-## Requirements
-
-For each idea:
-- **title**: Concise, actionable (max 60 chars)
-- **description**: Clear explanation with specific details (2-3 sentences)
-- **category**: One of [feature, refactor, optimization, bug-fix]
-- **priority**: One of [high, medium, low] based on impact and urgency
-- **effort**: One of [small, medium, large] based on implementation complexity
-
-## Output Format
-
-Return ONLY a JSON array of objects. Each object must have: title, description, category, priority, effort
-
-Example:
-[
-  {{
-    "title": "Add dark mode support",
-    "description": "Implement dark mode theme with user preference persistence. Improves accessibility and reduces eye strain for users.",
-    "category": "feature",
-    "priority": "medium",
-    "effort": "medium"
-  }}
-]"""
-
-        system = """You are an expert software consultant with deep expertise in product development.
-Analyze the project context carefully and generate specific, actionable ideas that:
-1. Build on existing patterns and technologies
-2. Address real user needs
-3. Are technically feasible
-4. Provide clear value
-
-Be specific - avoid generic suggestions. Reference actual technologies, patterns, or features from the context."""
+        prompt = _IDEAS_PROMPT_TMPL.format(
+            project_name=project_name,
+            lang_summary=lang_summary,
+            total_files=total_files,
+            readme=readme,
+            dep_summary=dep_summary,
+            notes=notes,
+        )
         
-        response_text = self._call_ai(prompt, system, max_tokens=8000)
+        self._report_progress("generating", 75, "AI is brainstorming improvement ideas...")
+        response_text = self._call_ai(prompt, _IDEAS_SYSTEM, max_tokens=8000, stream=True, validate=_valid_ideas)
+        self._report_progress("parsing", 90, "Organizing generated ideas...")
         
         if not response_text:
-            print("⚠️  AI returned empty response, using mock ideas")
-            return self._mock_generate_ideas()
+            logger.warning("AI returned empty response, using mock ideas")
+            return self._mock_generate_ideas(context)
         
         # Extract JSON from response (handles markdown code blocks)
         json_text = self._extract_json_from_response(response_text)
         
         try:
             # Parse JSON response
-            ideas_raw = json.loads(json_text)
+            ideas_raw = orjson.loads(json_text)
             
             # Validate minimum count
             if len(ideas_raw) < 5:
-                print(f"⚠️  AI generated only {len(ideas_raw)} ideas, expected 10-15. Using mock fallback.")
-                return self._mock_generate_ideas()
+                logger.warning("AI generated only %d ideas, expected 10-15. Using mock fallback.", len(ideas_raw))
+                return self._mock_generate_ideas(context)
             
-            # Add IDs and timestamps
-            ideas = []
-            for i, idea in enumerate(ideas_raw):
-                ideas.append({
-                    'id': f'idea_{datetime.now(UTC).timestamp()}_{i}',
-                    'title': idea.get('title', 'Untitled'),
-                    'description': idea.get('description', ''),
-                    'category': idea.get('category', 'feature'),
-                    'priority': idea.get('priority', 'medium'),
-                    'effort': idea.get('effort', 'medium'),
-                    'created_at': datetime.now(UTC).isoformat() + 'Z',
-                    'saved': False
-                })
+            ideas = self._stamp_ideas(ideas_raw)
             
-            print(f"✅ Generated {len(ideas)} ideas")
+            logger.info("Generated %d ideas", len(ideas))
             return ideas
             
-        except json.JSONDecodeError as e:
-            print(f"⚠️  Failed to parse AI response: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to parse AI response: %s", e)
             return self._mock_generate_ideas(context)
     
     def generate_roadmap(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -372,102 +864,44 @@ Be specific - avoid generic suggestions. Reference actual technologies, patterns
         notes = context.get('notes', 'No notes')[:300]
         
         # Build context summary
-        lang_summary = ', '.join([f"{lang} ({count})" for lang, count in list(languages.items())[:5]])
+        lang_summary = ', '.join(f"{lang} ({count})" for lang, count in islice(languages.items(), 5))
         
-        prompt = f"""Analyze this project and create a strategic {timeframe.replace('_', ' ')} roadmap.
-
-## Project Context
-
-**Project**: {project_name}
-**Languages**: {lang_summary}
-**README Summary**:
-{readme}
-
-**Project Notes**:
-{notes}
-
-## Task
-
-Create a comprehensive roadmap with 10-15 features organized into quarterly milestones.
-
-### Requirements:
-
-1. **Milestones**: Organize features into quarterly milestones (Q1 2026, Q2 2026, etc.)
-2. **Features per Milestone**: 3-5 features each
-3. **Feature Details**:
-   - **title**: Clear, actionable name (max 60 chars)
-   - **description**: What it accomplishes and why it matters (2-3 sentences)
-   - **effort**: One of [small, medium, large]
-   - **priority**: One of [high, medium, low]
-   - **dependencies**: Array of feature IDs this depends on (use empty array [] if none)
-
-4. **Prioritization**: Use MoSCoW framework:
-   - **Must Have**: Critical features for Q1
-   - **Should Have**: Important features for Q2
-   - **Could Have**: Nice-to-have features for Q3+
-
-5. **Dependencies**: Map logical dependencies (e.g., "User Dashboard" depends on "User Authentication")
-
-## Output Format
-
-Return ONLY a JSON object with this structure:
-
-{{
-  "milestones": [
-    {{
-      "quarter": "Q1 2026",
-      "features": [
-        {{
-          "title": "User Authentication System",
-          "description": "Implement secure JWT-based authentication with email/password and OAuth providers. Foundation for all user-specific features.",
-          "effort": "large",
-          "priority": "high",
-          "dependencies": []
-        }}
-      ]
-    }}
-  ]
-}}
-
-**IMPORTANT**: Generate 10-15 total features across all milestones."""
-
-        system = """You are an expert product strategist and technical architect.
-Create realistic, achievable roadmaps that:
-1. Build features in logical dependency order
-2. Balance quick wins with strategic initiatives
-3. Consider technical constraints and existing architecture
-4. Provide clear business value"""
+        prompt = _ROADMAP_PROMPT_TMPL.format(
+            timeframe=timeframe.replace('_', ' '),
+            project_name=project_name,
+            lang_summary=lang_summary,
+            readme=readme,
+            notes=notes,
+        )
         
-        response_text = self._call_ai(prompt, system, max_tokens=8000)
+        response_text = self._call_ai(prompt, _ROADMAP_SYSTEM, max_tokens=8000, stream=True, validate=_valid_roadmap)
         
         if not response_text:
-            print("⚠️  AI returned empty response, using mock roadmap")
+            logger.warning("AI returned empty response, using mock roadmap")
             return self._mock_generate_roadmap(context)
         
         # Extract JSON from response (handles markdown code blocks)
         json_text = self._extract_json_from_response(response_text)
         
         try:
-            roadmap_data = json.loads(json_text)
+            roadmap_data = orjson.loads(json_text)
             
             # Validate and add IDs
-            total_features = 0
-            for milestone in roadmap_data.get('milestones', []):
-                for i, feature in enumerate(milestone.get('features', [])):
-                    feature['id'] = f'roadmap_{datetime.now(UTC).timestamp()}_{total_features}'
-                    feature['status'] = 'planned'
-                    total_features += 1
+            total_features = self._stamp_roadmap(roadmap_data)
             
             # Validate minimum feature count
             if total_features < 5:
-                print(f"⚠️  AI generated only {total_features} features, expected 10-15. Using mock fallback.")
-                return self._mock_generate_roadmap()
+                logger.warning("AI generated only %d features, expected 10-15. Using mock fallback.", total_features)
+                return self._mock_generate_roadmap(context)
             
-            print(f"✅ Generated roadmap with {total_features} features across {len(roadmap_data.get('milestones', []))} milestones")
+            logger.info(
+                "Generated roadmap with %d features across %d milestones",
+                total_features, len(roadmap_data.get('milestones', [])),
+            )
             return roadmap_data
             
-        except json.JSONDecodeError as e:
-            print(f"⚠️  Failed to parse AI response: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to parse AI response: %s", e)
             return self._mock_generate_roadmap(context)
     
     def prioritize_features(self, features: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -487,6 +921,38 @@ Create realistic, achievable roadmaps that:
         # Real AI prioritization can be added later
         return self._mock_prioritize_features(features)
     
+    def run_all(self, analysis: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run codebase analysis, idea generation and roadmap generation concurrently.
+        
+        The three calls are independent and spend their time waiting on the
+        AI API, so the total latency is that of the slowest one.
+        
+        Args:
+            analysis: Codebase analysis from ContextManager
+            context: Comprehensive project context
+            
+        Returns:
+            Dictionary with 'analysis', 'ideas' and 'roadmap' results. A call
+            that raises is replaced by its mock result without affecting the
+            other two.
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'analysis': (executor.submit(self.analyze_codebase, analysis), self._mock_analyze_codebase, analysis),
+                'ideas': (executor.submit(self.generate_ideas, context), self._mock_generate_ideas, context),
+                'roadmap': (executor.submit(self.generate_roadmap, context), self._mock_generate_roadmap, context),
+            }
+        
+        results = {}
+        for key, (future, fallback, arg) in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception:
+                logger.exception("AI %s generation failed, using mock result", key)
+                results[key] = fallback(arg)
+        return results
+    
     # ========================================================================
     # Mock Implementations (fallback)
     # ========================================================================
@@ -515,6 +981,7 @@ Create realistic, achievable roadmaps that:
         import random
         
         languages = context.get('languages', [])
+        created_at = datetime.now(UTC).isoformat() + 'Z'
         ideas = []
         
         # JavaScript/TypeScript ideas
@@ -527,7 +994,7 @@ Create realistic, achievable roadmaps that:
                     'category': 'feature',
                     'priority': 'high',
                     'effort': 'medium',
-                    'created_at': datetime.now(UTC).isoformat() + 'Z',
+                    'created_at': created_at,
                     'saved': False
                 },
                 {
@@ -537,7 +1004,7 @@ Create realistic, achievable roadmaps that:
                     'category': 'feature',
                     'priority': 'high',
                     'effort': 'small',
-                    'created_at': datetime.now(UTC).isoformat() + 'Z',
+                    'created_at': created_at,
                     'saved': False
                 }
             ])
@@ -552,7 +1019,7 @@ Create realistic, achievable roadmaps that:
                     'category': 'refactor',
                     'priority': 'medium',
                     'effort': 'medium',
-                    'created_at': datetime.now(UTC).isoformat() + 'Z',
+                    'created_at': created_at,
                     'saved': False
                 }
             ])
@@ -566,7 +1033,7 @@ Create realistic, achievable roadmaps that:
                 'category': 'feature',
                 'priority': 'medium',
                 'effort': 'medium',
-                'created_at': datetime.now(UTC).isoformat() + 'Z',
+                'created_at': created_at,
                 'saved': False
             }
         ])
@@ -596,6 +1063,5 @@ Create realistic, achievable roadmaps that:
     
     def _mock_prioritize_features(self, features: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prioritize features (mock)."""
-        # Simple priority-based sorting
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        return sorted(features, key=lambda f: priority_order.get(f.get('priority', 'medium'), 1))
+        # Simple priority-based sorting (stable, so ties keep their order)
+        return sorted(features, key=lambda f: _PRIORITY_ORDER.get(f.get('priority', 'medium'), 1))
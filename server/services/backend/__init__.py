@@ -1,13 +1,24 @@
 from .interface import BackendInterface
 from .sqlite import SQLiteBackend
-from .convex import ConvexBackend
-from .markdown import MarkdownBackend
-from .factory import BackendFactory
+from .factory import BackendDep, BackendFactory, get_backend
 
 __all__ = [
     "BackendInterface",
     "SQLiteBackend",
     "ConvexBackend",
     "MarkdownBackend",
-    "BackendFactory"
+    "BackendFactory",
+    "BackendDep",
+    "get_backend",
 ]
+
+
+def __getattr__(name: str):
+    # Convex and Markdown backends load on first access (see BackendFactory._create)
+    if name == "ConvexBackend":
+        from .convex import ConvexBackend
+        return ConvexBackend
+    if name == "MarkdownBackend":
+        from .markdown import MarkdownBackend
+        return MarkdownBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
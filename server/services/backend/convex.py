@@ -5,12 +5,22 @@ Convex Backend Implementation
 Implementation of BackendInterface using Convex.
 """
 
+import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
+
+import orjson
 from convex import ConvexClient
 
 from server.services.backend.interface import BackendInterface
+from server.utils.project_helpers import get_project_xaheen_dir
+from server.utils.knowledge_cache import invalidate_knowledge_cache, list_knowledge_files
 from server.schemas import (
     FeatureCreate, FeatureResponse, FeatureUpdate,
     ScheduleCreate, ScheduleResponse, ScheduleUpdate,
@@ -18,70 +28,138 @@ from server.schemas import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Read query results are reused for this long, so UI polling and
+# read-then-write sequences don't repeat identical round trips
+_QUERY_CACHE_TTL = 0.5  # seconds
+
+
+@lru_cache(maxsize=4096)
+def _ts_ms_to_dt(ms: float) -> datetime:
+    """Convert a Convex millisecond timestamp to a datetime, memoized so
+    repeated polls of the same schedules don't rebuild it."""
+    return datetime.fromtimestamp(ms / 1000.0)
+
+
 class ConvexBackend(BackendInterface):
     """Convex implementation of persistence layer."""
 
+    # Documents are already validated against convex/schema.ts, so responses
+    # are built without re-running Pydantic validation. Set to False to
+    # validate them anyway.
+    TRUST_CONVEX_SCHEMA = True
+
     def __init__(self):
         url = os.getenv("CONVEX_URL")
         if not url:
             raise ValueError("CONVEX_URL environment variable is required for Convex backend")
         self.client = ConvexClient(url)
+        # project -> {(query name, args): (fetched_at, result)}
+        self._cache: dict[str, dict[tuple, tuple[float, Any]]] = {}
+        # project -> mutation count, so a read that overlapped a write isn't cached
+        self._cache_gen: dict[str, int] = {}
+        self._cache_lock = threading.Lock()
+        # Runs independent round trips concurrently (see snapshot) and
+        # optimistic writes in the background
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="convex")
+
+    def close(self) -> None:
+        """Stop the background worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def warm_up(self) -> None:
+        """Establish the client's connection to the deployment with a cheap read."""
+        # The client keeps one persistent connection for all queries and
+        # mutations; opening it here takes the handshake off the first request
+        self.client.query("schedules:list", {"projectId": ""})
+
+    def _query(self, project_name: str, name: str, args: dict) -> Any:
+        """Run a read query, reusing a result fetched within _QUERY_CACHE_TTL."""
+        key = (name, tuple(sorted(args.items())))
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(project_name, {}).get(key)
+            gen = self._cache_gen.get(project_name, 0)
+        if entry is not None and now - entry[0] < _QUERY_CACHE_TTL:
+            return entry[1]
+
+        result = self.client.query(name, args)
+        with self._cache_lock:
+            if self._cache_gen.get(project_name, 0) == gen:
+                self._cache.setdefault(project_name, {})[key] = (now, result)
+        return result
+
+    def _mutation(self, project_name: str, name: str, args: dict) -> Any:
+        """Run a mutation and drop the project's cached reads."""
+        try:
+            return self.client.mutation(name, args)
+        finally:
+            with self._cache_lock:
+                self._cache.pop(project_name, None)
+                self._cache_gen[project_name] = self._cache_gen.get(project_name, 0) + 1
+
+    def _mutation_in_background(self, project_name: str, name: str, args: dict) -> None:
+        """Run a mutation on the executor; failures are logged, not raised."""
+        def run():
+            try:
+                self._mutation(project_name, name, args)
+            except Exception:
+                # _mutation already dropped the cache, so the next read is authoritative
+                logger.exception("Background Convex mutation %s failed for project %s", name, project_name)
+
+        self._executor.submit(run)
 
     def _feature_from_convex(self, doc: dict) -> FeatureResponse:
         """Convert Convex document to FeatureResponse."""
-        # Handle optional fields or defaults
-        return FeatureResponse(
-            id=doc["featureId"],  # Map internal featureId to id
-            priority=doc.get("priority", 0),
-            category=doc["category"],
-            name=doc["name"],
-            description=doc["description"],
-            steps=doc["steps"],
-            passes=doc["passes"],
-            in_progress=doc["in_progress"],
-            dependencies=doc.get("dependencies", []),
-            created_at=doc.get("_creationTime", 0) / 1000.0 if "_creationTime" in doc else None
-        )
+        return self._features_from_convex_batch([doc])[0]
+
+    @classmethod
+    def _features_from_convex_batch(cls, docs: list[dict]) -> list[FeatureResponse]:
+        """Convert many Convex documents to FeatureResponse in one pass."""
+        # Convex numbers arrive as floats, so the int fields are converted
+        # here rather than left to validation
+        make = FeatureResponse.model_construct if cls.TRUST_CONVEX_SCHEMA else FeatureResponse
+        return [
+            make(
+                id=int(doc["featureId"]),  # Map internal featureId to id
+                priority=int(doc.get("priority", 0)),
+                category=doc["category"],
+                name=doc["name"],
+                description=doc["description"],
+                steps=doc["steps"],
+                passes=doc["passes"],
+                in_progress=doc["in_progress"],
+                dependencies=[int(d) for d in doc.get("dependencies") or ()],
+            )
+            for doc in docs
+        ]
 
     def _schedule_from_convex(self, doc: dict) -> ScheduleResponse:
         """Convert Convex document to ScheduleResponse."""
-        created_ts = doc.get("_creationTime", 0) / 1000.0 if "_creationTime" in doc else None
-        created_at = datetime.fromtimestamp(created_ts) if created_ts else datetime.now()
-        
-        return ScheduleResponse(
-            id=doc["scheduleId"],
+        ct = doc.get("_creationTime")
+        created_at = _ts_ms_to_dt(ct) if ct else datetime.now()
+
+        make = ScheduleResponse.model_construct if self.TRUST_CONVEX_SCHEMA else ScheduleResponse
+        return make(
+            id=int(doc["scheduleId"]),
             project_name=doc["projectId"],
             start_time=doc["start_time"],
-            duration_minutes=doc["duration_minutes"],
-            days_of_week=doc["days_of_week"],
+            duration_minutes=int(doc["duration_minutes"]),
+            days_of_week=int(doc["days_of_week"]),
             enabled=doc["enabled"],
             yolo_mode=doc["yolo_mode"],
             model=doc.get("model"),
-            max_concurrency=doc["max_concurrency"],
-            crash_count=doc.get("crash_count", 0),
+            max_concurrency=int(doc["max_concurrency"]),
+            crash_count=int(doc.get("crash_count", 0)),
             created_at=created_at
         )
 
     def list_features(self, project_name: str) -> dict[str, list[FeatureResponse]]:
-        docs = self.client.query("features:list", {"projectId": project_name})
-        
-        pending = []
-        in_progress = []
-        done = []
-        
-        for doc in docs:
-            feat = self._feature_from_convex(doc)
-            if feat.passes:
-                done.append(feat)
-            elif feat.in_progress:
-                in_progress.append(feat)
-            else:
-                pending.append(feat)
-                
+        result = self._query(project_name, "features:listWithGraph", {"projectId": project_name})
         return {
-            "pending": pending,
-            "in_progress": in_progress,
-            "done": done
+            status: self._features_from_convex_batch(result[status])
+            for status in ("pending", "in_progress", "done")
         }
 
     def create_feature(self, project_name: str, feature: FeatureCreate) -> FeatureResponse:
@@ -99,7 +177,7 @@ class ConvexBackend(BackendInterface):
         args["in_progress"] = False
         
         # Call mutation
-        doc = self.client.mutation("features:create", args)
+        doc = self._mutation(project_name, "features:create", args)
         return self._feature_from_convex(doc)
 
     def create_features_bulk(self, project_name: str, bulk: FeatureBulkCreate) -> list[FeatureResponse]:
@@ -111,11 +189,11 @@ class ConvexBackend(BackendInterface):
         if bulk.starting_priority is not None:
             args["startingPriority"] = bulk.starting_priority
             
-        docs = self.client.mutation("features:createBulk", args)
-        return [self._feature_from_convex(d) for d in docs]
+        docs = self._mutation(project_name, "features:createBulk", args)
+        return self._features_from_convex_batch(docs)
 
     def get_feature(self, project_name: str, feature_id: int) -> FeatureResponse | None:
-        doc = self.client.query("features:getByFeatureId", {
+        doc = self._query(project_name, "features:getByFeatureId", {
             "projectId": project_name,
             "featureId": feature_id
         })
@@ -125,15 +203,36 @@ class ConvexBackend(BackendInterface):
 
     def update_feature(self, project_name: str, feature_id: int, update: FeatureUpdate) -> FeatureResponse:
         fields = update.model_dump(exclude_unset=True)
-        doc = self.client.mutation("features:updateByFeatureId", {
+        doc = self._mutation(project_name, "features:updateByFeatureId", {
             "projectId": project_name,
             "featureId": feature_id,
             "fields": fields
         })
         return self._feature_from_convex(doc)
 
+    def update_feature_optimistic(self, project_name: str, feature_id: int, update: FeatureUpdate) -> FeatureResponse:
+        """
+        Update a feature without waiting for Convex to acknowledge the write.
+
+        Returns the current feature with the update applied locally, and runs
+        the mutation in the background. Use it only where eventual
+        consistency is acceptable: if the write fails, the failure is logged
+        and the next read shows the unchanged feature.
+        """
+        current = self.get_feature(project_name, feature_id)
+        if not current:
+            raise ValueError("Feature not found")
+
+        fields = update.model_dump(exclude_unset=True)
+        self._mutation_in_background(project_name, "features:updateByFeatureId", {
+            "projectId": project_name,
+            "featureId": feature_id,
+            "fields": fields
+        })
+        return current.model_copy(update=fields)
+
     def delete_feature(self, project_name: str, feature_id: int) -> dict[str, Any]:
-        success = self.client.mutation("features:deleteByFeatureId", {
+        success = self._mutation(project_name, "features:deleteByFeatureId", {
             "projectId": project_name,
             "featureId": feature_id
         })
@@ -145,76 +244,61 @@ class ConvexBackend(BackendInterface):
         # We need a skip mutation or handle logic here?
         # Logic: move to bottom of priority.
         # Implemented 'skip' mutation in TS.
-        return self.client.mutation("features:skip", {
+        return self._mutation(project_name, "features:skip", {
             "projectId": project_name,
             "featureId": feature_id
         })
 
     def get_dependency_graph(self, project_name: str) -> DependencyGraphResponse:
-        # Fetch all
-        docs = self.client.query("features:list", {"projectId": project_name})
-        nodes = []
-        edges = []
-        
-        for doc in docs:
-            # Add node
-            status = "done" if doc["passes"] else "in_progress" if doc["in_progress"] else "pending"
-            nodes.append({
+        # Features come back grouped by status, with edges built server-side
+        result = self._query(project_name, "features:listWithGraph", {"projectId": project_name})
+        nodes = [
+            {
                 "id": doc["featureId"],
                 "label": f"{doc['featureId']}: {doc['name']}",
                 "status": status
-            })
-            
-            # Add edges
-            if doc.get("dependencies"):
-                for dep_id in doc["dependencies"]:
-                    edges.append({
-                        "from": dep_id,
-                        "to": doc["featureId"]
-                    })
-                    
-        return DependencyGraphResponse(nodes=nodes, edges=edges)
+            }
+            for status in ("pending", "in_progress", "done")
+            for doc in result[status]
+        ]
+        return DependencyGraphResponse(nodes=nodes, edges=result["edges"])
 
     def add_dependency(self, project_name: str, feature_id: int, dep_id: int) -> list[int]:
-        # 1. Get feature
-        feat = self.get_feature(project_name, feature_id)
-        if not feat:
-            raise ValueError("Feature not found")
-            
-        current_deps = feat.dependencies or []
-        if dep_id in current_deps:
-            return current_deps
-            
-        # 2. Check circular (simple check: if dep_id == feature_id)
-        # Full circular check requires graph traversal.
-        # SQLite implementation did a check.
-        # For MVP Convex, let's just add it.
-        # Better: Reuse the 'set_dependencies' logic?
-        
-        new_deps = current_deps + [dep_id]
-        
-        self.update_feature(project_name, feature_id, FeatureUpdate(dependencies=new_deps))
-        return new_deps
+        # Read-modify-write, including the circular check, happens server-side
+        return self._mutation(project_name, "features:addDependency", {
+            "projectId": project_name,
+            "featureId": feature_id,
+            "depId": dep_id
+        })
 
     def remove_dependency(self, project_name: str, feature_id: int, dep_id: int) -> list[int]:
-        feat = self.get_feature(project_name, feature_id)
-        if not feat:
-            raise ValueError("Feature not found")
-            
-        current_deps = feat.dependencies or []
-        if dep_id not in current_deps:
-            return current_deps
-            
-        new_deps = [d for d in current_deps if d != dep_id]
-        self.update_feature(project_name, feature_id, FeatureUpdate(dependencies=new_deps))
-        return new_deps
+        return self._mutation(project_name, "features:removeDependency", {
+            "projectId": project_name,
+            "featureId": feature_id,
+            "depId": dep_id
+        })
 
     def set_dependencies(self, project_name: str, feature_id: int, dep_ids: list[int]) -> list[int]:
-        self.update_feature(project_name, feature_id, FeatureUpdate(dependencies=dep_ids))
+        # Single known field, so skip the FeatureUpdate model round trip
+        self._mutation(project_name, "features:updateByFeatureId", {
+            "projectId": project_name,
+            "featureId": feature_id,
+            "fields": {"dependencies": dep_ids}
+        })
         return dep_ids
 
+    def snapshot(self, project_name: str) -> dict[str, Any]:
+        """Issue the snapshot reads concurrently; latency is that of the slowest one."""
+        futures = {
+            "features": self._executor.submit(self.list_features, project_name),
+            "schedules": self._executor.submit(self.list_schedules, project_name),
+            "dependency_graph": self._executor.submit(self.get_dependency_graph, project_name),
+            "context": self._executor.submit(self.get_context, project_name),
+        }
+        return {key: future.result() for key, future in futures.items()}
+
     def list_schedules(self, project_name: str) -> list[ScheduleResponse]:
-        docs = self.client.query("schedules:list", {"projectId": project_name})
+        docs = self._query(project_name, "schedules:list", {"projectId": project_name})
         return [self._schedule_from_convex(d) for d in docs]
 
     def create_schedule(self, project_name: str, schedule: ScheduleCreate) -> ScheduleResponse:
@@ -224,11 +308,11 @@ class ConvexBackend(BackendInterface):
         # Remove keys with None values (Convex requires optional fields to be missing, not null)
         args = {k: v for k, v in args.items() if v is not None}
         
-        doc = self.client.mutation("schedules:create", args)
+        doc = self._mutation(project_name, "schedules:create", args)
         return self._schedule_from_convex(doc)
 
     def get_schedule(self, project_name: str, schedule_id: int) -> ScheduleResponse | None:
-        doc = self.client.query("schedules:getByScheduleId", {
+        doc = self._query(project_name, "schedules:getByScheduleId", {
             "projectId": project_name,
             "scheduleId": schedule_id
         })
@@ -238,15 +322,33 @@ class ConvexBackend(BackendInterface):
 
     def update_schedule(self, project_name: str, schedule_id: int, update: ScheduleUpdate) -> ScheduleResponse:
         fields = update.model_dump(exclude_unset=True)
-        doc = self.client.mutation("schedules:updateByScheduleId", {
+        doc = self._mutation(project_name, "schedules:updateByScheduleId", {
             "projectId": project_name,
             "scheduleId": schedule_id,
             "fields": fields
         })
         return self._schedule_from_convex(doc)
 
+    def update_schedule_optimistic(self, project_name: str, schedule_id: int, update: ScheduleUpdate) -> ScheduleResponse:
+        """
+        Update a schedule without waiting for Convex to acknowledge the write.
+
+        Same contract as update_feature_optimistic.
+        """
+        current = self.get_schedule(project_name, schedule_id)
+        if not current:
+            raise ValueError("Schedule not found")
+
+        fields = update.model_dump(exclude_unset=True)
+        self._mutation_in_background(project_name, "schedules:updateByScheduleId", {
+            "projectId": project_name,
+            "scheduleId": schedule_id,
+            "fields": fields
+        })
+        return current.model_copy(update=fields)
+
     def delete_schedule(self, project_name: str, schedule_id: int) -> bool:
-        return self.client.mutation("schedules:deleteByScheduleId", {
+        return self._mutation(project_name, "schedules:deleteByScheduleId", {
             "projectId": project_name,
             "scheduleId": schedule_id
         })
@@ -256,20 +358,13 @@ class ConvexBackend(BackendInterface):
     # =========================================================================
     # Note: Convex backend also uses local files for metadata (for now)
 
-    def _get_project_dir(self, project_name: str):
-        """Get project directory path."""
-        from pathlib import Path
-        from server.utils.project_helpers import get_project_path
-        project_dir = get_project_path(project_name)
-        return Path(project_dir)
-
     def _get_metadata_path(self, project_name: str, filename: str):
         """Get path to metadata file."""
-        return self._get_project_dir(project_name) / ".xaheen" / filename
+        return get_project_xaheen_dir(project_name) / filename
 
     def _get_kb_dir(self, project_name: str):
         """Get knowledge base directory."""
-        return self._get_project_dir(project_name) / ".xaheen" / "kb"
+        return get_project_xaheen_dir(project_name) / "kb"
 
     def get_ideation(self, project_name: str) -> str:
         """Get ideation notes."""
@@ -285,34 +380,21 @@ class ConvexBackend(BackendInterface):
 
     def get_context(self, project_name: str) -> dict:
         """Get project context."""
-        import json
         path = self._get_metadata_path(project_name, "context.json")
         if not path.exists():
             return {}
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(path.read_bytes())
 
     def update_context(self, project_name: str, context: dict) -> dict:
         """Update project context."""
-        import json
         path = self._get_metadata_path(project_name, "context.json")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(context, indent=2), encoding="utf-8")
+        path.write_bytes(orjson.dumps(context, option=orjson.OPT_INDENT_2))
         return context
 
     def list_knowledge_items(self, project_name: str) -> list[dict]:
         """List knowledge base items."""
-        kb_dir = self._get_kb_dir(project_name)
-        if not kb_dir.exists():
-            return []
-        
-        items = []
-        for md_file in sorted(kb_dir.glob("*.md")):
-            items.append({
-                "filename": md_file.name,
-                "title": md_file.stem.replace("_", " ").replace("-", " ").title(),
-                "path": str(md_file),
-            })
-        return items
+        return list_knowledge_files(self._get_kb_dir(project_name))
 
     def get_knowledge_item(self, project_name: str, filename: str) -> str:
         """Get knowledge item."""
@@ -320,11 +402,17 @@ class ConvexBackend(BackendInterface):
         path = kb_dir / filename
         return path.read_text(encoding="utf-8") if path.exists() else ""
 
+    def get_knowledge_item_path(self, project_name: str, filename: str) -> Path | None:
+        """Get the on-disk path of a knowledge item, if it exists."""
+        path = self._get_kb_dir(project_name) / filename
+        return path if path.is_file() else None
+
     def save_knowledge_item(self, project_name: str, filename: str, content: str) -> bool:
         """Save knowledge item."""
         kb_dir = self._get_kb_dir(project_name)
         kb_dir.mkdir(parents=True, exist_ok=True)
         (kb_dir / filename).write_text(content, encoding="utf-8")
+        invalidate_knowledge_cache()
         return True
 
     def delete_knowledge_item(self, project_name: str, filename: str) -> bool:
@@ -333,21 +421,20 @@ class ConvexBackend(BackendInterface):
         path = kb_dir / filename
         if path.exists():
             path.unlink()
+            invalidate_knowledge_cache()
             return True
         return False
 
     def get_roadmap(self, project_name: str) -> dict:
         """Get project roadmap."""
-        import json
         path = self._get_metadata_path(project_name, "roadmap.json")
         if not path.exists():
             return {"phases": [], "milestones": [], "currentPhase": None}
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(path.read_bytes())
 
     def update_roadmap(self, project_name: str, roadmap: dict) -> dict:
         """Update project roadmap."""
-        import json
         path = self._get_metadata_path(project_name, "roadmap.json")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(roadmap, indent=2), encoding="utf-8")
+        path.write_bytes(orjson.dumps(roadmap, option=orjson.OPT_INDENT_2))
         return roadmap
@@ -6,38 +6,74 @@ Factory for creating backend instances based on configuration.
 """
 
 import os
-from typing import Optional
+import threading
+from typing import Annotated, ClassVar, Optional
+
+from fastapi import Depends
 
 from server.services.backend.interface import BackendInterface
 from server.services.backend.sqlite import SQLiteBackend
-# Lazy import convex/markdown to avoid hard dependencies if packages missing
-# but for now we import them directly as they are part of codebase.
-from server.services.backend.convex import ConvexBackend
-from server.services.backend.markdown import MarkdownBackend
 
 
 class BackendFactory:
-    _instance: Optional[BackendInterface] = None
+    _instance: ClassVar[Optional[BackendInterface]] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
 
     @classmethod
     def get_backend(cls) -> BackendInterface:
         """Get the configured backend instance (singleton)."""
-        if cls._instance is None:
-            backend_type = os.getenv("XAHEEN_BACKEND_TYPE", "sqlite").lower()
-            
-            if backend_type == "sqlite":
-                cls._instance = SQLiteBackend()
-            elif backend_type == "convex":
-                cls._instance = ConvexBackend()
-            elif backend_type == "markdown":
-                cls._instance = MarkdownBackend()
-            else:
-                # Default fallback or error? Strategy says Env controls it.
-                raise ValueError(f"Unknown backend type: {backend_type}")
-                
+        if cls._instance is not None:
+            return cls._instance
+
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls._create()
         return cls._instance
 
+    @classmethod
+    def _create(cls) -> BackendInterface:
+        """Build the backend selected by XAHEEN_BACKEND_TYPE."""
+        backend_type = os.getenv("XAHEEN_BACKEND_TYPE", "sqlite").lower()
+
+        # Convex and Markdown are imported on selection, so SQLite-only
+        # installs never load the convex client
+        if backend_type == "sqlite":
+            return SQLiteBackend()
+        elif backend_type == "convex":
+            from server.services.backend.convex import ConvexBackend
+            return ConvexBackend()
+        elif backend_type == "markdown":
+            from server.services.backend.markdown import MarkdownBackend
+            return MarkdownBackend()
+        else:
+            # Default fallback or error? Strategy says Env controls it.
+            raise ValueError(f"Unknown backend type: {backend_type}")
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the shared backend, if one was created (server shutdown)."""
+        with cls._lock:
+            instance, cls._instance = cls._instance, None
+        if instance is not None:
+            instance.close()
+
     @classmethod
     def reset(cls):
         """Reset the singleton instance (useful for tests)."""
-        cls._instance = None
+        with cls._lock:
+            cls._instance = None
+
+
+async def get_backend() -> BackendInterface:
+    """
+    FastAPI dependency resolving the configured backend.
+
+    Declared ``async`` so FastAPI resolves it inline on the event loop
+    instead of dispatching a threadpool hop to read the cached singleton.
+    Tests can swap the backend via ``app.dependency_overrides[get_backend]``.
+    """
+    return BackendFactory.get_backend()
+
+
+# Annotated alias so endpoints can declare ``backend: BackendDep``
+BackendDep = Annotated[BackendInterface, Depends(get_backend)]
@@ -6,6 +6,7 @@ Abstract base class for storage backends (SQLite, Convex, Markdown).
 """
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any, Literal
 
 from server.schemas import (
@@ -15,6 +16,7 @@ from server.schemas import (
     ScheduleCreate,
     ScheduleResponse,
     ScheduleUpdate,
+    DependencyBulkOp,
     DependencyGraphResponse,
     FeatureBulkCreate
 )
@@ -70,6 +72,26 @@ class BackendInterface(ABC):
         """Get the dependency graph for visualization."""
         pass
 
+    def close(self) -> None:
+        """
+        Release resources held by the backend (database engines, clients).
+        Called once at server shutdown; the default holds nothing to release.
+        """
+
+    def warm_up(self) -> None:
+        """
+        Open connections ahead of the first request.
+        Called once at server startup; the default has nothing to open.
+        """
+
+    def get_features_version(self, project_name: str) -> str | None:
+        """
+        Return a cheap token that changes whenever the project's features change.
+        Used as the basis for HTTP ETags; None means the backend can't tell,
+        and responses are always sent in full.
+        """
+        return None
+
     # =========================================================================
     # Dependencies
     # =========================================================================
@@ -89,6 +111,24 @@ class BackendInterface(ABC):
         """Set all dependencies for a feature. Returns updated list."""
         pass
 
+    def apply_dependency_ops(self, project_name: str, ops: list[DependencyBulkOp]) -> dict[int, list[int]]:
+        """
+        Apply a batch of dependency add/remove operations in order.
+        Returns {feature_id: updated dependency list} for every touched feature.
+
+        The default applies each op through add_dependency/remove_dependency,
+        one write per op and non-atomically: if an op fails, the ops before it
+        stay applied. Backends that don't override it (Convex) behave this
+        way; backends that can persist the batch in one write should override it.
+        """
+        updated: dict[int, list[int]] = {}
+        for op in ops:
+            if op.op == "add":
+                updated[op.feature_id] = self.add_dependency(project_name, op.feature_id, op.dep_id)
+            else:
+                updated[op.feature_id] = self.remove_dependency(project_name, op.feature_id, op.dep_id)
+        return updated
+
     # =========================================================================
     # Schedules
     # =========================================================================
@@ -152,6 +192,14 @@ class BackendInterface(ABC):
         """Get a knowledge item."""
         pass
 
+    def get_knowledge_item_path(self, project_name: str, filename: str) -> Path | None:
+        """
+        Return the file a knowledge item is stored in, so it can be served
+        without reading it into memory. None means the item doesn't exist or
+        isn't stored as a local file.
+        """
+        return None
+
     @abstractmethod
     def save_knowledge_item(self, project_name: str, filename: str, content: str) -> bool:
         """Save a knowledge item."""
@@ -171,3 +219,22 @@ class BackendInterface(ABC):
     def update_roadmap(self, project_name: str, roadmap: dict) -> dict:
         """Update project roadmap."""
         pass
+
+    # =========================================================================
+    # Aggregate Reads
+    # =========================================================================
+
+    def snapshot(self, project_name: str) -> dict[str, Any]:
+        """
+        Read a project's features, schedules, dependency graph and context together.
+        Returns {"features", "schedules", "dependency_graph", "context"}.
+
+        The default reads them one after another; backends whose reads are
+        network round trips should override it to issue them concurrently.
+        """
+        return {
+            "features": self.list_features(project_name),
+            "schedules": self.list_schedules(project_name),
+            "dependency_graph": self.get_dependency_graph(project_name),
+            "context": self.get_context(project_name),
+        }
@@ -13,11 +13,14 @@ from pathlib import Path
 from typing import Any, List, Optional, Dict
 from datetime import datetime
 
+import orjson
+
 from server.services.backend.interface import BackendInterface
+from server.utils.knowledge_cache import invalidate_knowledge_cache, list_knowledge_files
 from server.schemas import (
     FeatureCreate, FeatureResponse, FeatureUpdate,
     ScheduleCreate, ScheduleResponse, ScheduleUpdate,
-    DependencyGraphResponse, FeatureBulkCreate
+    DependencyBulkOp, DependencyGraphResponse, FeatureBulkCreate
 )
 try:
     from registry import get_project_path
@@ -29,6 +32,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Status of a feature that hasn't passed, indexed by its in_progress flag
+_OPEN_STATUS = ("pending", "in_progress")
+
 class MarkdownBackend(BackendInterface):
     """
     Markdown file-based implementation.
@@ -332,17 +338,25 @@ class MarkdownBackend(BackendInterface):
         features = self._read_features_list(project_name)
         nodes = []
         edges = []
+        nodes_append = nodes.append
+        edges_extend = edges.extend
         for f in features:
-            status = "done" if f.passes else "in_progress" if f.in_progress else "pending"
-            nodes.append({
-                "id": f.id,
-                "label": f"{f.id}: {f.name}",
-                "status": status
+            fid = f.id
+            nodes_append({
+                "id": fid,
+                "label": f"{fid}: {f.name}",
+                "status": "done" if f.passes else _OPEN_STATUS[f.in_progress]
             })
-            for dep in f.dependencies:
-                edges.append({"from": dep, "to": f.id})
+            edges_extend({"from": dep, "to": fid} for dep in f.dependencies)
         return DependencyGraphResponse(nodes=nodes, edges=edges)
-        
+
+    def get_features_version(self, project_name: str) -> str | None:
+        try:
+            st = self._get_features_file(project_name).stat()
+        except FileNotFoundError:
+            return "empty"
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
     def add_dependency(self, project_name: str, feature_id: int, dep_id: int) -> list[int]:
          # Simple read-modify-write
         features = self._read_features_list(project_name)
@@ -373,6 +387,25 @@ class MarkdownBackend(BackendInterface):
                 return f.dependencies
         raise ValueError("Feature not found")
 
+    def apply_dependency_ops(self, project_name: str, ops: list[DependencyBulkOp]) -> dict[int, list[int]]:
+        # One read-modify-write for the whole batch
+        features = self._read_features_list(project_name)
+        by_id = {f.id: f for f in features}
+        updated: dict[int, list[int]] = {}
+        for op in ops:
+            f = by_id.get(op.feature_id)
+            if f is None:
+                raise ValueError("Feature not found")
+            if op.op == "add":
+                if op.dep_id not in f.dependencies:
+                    f.dependencies.append(op.dep_id)
+            elif op.dep_id in f.dependencies:
+                f.dependencies.remove(op.dep_id)
+            updated[f.id] = f.dependencies
+        if updated:
+            self._save_features_list(project_name, features)
+        return updated
+
 
     # -------------------------------------------------------------------------
     # Schedule IO
@@ -482,30 +515,19 @@ class MarkdownBackend(BackendInterface):
         path = self._get_metadata_path(project_name, "context.json")
         if not path.exists():
             return {}
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(path.read_bytes())
 
     def update_context(self, project_name: str, context: dict) -> dict:
         """Update project context."""
         path = self._get_metadata_path(project_name, "context.json")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(context, indent=2), encoding="utf-8")
+        path.write_bytes(orjson.dumps(context, option=orjson.OPT_INDENT_2))
         return context
 
     # Knowledge Base
     def list_knowledge_items(self, project_name: str) -> list[dict]:
         """List knowledge base items."""
-        kb_dir = self._get_kb_dir(project_name)
-        if not kb_dir.exists():
-            return []
-        
-        items = []
-        for md_file in sorted(kb_dir.glob("*.md")):
-            items.append({
-                "filename": md_file.name,
-                "title": md_file.stem.replace("_", " ").replace("-", " ").title(),
-                "path": str(md_file),
-            })
-        return items
+        return list_knowledge_files(self._get_kb_dir(project_name))
 
     def get_knowledge_item(self, project_name: str, filename: str) -> str:
         """Get a specific knowledge item."""
@@ -513,11 +535,17 @@ class MarkdownBackend(BackendInterface):
         path = kb_dir / filename
         return path.read_text(encoding="utf-8") if path.exists() else ""
 
+    def get_knowledge_item_path(self, project_name: str, filename: str) -> Path | None:
+        """Get the on-disk path of a knowledge item, if it exists."""
+        path = self._get_kb_dir(project_name) / filename
+        return path if path.is_file() else None
+
     def save_knowledge_item(self, project_name: str, filename: str, content: str) -> bool:
         """Save a knowledge item."""
         kb_dir = self._get_kb_dir(project_name)
         kb_dir.mkdir(parents=True, exist_ok=True)
         (kb_dir / filename).write_text(content, encoding="utf-8")
+        invalidate_knowledge_cache()
         return True
 
     def delete_knowledge_item(self, project_name: str, filename: str) -> bool:
@@ -526,6 +554,7 @@ class MarkdownBackend(BackendInterface):
         path = kb_dir / filename
         if path.exists():
             path.unlink()
+            invalidate_knowledge_cache()
             return True
         return False
 
@@ -535,11 +564,11 @@ class MarkdownBackend(BackendInterface):
         path = self._get_metadata_path(project_name, "roadmap.json")
         if not path.exists():
             return {"phases": [], "milestones": [], "currentPhase": None}
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(path.read_bytes())
 
     def update_roadmap(self, project_name: str, roadmap: dict) -> dict:
         """Update project roadmap."""
         path = self._get_metadata_path(project_name, "roadmap.json")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(roadmap, indent=2), encoding="utf-8")
+        path.write_bytes(orjson.dumps(roadmap, option=orjson.OPT_INDENT_2))
         return roadmap
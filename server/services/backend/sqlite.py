@@ -7,13 +7,17 @@ Wraps existing logic from features.py and schedules.py.
 """
 
 import logging
+import os
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Any, Generator, Literal
 
+import orjson
 from sqlalchemy.orm import Session
 
-from api.database import Feature, Schedule, ScheduleOverride, create_database
+from api.database import Feature, Schedule, ScheduleOverride, create_database, dispose_engine, get_database_path
 from server.schemas import (
+    DependencyBulkOp,
     DependencyGraphEdge,
     DependencyGraphNode,
     DependencyGraphResponse,
@@ -26,7 +30,8 @@ from server.schemas import (
     ScheduleUpdate,
 )
 from server.services.backend.interface import BackendInterface
-from server.utils.project_helpers import get_project_path
+from server.utils.project_helpers import get_project_path, get_project_xaheen_dir
+from server.utils.knowledge_cache import invalidate_knowledge_cache, list_knowledge_files
 from server.utils.validation import validate_project_name
 
 logger = logging.getLogger(__name__)
@@ -35,6 +40,16 @@ logger = logging.getLogger(__name__)
 class SQLiteBackend(BackendInterface):
     """SQLite implementation of persistence layer."""
 
+    def __init__(self):
+        # Projects whose pooled engines this backend has used, for close()
+        self._project_dirs: set[Path] = set()
+
+    def close(self) -> None:
+        """Dispose the per-project engines and their connection pools."""
+        for project_dir in self._project_dirs:
+            dispose_engine(project_dir)
+        self._project_dirs.clear()
+
     @contextmanager
     def _get_session(self, project_name: str) -> Generator[Session, None, None]:
         """Get database session for a project."""
@@ -44,7 +59,10 @@ class SQLiteBackend(BackendInterface):
         if not project_dir or not project_dir.exists():
             raise ValueError(f"Project '{project_name}' not found")
 
+        # create_database returns the cached engine for the project, whose
+        # pool is shared by every request
         _, SessionLocal = create_database(project_dir)
+        self._project_dirs.add(project_dir)
         session = SessionLocal()
         try:
             yield session
@@ -268,6 +286,23 @@ class SQLiteBackend(BackendInterface):
             
             return DependencyGraphResponse(nodes=nodes, edges=edges)
 
+    def get_features_version(self, project_name: str) -> str | None:
+        """Version the features from the database file stats (plus the WAL, if any)."""
+        project_name = validate_project_name(project_name)
+        project_dir = get_project_path(project_name)
+        if not project_dir:
+            raise ValueError(f"Project '{project_name}' not found")
+
+        db_path = str(get_database_path(project_dir))
+        parts = []
+        for path in (db_path, db_path + "-wal"):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        return "-".join(parts) or None
+
     # =========================================================================
     # Dependencies
     # =========================================================================
@@ -349,6 +384,48 @@ class SQLiteBackend(BackendInterface):
             session.commit()
             return f.dependencies or []
 
+    def apply_dependency_ops(self, project_name: str, ops: list[DependencyBulkOp]) -> dict[int, list[int]]:
+        """Apply all ops against one loaded graph and commit them in a single transaction."""
+        from api.dependency_resolver import MAX_DEPENDENCIES_PER_FEATURE, would_create_circular_dependency
+
+        with self._get_session(project_name) as session:
+            features = {f.id: f for f in session.query(Feature).all()}
+            graph = {fid: {"id": fid, "dependencies": list(f.dependencies or [])} for fid, f in features.items()}
+            touched: set[int] = set()
+
+            for op in ops:
+                feature_id, dep_id = op.feature_id, op.dep_id
+                if feature_id not in features:
+                    raise ValueError(f"Feature {feature_id} not found")
+                current = graph[feature_id]["dependencies"]
+
+                if op.op == "add":
+                    if dep_id not in features:
+                        raise ValueError(f"Dependency {dep_id} not found")
+                    if feature_id == dep_id:
+                        raise ValueError("Cannot depend on self")
+                    if len(current) >= MAX_DEPENDENCIES_PER_FEATURE:
+                        raise ValueError(f"Max dependencies ({MAX_DEPENDENCIES_PER_FEATURE}) exceeded")
+                    if dep_id in current:
+                        raise ValueError("Dependency already exists")
+                    # Check cycles against the graph including earlier ops in this batch
+                    if would_create_circular_dependency(list(graph.values()), feature_id, dep_id):
+                        raise ValueError("Would create circular dependency")
+                    current.append(dep_id)
+                else:
+                    if dep_id not in current:
+                        raise ValueError("Dependency does not exist")
+                    current.remove(dep_id)
+
+                touched.add(feature_id)
+
+            for feature_id in touched:
+                deps = sorted(graph[feature_id]["dependencies"])
+                features[feature_id].dependencies = deps if deps else None
+            session.commit()
+
+            return {fid: sorted(graph[fid]["dependencies"]) for fid in touched}
+
     # =========================================================================
     # Schedules
     # =========================================================================
@@ -430,19 +507,14 @@ class SQLiteBackend(BackendInterface):
 
     def _get_metadata_path(self, project_name: str, filename: str):
         """Get path to metadata file."""
-        from pathlib import Path
-        project_dir = get_project_path(project_name)
-        return Path(project_dir) / ".xaheen" / filename
+        return get_project_xaheen_dir(project_name) / filename
 
     def _get_kb_dir(self, project_name: str):
         """Get knowledge base directory."""
-        from pathlib import Path
-        project_dir = get_project_path(project_name)
-        return Path(project_dir) / ".xaheen" / "kb"
+        return get_project_xaheen_dir(project_name) / "kb"
 
     def get_ideation(self, project_name: str) -> str:
         """Get ideation notes."""
-        import json
         path = self._get_metadata_path(project_name, "ideation.md")
         return path.read_text(encoding="utf-8") if path.exists() else ""
 
@@ -455,34 +527,21 @@ class SQLiteBackend(BackendInterface):
 
     def get_context(self, project_name: str) -> dict:
         """Get project context."""
-        import json
         path = self._get_metadata_path(project_name, "context.json")
         if not path.exists():
             return {}
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(path.read_bytes())
 
     def update_context(self, project_name: str, context: dict) -> dict:
         """Update project context."""
-        import json
         path = self._get_metadata_path(project_name, "context.json")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(context, indent=2), encoding="utf-8")
+        path.write_bytes(orjson.dumps(context, option=orjson.OPT_INDENT_2))
         return context
 
     def list_knowledge_items(self, project_name: str) -> list[dict]:
         """List knowledge base items."""
-        kb_dir = self._get_kb_dir(project_name)
-        if not kb_dir.exists():
-            return []
-        
-        items = []
-        for md_file in sorted(kb_dir.glob("*.md")):
-            items.append({
-                "filename": md_file.name,
-                "title": md_file.stem.replace("_", " ").replace("-", " ").title(),
-                "path": str(md_file),
-            })
-        return items
+        return list_knowledge_files(self._get_kb_dir(project_name))
 
     def get_knowledge_item(self, project_name: str, filename: str) -> str:
         """Get knowledge item."""
@@ -490,11 +549,17 @@ class SQLiteBackend(BackendInterface):
         path = kb_dir / filename
         return path.read_text(encoding="utf-8") if path.exists() else ""
 
+    def get_knowledge_item_path(self, project_name: str, filename: str) -> Path | None:
+        """Get the on-disk path of a knowledge item, if it exists."""
+        path = self._get_kb_dir(project_name) / filename
+        return path if path.is_file() else None
+
     def save_knowledge_item(self, project_name: str, filename: str, content: str) -> bool:
         """Save knowledge item."""
         kb_dir = self._get_kb_dir(project_name)
         kb_dir.mkdir(parents=True, exist_ok=True)
         (kb_dir / filename).write_text(content, encoding="utf-8")
+        invalidate_knowledge_cache()
         return True
 
     def delete_knowledge_item(self, project_name: str, filename: str) -> bool:
@@ -503,21 +568,20 @@ class SQLiteBackend(BackendInterface):
         path = kb_dir / filename
         if path.exists():
             path.unlink()
+            invalidate_knowledge_cache()
             return True
         return False
 
     def get_roadmap(self, project_name: str) -> dict:
         """Get project roadmap."""
-        import json
         path = self._get_metadata_path(project_name, "roadmap.json")
         if not path.exists():
             return {"phases": [], "milestones": [], "currentPhase": None}
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(path.read_bytes())
 
     def update_roadmap(self, project_name: str, roadmap: dict) -> dict:
         """Update project roadmap."""
-        import json
         path = self._get_metadata_path(project_name, "roadmap.json")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(roadmap, indent=2), encoding="utf-8")
+        path.write_bytes(orjson.dumps(roadmap, option=orjson.OPT_INDENT_2))
         return roadmap
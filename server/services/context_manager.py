@@ -6,11 +6,37 @@ Manages project-specific context including notes, codebase analysis, and configu
 """
 
 import json
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 
+# get_comprehensive_context results per project directory, as
+# (created_at, input signature, context). The signature catches edits to the
+# files the context is built from; the TTL bounds staleness for anything it
+# misses, such as tracked files changing without a new commit.
+_CONTEXT_CACHE_TTL = 300  # seconds
+_CONTEXT_CACHE_SIZE = 32
+_context_cache: Dict[str, Tuple[float, tuple, Dict]] = {}
+# Guards the replace-and-evict sequence, which callers on worker threads
+# would otherwise interleave (two evictions of the same oldest key)
+_context_cache_lock = threading.Lock()
+
+# Files under the project directory whose changes invalidate the cached context
+_CONTEXT_INPUTS = (
+    os.path.join('.claude', 'context', 'codebase_analysis.json'),
+    os.path.join('.claude', 'context', 'notes.md'),
+    'README.md', 'readme.md', 'README.txt',
+    'package.json', 'requirements.txt',
+    os.path.join('.git', 'HEAD'),
+    # Appended to on every commit, checkout and reset
+    os.path.join('.git', 'logs', 'HEAD'),
+)
+
+
 class ContextManager:
     """Manages project context data."""
     
@@ -195,10 +221,52 @@ class ContextManager:
         }
         return descriptions.get(filename, 'Project file')
     
+    def _context_signature(self) -> tuple:
+        """(mtime_ns, size) of every context input; None for missing files."""
+        sig = []
+        for rel in _CONTEXT_INPUTS:
+            try:
+                st = os.stat(os.path.join(self.project_dir, rel))
+            except OSError:
+                sig.append(None)
+            else:
+                sig.append((st.st_mtime_ns, st.st_size))
+        return tuple(sig)
+    
     def get_comprehensive_context(self) -> Dict:
         """
         Get comprehensive project context for AI generation.
         
+        Results are cached per project until one of the input files changes
+        or _CONTEXT_CACHE_TTL elapses. Each call returns a fresh top-level
+        dict, so callers may add keys to it.
+        
+        Returns:
+            Dictionary with comprehensive project context
+        """
+        key = str(self.project_dir)
+        cached = _context_cache.get(key)
+        if cached is not None:
+            created_at, signature, context = cached
+            if time.monotonic() - created_at < _CONTEXT_CACHE_TTL and signature == self._context_signature():
+                return dict(context)
+        
+        context = self._build_comprehensive_context()
+        
+        # Signature taken after building, so an analysis file written by the
+        # build itself doesn't invalidate the entry
+        entry = (time.monotonic(), self._context_signature(), context)
+        with _context_cache_lock:
+            _context_cache.pop(key, None)
+            if len(_context_cache) >= _CONTEXT_CACHE_SIZE:
+                del _context_cache[next(iter(_context_cache))]
+            _context_cache[key] = entry
+        return dict(context)
+    
+    def _build_comprehensive_context(self) -> Dict:
+        """
+        Build comprehensive project context for AI generation.
+        
         Gathers:
         - Project structure and languages
         - README content
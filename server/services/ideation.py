@@ -5,11 +5,19 @@ Ideation Manager Service
 Manages saved ideas with CRUD operations.
 """
 
+import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import List, Dict, Any
-import json
 from datetime import datetime, UTC
 
+import orjson
+
+from server.utils.json_cache import invalidate_json_cache, load_json_cached
+
+logger = logging.getLogger(__name__)
+
 
 class IdeationManager:
     """Manages project ideation and improvement suggestions."""
@@ -32,19 +40,49 @@ class IdeationManager:
         """
         Get all saved ideas.
         
+        The list is cached until ideas.json changes and is shared between
+        callers, so it must not be modified in place.
+        
         Returns:
             List of saved idea dictionaries
         """
+        try:
+            return load_json_cached(self.ideas_file).get('ideas', [])
+        except Exception:
+            return []
+    
+    def _load_ideas(self) -> List[Dict[str, Any]]:
+        """Read ideas.json uncached, for callers that modify the result."""
         if not self.ideas_file.exists():
             return []
         
         try:
-            with open(self.ideas_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.ideas_file, 'rb') as f:
+                data = orjson.loads(f.read())
                 return data.get('ideas', [])
         except Exception:
             return []
     
+    def _write_ideas(self, ideas: List[Dict[str, Any]]) -> None:
+        """
+        Replace ideas.json atomically and drop cached parses of it.
+        
+        The data goes to a uniquely named temp file in the same directory
+        that is then swapped in, so readers never see a partial file and
+        concurrent writers don't share a temp file.
+        """
+        data = orjson.dumps({'ideas': ideas}, option=orjson.OPT_INDENT_2)
+        f = tempfile.NamedTemporaryFile(dir=self.ideation_dir, prefix='ideas.', suffix='.json.tmp', delete=False)
+        try:
+            with f:
+                f.write(data)
+            os.replace(f.name, self.ideas_file)
+        except BaseException:
+            os.unlink(f.name)
+            raise
+        finally:
+            invalidate_json_cache()
+    
     def save_idea(self, idea: Dict[str, Any]) -> bool:
         """
         Save an idea.
@@ -57,7 +95,7 @@ class IdeationManager:
         """
         try:
             # Get existing ideas
-            ideas = self.get_saved_ideas()
+            ideas = self._load_ideas()
             
             # Mark as saved and add timestamp
             idea['saved'] = True
@@ -70,7 +108,7 @@ class IdeationManager:
             for existing in ideas:
                 # Check by ID
                 if existing.get('id') == idea.get('id'):
-                    print(f"⚠️  Skipping duplicate idea (same ID): {idea.get('title')}")
+                    logger.debug("Skipping duplicate idea (same ID): %s", idea.get('title'))
                     return True
                 
                 # Check by title and description similarity
@@ -78,21 +116,64 @@ class IdeationManager:
                 existing_desc = existing.get('description', '').lower().strip()
                 
                 if idea_title == existing_title and idea_desc == existing_desc:
-                    print(f"⚠️  Skipping duplicate idea (same content): {idea.get('title')}")
+                    logger.debug("Skipping duplicate idea (same content): %s", idea.get('title'))
                     return True
             
             # Add new idea
             ideas.append(idea)
             
             # Save to file
-            with open(self.ideas_file, 'w', encoding='utf-8') as f:
-                json.dump({'ideas': ideas}, f, indent=2)
+            self._write_ideas(ideas)
             
             return True
         except Exception as e:
-            print(f"Error saving idea: {e}")
+            logger.error("Error saving idea: %s", e)
             return False
     
+    def save_ideas(self, new_ideas: List[Dict[str, Any]]) -> int:
+        """
+        Save several ideas with a single read and a single write.
+        
+        Duplicates (same ID, or same title and description) of existing
+        ideas or of earlier ideas in the batch are skipped, as in save_idea.
+        
+        Args:
+            new_ideas: Idea dictionaries to save
+            
+        Returns:
+            Number of ideas added (0 if the write failed)
+        """
+        try:
+            ideas = self._load_ideas()
+            
+            seen_ids = {existing.get('id') for existing in ideas}
+            seen_content = {
+                (existing.get('title', '').lower().strip(), existing.get('description', '').lower().strip())
+                for existing in ideas
+            }
+            
+            saved_at = datetime.now(UTC).isoformat() + 'Z'
+            added = 0
+            for idea in new_ideas:
+                content = (idea.get('title', '').lower().strip(), idea.get('description', '').lower().strip())
+                if idea.get('id') in seen_ids or content in seen_content:
+                    continue
+                
+                idea['saved'] = True
+                idea['saved_at'] = saved_at
+                ideas.append(idea)
+                seen_ids.add(idea.get('id'))
+                seen_content.add(content)
+                added += 1
+            
+            if added:
+                self._write_ideas(ideas)
+            
+            return added
+        except Exception as e:
+            logger.error("Error saving ideas: %s", e)
+            return 0
+    
     def delete_idea(self, idea_id: str) -> bool:
         """
         Delete a saved idea.
@@ -104,15 +185,14 @@ class IdeationManager:
             True if successful
         """
         try:
-            ideas = self.get_saved_ideas()
+            ideas = self._load_ideas()
             ideas = [i for i in ideas if i['id'] != idea_id]
             
-            with open(self.ideas_file, 'w', encoding='utf-8') as f:
-                json.dump({'ideas': ideas}, f, indent=2)
+            self._write_ideas(ideas)
             
             return True
         except Exception as e:
-            print(f"Error deleting idea: {e}")
+            logger.error("Error deleting idea: %s", e)
             return False
     
     def update_idea(self, idea_id: str, updates: Dict[str, Any]) -> bool:
@@ -127,7 +207,7 @@ class IdeationManager:
             True if successful
         """
         try:
-            ideas = self.get_saved_ideas()
+            ideas = self._load_ideas()
             
             for idea in ideas:
                 if idea['id'] == idea_id:
@@ -135,12 +215,11 @@ class IdeationManager:
                     idea['updated_at'] = datetime.now(UTC).isoformat() + 'Z'
                     break
             
-            with open(self.ideas_file, 'w', encoding='utf-8') as f:
-                json.dump({'ideas': ideas}, f, indent=2)
+            self._write_ideas(ideas)
             
             return True
         except Exception as e:
-            print(f"Error updating idea: {e}")
+            logger.error("Error updating idea: %s", e)
             return False
     
     def get_idea_stats(self) -> Dict[str, Any]:
@@ -5,11 +5,19 @@ Roadmap Manager Service
 Manages AI-generated project roadmaps and feature tracking.
 """
 
+import csv
+import logging
+from io import StringIO
 from pathlib import Path
-from typing import List, Dict, Any
-import json
+from typing import Iterator, List, Dict, Any
 from datetime import datetime, UTC
 
+import orjson
+
+from server.utils.json_cache import invalidate_json_cache, load_json_cached
+
+logger = logging.getLogger(__name__)
+
 
 class RoadmapManager:
     """Manages project roadmap and feature planning."""
@@ -32,27 +40,36 @@ class RoadmapManager:
         """
         Get current roadmap.
         
+        The dictionary is cached until roadmap.json changes and is shared
+        between callers, so it must not be modified in place.
+        
         Returns:
             Roadmap dictionary with features and milestones
         """
+        try:
+            return load_json_cached(self.roadmap_file)
+        except Exception:
+            return self._empty_roadmap()
+    
+    @staticmethod
+    def _empty_roadmap() -> Dict[str, Any]:
+        return {
+            'features': [],
+            'milestones': [],
+            'generated_at': None,
+            'total_estimated_days': 0
+        }
+    
+    def _load_roadmap(self) -> Dict[str, Any]:
+        """Read roadmap.json uncached, for callers that modify the result."""
         if not self.roadmap_file.exists():
-            return {
-                'features': [],
-                'milestones': [],
-                'generated_at': None,
-                'total_estimated_days': 0
-            }
+            return self._empty_roadmap()
         
         try:
-            with open(self.roadmap_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.roadmap_file, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception:
-            return {
-                'features': [],
-                'milestones': [],
-                'generated_at': None,
-                'total_estimated_days': 0
-            }
+            return self._empty_roadmap()
     
     def save_roadmap(self, roadmap: Dict[str, Any]) -> bool:
         """
@@ -67,12 +84,16 @@ class RoadmapManager:
         try:
             roadmap['updated_at'] = datetime.now(UTC).isoformat() + 'Z'
             
-            with open(self.roadmap_file, 'w', encoding='utf-8') as f:
-                json.dump(roadmap, f, indent=2)
+            data = orjson.dumps(roadmap, option=orjson.OPT_INDENT_2)
+            try:
+                with open(self.roadmap_file, 'wb') as f:
+                    f.write(data)
+            finally:
+                invalidate_json_cache()
             
             return True
         except Exception as e:
-            print(f"Error saving roadmap: {e}")
+            logger.error("Error saving roadmap: %s", e)
             return False
     
     def update_feature_status(self, feature_id: str, status: str) -> bool:
@@ -87,7 +108,7 @@ class RoadmapManager:
             True if successful
         """
         try:
-            roadmap = self.get_roadmap()
+            roadmap = self._load_roadmap()
             
             for feature in roadmap.get('features', []):
                 if feature['id'] == feature_id:
@@ -97,7 +118,7 @@ class RoadmapManager:
             
             return self.save_roadmap(roadmap)
         except Exception as e:
-            print(f"Error updating feature status: {e}")
+            logger.error("Error updating feature status: %s", e)
             return False
     
     def update_feature(self, feature_id: str, updates: Dict[str, Any]) -> bool:
@@ -112,7 +133,7 @@ class RoadmapManager:
             True if successful
         """
         try:
-            roadmap = self.get_roadmap()
+            roadmap = self._load_roadmap()
             
             for feature in roadmap.get('features', []):
                 if feature['id'] == feature_id:
@@ -122,7 +143,7 @@ class RoadmapManager:
             
             return self.save_roadmap(roadmap)
         except Exception as e:
-            print(f"Error updating feature: {e}")
+            logger.error("Error updating feature: %s", e)
             return False
     
     def add_feature(self, feature: Dict[str, Any]) -> bool:
@@ -136,7 +157,7 @@ class RoadmapManager:
             True if successful
         """
         try:
-            roadmap = self.get_roadmap()
+            roadmap = self._load_roadmap()
             
             feature['created_at'] = datetime.now(UTC).isoformat() + 'Z'
             roadmap['features'].append(feature)
@@ -148,7 +169,7 @@ class RoadmapManager:
             
             return self.save_roadmap(roadmap)
         except Exception as e:
-            print(f"Error adding feature: {e}")
+            logger.error("Error adding feature: %s", e)
             return False
     
     def delete_feature(self, feature_id: str) -> bool:
@@ -162,7 +183,7 @@ class RoadmapManager:
             True if successful
         """
         try:
-            roadmap = self.get_roadmap()
+            roadmap = self._load_roadmap()
             
             roadmap['features'] = [
                 f for f in roadmap['features'] if f['id'] != feature_id
@@ -175,7 +196,7 @@ class RoadmapManager:
             
             return self.save_roadmap(roadmap)
         except Exception as e:
-            print(f"Error deleting feature: {e}")
+            logger.error("Error deleting feature: %s", e)
             return False
     
     def get_roadmap_stats(self) -> Dict[str, Any]:
@@ -223,23 +244,38 @@ class RoadmapManager:
         Returns:
             Formatted roadmap string
         """
+        return "".join(self.iter_export(format))
+    
+    def iter_export(self, format: str = 'markdown') -> Iterator[str]:
+        """
+        Export roadmap in specified format, as an iterator of text chunks.
+        
+        Unsupported formats raise before any chunk is produced, so callers
+        can still turn the error into a response.
+        
+        Args:
+            format: Export format ('markdown', 'json', 'csv')
+            
+        Returns:
+            Iterator over the formatted roadmap
+        """
         roadmap = self.get_roadmap()
         
         if format == 'json':
-            return json.dumps(roadmap, indent=2)
+            return iter((orjson.dumps(roadmap, option=orjson.OPT_INDENT_2).decode('utf-8'),))
         
         elif format == 'markdown':
-            return self._export_markdown(roadmap)
+            return self._iter_markdown(roadmap)
         
         elif format == 'csv':
-            return self._export_csv(roadmap)
+            return self._iter_csv(roadmap)
         
         else:
             raise ValueError(f"Unsupported format: {format}")
     
-    def _export_markdown(self, roadmap: Dict[str, Any]) -> str:
-        """Export roadmap as markdown."""
-        lines = [
+    def _iter_markdown(self, roadmap: Dict[str, Any]) -> Iterator[str]:
+        """Export roadmap as markdown, one section per chunk."""
+        yield "\n".join([
             "# Project Roadmap",
             "",
             f"Generated: {roadmap.get('generated_at', 'N/A')}",
@@ -247,14 +283,16 @@ class RoadmapManager:
             "",
             "## Milestones",
             ""
-        ]
+        ])
         
         for milestone in roadmap.get('milestones', []):
-            lines.append(f"### {milestone['name']} - {milestone['target_date']}")
-            lines.append(f"Features: {milestone['features']}")
-            lines.append("")
+            yield "\n" + "\n".join([
+                f"### {milestone['name']} - {milestone['target_date']}",
+                f"Features: {milestone['features']}",
+                ""
+            ])
         
-        lines.extend(["", "## Features", ""])
+        yield "\n" + "\n".join(["", "## Features", ""])
         
         for feature in roadmap.get('features', []):
             status_emoji = {
@@ -263,31 +301,35 @@ class RoadmapManager:
                 'completed': '✅'
             }.get(feature.get('status', 'planned'), '📋')
             
-            lines.append(f"### {status_emoji} {feature['title']}")
-            lines.append(f"**Status**: {feature.get('status', 'planned')}")
-            lines.append(f"**Priority**: {feature.get('priority', 'N/A')}")
-            lines.append(f"**Effort**: {feature.get('effort', 'N/A')}")
-            lines.append(f"**Estimated Days**: {feature.get('estimated_days', 0)}")
-            lines.append(f"**Milestone**: {feature.get('milestone', 'N/A')}")
-            lines.append("")
-            lines.append(feature.get('description', ''))
-            lines.append("")
-        
-        return "\n".join(lines)
+            yield "\n" + "\n".join([
+                f"### {status_emoji} {feature['title']}",
+                f"**Status**: {feature.get('status', 'planned')}",
+                f"**Priority**: {feature.get('priority', 'N/A')}",
+                f"**Effort**: {feature.get('effort', 'N/A')}",
+                f"**Estimated Days**: {feature.get('estimated_days', 0)}",
+                f"**Milestone**: {feature.get('milestone', 'N/A')}",
+                "",
+                feature.get('description', ''),
+                ""
+            ])
     
-    def _export_csv(self, roadmap: Dict[str, Any]) -> str:
-        """Export roadmap as CSV."""
-        import csv
-        from io import StringIO
-        
+    def _iter_csv(self, roadmap: Dict[str, Any]) -> Iterator[str]:
+        """Export roadmap as CSV, one row per chunk."""
         output = StringIO()
         writer = csv.writer(output)
         
+        def flush() -> str:
+            row = output.getvalue()
+            output.seek(0)
+            output.truncate()
+            return row
+        
         # Header
         writer.writerow([
             'ID', 'Title', 'Description', 'Status', 'Priority',
             'Effort', 'Estimated Days', 'Milestone'
         ])
+        yield flush()
         
         # Features
         for feature in roadmap.get('features', []):
@@ -301,5 +343,4 @@ class RoadmapManager:
                 feature.get('estimated_days', 0),
                 feature.get('milestone', '')
             ])
-        
-        return output.getvalue()
+            yield flush()
@@ -0,0 +1,47 @@
+"""
+Conditional GET Helpers
+=======================
+
+ETag construction and If-None-Match matching for read endpoints that the
+UI polls, so unchanged resources can be answered with 304 Not Modified.
+"""
+
+import hashlib
+import os
+
+from fastapi import Request
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check an If-None-Match header against etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def file_etag(kind: str, *paths: os.PathLike | str) -> str:
+    """
+    Build a strong ETag for a view derived from the given files.
+
+    The tag covers each file's inode, size and mtime (missing files count
+    too), so it changes whenever any of them is rewritten or replaced.
+
+    Args:
+        kind: Name of the view, so different views of the same files differ
+        *paths: Files the response is built from
+
+    Returns:
+        Quoted ETag value
+    """
+    parts = [kind]
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            parts.append("-")
+        else:
+            parts.append(f"{st.st_ino:x}.{st.st_size:x}.{st.st_mtime_ns:x}")
+    digest = hashlib.blake2b(":".join(parts).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
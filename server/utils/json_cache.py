@@ -0,0 +1,46 @@
+"""
+JSON File Cache
+===============
+
+Memoized JSON file reads for the ideation and roadmap services, whose read
+endpoints are polled by the UI and would otherwise re-parse unchanged files.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+@lru_cache(maxsize=128)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    with open(path_str, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def load_json_cached(path: Path) -> Any:
+    """Parse the JSON file at *path*, reusing the result while the file is unchanged.
+
+    Entries are keyed by ``(path, st_mtime_ns, st_size)``, so edits made by
+    other processes are picked up on the next call.
+
+    The returned object is shared between callers and must not be mutated;
+    read the file directly when the data will be modified.
+
+    Raises:
+        OSError: If the file can't be stat'ed or read.
+        ValueError: If the file isn't valid JSON.
+    """
+    st = os.stat(path)
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def invalidate_json_cache() -> None:
+    """Forget all cached parses.
+
+    Call after writing a cached file: two writes within one filesystem
+    timestamp tick can leave the mtime and size unchanged.
+    """
+    _load_json_cached.cache_clear()
@@ -0,0 +1,55 @@
+"""
+Knowledge Base Listing Cache
+============================
+
+Memoized knowledge base directory listings, shared by the storage backends.
+The knowledge list endpoint is polled by the UI and would otherwise rescan
+an unchanged directory on every request.
+"""
+
+import os
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+
+
+@lru_cache(maxsize=128)
+def _list_markdown_cached(dir_str: str, mtime_ns: int) -> tuple[dict, ...]:
+    with os.scandir(dir_str) as entries:
+        md_entries = sorted(
+            (e for e in entries if e.name.endswith(".md")),
+            key=attrgetter("name"),
+        )
+    return tuple(
+        {
+            "filename": e.name,
+            "title": e.name[:-3].replace("_", " ").replace("-", " ").title(),
+            "path": e.path,
+        }
+        for e in md_entries
+    )
+
+
+def list_knowledge_files(kb_dir: Path) -> list[dict]:
+    """List the ``*.md`` files in *kb_dir*, sorted by filename.
+
+    Listings are keyed by ``(directory, st_mtime_ns)``, so files added or
+    removed by other processes are picked up on the next call. A missing
+    directory lists as empty.
+
+    The item dicts are shared between callers and must not be mutated.
+    """
+    try:
+        mtime_ns = os.stat(kb_dir).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return list(_list_markdown_cached(str(kb_dir), mtime_ns))
+
+
+def invalidate_knowledge_cache() -> None:
+    """Forget all cached listings.
+
+    Call after adding or removing a knowledge file: two changes within one
+    filesystem timestamp tick can leave the directory mtime unchanged.
+    """
+    _list_markdown_cached.cache_clear()
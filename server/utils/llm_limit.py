@@ -0,0 +1,14 @@
+"""
+LLM Call Limit
+==============
+
+Process-wide cap on concurrent LLM calls, shared by every endpoint that
+generates with the AI assistant.
+"""
+
+import asyncio
+import os
+
+# Caps concurrent LLM calls so a burst of generate requests can't pile up
+# provider sessions and worker threads; excess requests queue.
+LLM_SEMAPHORE = asyncio.Semaphore(int(os.getenv("XAHEEN_MAX_LLM_CALLS", "8")))
@@ -6,9 +6,13 @@ Shared project path lookup used across all server routers and websocket handlers
 Consolidates the previously duplicated _get_project_path() function.
 """
 
+import os
 import sys
+import time
 from pathlib import Path
 
+from fastapi import HTTPException
+
 # Ensure the project root is on sys.path so `registry` can be imported.
 # This is necessary because `registry.py` lives at the repository root,
 # outside the `server` package.
@@ -16,12 +20,29 @@ _root = Path(__file__).parent.parent.parent
 if str(_root) not in sys.path:
     sys.path.insert(0, str(_root))
 
+import xaheen_paths
 from registry import get_project_path as _registry_get_project_path
 
+from .validation import validate_project_name
+
+# Registry lookups are memoized per server process. Only hits are cached, so
+# projects registered by another process (e.g. the CLI) are still picked up.
+_project_path_cache: dict[str, Path] = {}
+_xaheen_dir_cache: dict[str, Path] = {}
+
+# Directories confirmed to exist, as name -> (time bucket, path). A hit in the
+# current bucket skips the isdir stat; misses are never cached, so a newly
+# created project is visible immediately.
+_DIR_CHECK_TTL = 5  # seconds
+_dir_check_cache: dict[str, tuple[int, Path]] = {}
+
 
 def get_project_path(project_name: str) -> Path | None:
     """Look up a project's filesystem path from the global registry.
 
+    Results are cached; call :func:`invalidate_project_path` after changing
+    a project's registry entry.
+
     Args:
         project_name: The registered name of the project.
 
@@ -29,4 +50,71 @@ def get_project_path(project_name: str) -> Path | None:
         The resolved ``Path`` to the project directory, or ``None`` if the
         project is not found in the registry.
     """
-    return _registry_get_project_path(project_name)
+    path = _project_path_cache.get(project_name)
+    if path is None:
+        path = _registry_get_project_path(project_name)
+        if path is not None:
+            _project_path_cache[project_name] = path
+    return path
+
+
+def get_project_xaheen_dir(project_name: str) -> Path:
+    """Return the ``.xaheen`` metadata directory of a registered project.
+
+    The by-name counterpart of ``xaheen_paths.get_xaheen_dir``, which takes
+    the project directory. Cached alongside :func:`get_project_path` and
+    dropped by :func:`invalidate_project_path`.
+
+    Raises:
+        ValueError: If the project is not found in the registry.
+    """
+    path = _xaheen_dir_cache.get(project_name)
+    if path is None:
+        project_dir = get_project_path(project_name)
+        if project_dir is None:
+            raise ValueError(f"Project '{project_name}' not found")
+        path = xaheen_paths.get_xaheen_dir(Path(project_dir))
+        _xaheen_dir_cache[project_name] = path
+    return path
+
+
+def invalidate_project_path(project_name: str | None = None) -> None:
+    """Drop the cached paths for *project_name*, or the whole cache if ``None``."""
+    if project_name is None:
+        _project_path_cache.clear()
+        _xaheen_dir_cache.clear()
+        _dir_check_cache.clear()
+    else:
+        _project_path_cache.pop(project_name, None)
+        _xaheen_dir_cache.pop(project_name, None)
+        _dir_check_cache.pop(project_name, None)
+
+
+def resolve_project_dir(project_name: str) -> Path:
+    """Validate *project_name* and return its existing project directory.
+
+    Intended for use as a FastAPI dependency (``Depends(resolve_project_dir)``)
+    on routes with a ``{project_name}`` path parameter, replacing the
+    validate / look up / check-exists boilerplate in each handler.
+
+    A directory found to exist is trusted for up to ``_DIR_CHECK_TTL``
+    seconds; :func:`invalidate_project_path` drops it early.
+
+    Raises:
+        HTTPException: 400 if the name is invalid, 404 if the project is not
+            registered or its directory no longer exists.
+    """
+    project_name = validate_project_name(project_name)
+
+    bucket = int(time.monotonic() // _DIR_CHECK_TTL)
+    cached = _dir_check_cache.get(project_name)
+    if cached is not None and cached[0] == bucket:
+        return cached[1]
+
+    project_dir = get_project_path(project_name)
+
+    if not project_dir or not os.path.isdir(project_dir):
+        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found")
+
+    _dir_check_cache[project_name] = (bucket, project_dir)
+    return project_dir
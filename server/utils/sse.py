@@ -1,76 +1,85 @@
 """
 Server-Sent Events (SSE) utilities for streaming progress updates.
+
+Messages are returned as pre-encoded ``bytes`` so ``StreamingResponse``
+can write them without a per-chunk ``str.encode()``.
 """
 
-from typing import Generator, Dict, Any
-import json
+from typing import Dict, Any
+
+import orjson
+
+_DATA_SUFFIX = b"\n\n"
 
+# Pre-encoded "event: ...\ndata: " headers for the fixed event types
+_PROGRESS_PREFIX = b"event: progress\ndata: "
+_COMPLETE_PREFIX = b"event: complete\ndata: "
+_ERROR_PREFIX = b"event: error\ndata: "
 
-def sse_message(data: Dict[str, Any], event: str = "message") -> str:
+
+def sse_message(data: Dict[str, Any], event: str = "message") -> bytes:
     """
     Format data as Server-Sent Event message.
-    
+
     Args:
         data: Dictionary to send as JSON
         event: Event type name
-        
+
     Returns:
-        Formatted SSE message string
+        Formatted SSE message bytes
     """
-    msg = f"event: {event}\n"
-    msg += f"data: {json.dumps(data)}\n\n"
-    return msg
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + orjson.dumps(data) + _DATA_SUFFIX
 
 
-def progress_event(stage: str, progress: int, message: str, thought: str = "") -> str:
+def progress_event(stage: str, progress: int, message: str, thought: str = "") -> bytes:
     """
     Create a progress update SSE message.
-    
+
     Args:
         stage: Current stage name
         progress: Progress percentage (0-100)
         message: Progress message
         thought: Optional AI thought/insight
-        
+
     Returns:
         Formatted SSE message
     """
-    return sse_message({
+    return _PROGRESS_PREFIX + orjson.dumps({
         "stage": stage,
         "progress": progress,
         "message": message,
         "thought": thought
-    }, event="progress")
+    }) + _DATA_SUFFIX
 
 
-def complete_event(result: Any) -> str:
+def complete_event(result: Any) -> bytes:
     """
     Create a completion SSE message.
-    
+
     Args:
         result: Final result data
-        
+
     Returns:
         Formatted SSE message
     """
-    return sse_message({
+    return _COMPLETE_PREFIX + orjson.dumps({
         "stage": "complete",
         "progress": 100,
         "result": result
-    }, event="complete")
+    }) + _DATA_SUFFIX
 
 
-def error_event(error: str) -> str:
+def error_event(error: str) -> bytes:
     """
     Create an error SSE message.
-    
+
     Args:
         error: Error message
-        
+
     Returns:
         Formatted SSE message
     """
-    return sse_message({
+    return _ERROR_PREFIX + orjson.dumps({
         "stage": "error",
         "error": error
-    }, event="error")
+    }) + _DATA_SUFFIX
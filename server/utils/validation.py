@@ -11,12 +11,17 @@ Two variants are provided:
   suitable for REST endpoint handlers.
 """
 
-import re
+import sys
+from pathlib import Path
 
 from fastapi import HTTPException
 
-# Compiled once; reused by both variants.
-_PROJECT_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]{1,50}$')
+# Import the name pattern from registry (single source of truth)
+_root = Path(__file__).parent.parent.parent
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+
+from registry import PROJECT_NAME_RE as _PROJECT_NAME_RE
 
 
 def is_valid_project_name(name: str) -> bool:
@@ -30,11 +30,9 @@ async def test_rename():
     
     # Cleanup previous runs
     print("Cleaning up previous runs...")
-    from server.routers.projects import _get_registry_functions, _init_imports
-    _init_imports()
-    (_, unregister_project, _, _, _, _, _, _) = _get_registry_functions()
-    unregister_project(src_name)
-    unregister_project(dst_name)
+    from server.routers import projects as projects_router
+    projects_router.unregister_project(src_name)
+    projects_router.unregister_project(dst_name)
 
     if src_path.exists(): shutil.rmtree(src_path)
     if dst_path.exists(): shutil.rmtree(dst_path)
@@ -42,7 +40,7 @@ async def test_rename():
     # 2. Create Project
     print(f"Creating project: {src_name}")
     try:
-        await create_project(ProjectCreate(name=src_name, path=str(src_path)))
+        create_project(ProjectCreate(name=src_name, path=str(src_path)))
         
         from api.database import create_database, dispose_engine, get_database_url
         create_database(src_path)
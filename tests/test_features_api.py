@@ -0,0 +1,135 @@
+"""
+E2E Tests for Features API
+==========================
+
+Tests the features router against a real SQLite backend in a temporary
+project directory.
+"""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Set environment variable to allow test client connections
+os.environ["XAHEEN_ALLOW_REMOTE"] = "1"
+
+from server.main import app
+from server.services.backend import factory
+from server.services.backend import sqlite as sqlite_backend
+from server.services.backend.sqlite import SQLiteBackend
+
+client = TestClient(app)
+
+PROJECT = "features-api-test"
+BASE = f"/api/projects/{PROJECT}/features"
+
+
+@pytest.fixture(autouse=True)
+def backend(tmp_path, monkeypatch):
+    """Serve the router from a SQLiteBackend whose project lives in tmp_path."""
+    monkeypatch.setattr(sqlite_backend, "get_project_path", lambda name: tmp_path)
+    backend = SQLiteBackend()
+    app.dependency_overrides[factory.get_backend] = lambda: backend
+    yield backend
+    app.dependency_overrides.pop(factory.get_backend, None)
+    backend.close()
+
+
+def _create_features(count: int) -> list[int]:
+    """Create count features and return their IDs."""
+    response = client.post(f"{BASE}/bulk", json={
+        "features": [
+            {"category": "core", "name": f"Feature {i}", "description": "", "steps": []}
+            for i in range(count)
+        ]
+    })
+    assert response.status_code == 200
+    return [f["id"] for f in response.json()["features"]]
+
+
+def _dependencies() -> dict[int, list[int]]:
+    """Current dependency lists, read back through the API."""
+    features = client.get(BASE).json()
+    return {
+        f["id"]: f["dependencies"]
+        for status in ("pending", "in_progress", "done")
+        for f in features[status]
+    }
+
+
+def test_bulk_dependencies_mixed_ops():
+    """Adds and removes in one batch are applied in order."""
+    a, b, c = _create_features(3)
+    response = client.post(f"{BASE}/dependencies/bulk", json={"ops": [
+        {"feature_id": c, "dep_id": a, "op": "add"},
+    ]})
+    assert response.status_code == 200
+
+    response = client.post(f"{BASE}/dependencies/bulk", json={"ops": [
+        {"feature_id": b, "dep_id": a, "op": "add"},
+        {"feature_id": c, "dep_id": b, "op": "add"},
+        {"feature_id": c, "dep_id": a, "op": "remove"},
+    ]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["dependencies"] == {str(b): [a], str(c): [b]}
+    assert _dependencies() == {a: [], b: [a], c: [b]}
+
+
+@pytest.mark.parametrize("make_ops", [
+    # Second op closes the cycle a -> b -> a
+    lambda a, b: [
+        {"feature_id": b, "dep_id": a, "op": "add"},
+        {"feature_id": a, "dep_id": b, "op": "add"},
+    ],
+    lambda a, b: [
+        {"feature_id": b, "dep_id": a, "op": "add"},
+        {"feature_id": a, "dep_id": a, "op": "add"},
+    ],
+], ids=["cycle", "self"])
+def test_bulk_dependencies_rejects_whole_batch(make_ops):
+    """A cycle or self-dependency anywhere in the batch persists nothing."""
+    a, b = _create_features(2)
+
+    response = client.post(f"{BASE}/dependencies/bulk", json={"ops": make_ops(a, b)})
+
+    assert response.status_code == 400
+    assert _dependencies() == {a: [], b: []}
+
+
+def test_bulk_dependencies_unknown_feature():
+    """An op on a feature that doesn't exist is a 404 and persists nothing."""
+    a, b = _create_features(2)
+
+    response = client.post(f"{BASE}/dependencies/bulk", json={"ops": [
+        {"feature_id": b, "dep_id": a, "op": "add"},
+        {"feature_id": 999, "dep_id": a, "op": "add"},
+    ]})
+
+    assert response.status_code == 404
+    assert _dependencies() == {a: [], b: []}
+
+
+def test_list_features_conditional_get():
+    """A matching If-None-Match gets 304 until a feature is written."""
+    (feature_id,) = _create_features(1)
+
+    first = client.get(BASE)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = client.get(BASE, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+    # The ETag derives from the database and WAL file stats, so a write must change it
+    response = client.patch(f"{BASE}/{feature_id}", json={"name": "Renamed"})
+    assert response.status_code == 200
+
+    after = client.get(BASE, headers={"If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.headers["ETag"] != etag
+    assert after.json()["pending"][0]["name"] == "Renamed"
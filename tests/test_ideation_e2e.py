@@ -13,6 +13,7 @@ from fastapi.testclient import TestClient
 os.environ["XAHEEN_ALLOW_REMOTE"] = "1"
 
 from server.main import app
+from server.routers.projects import _resolve_project_dir
 
 client = TestClient(app)
 
@@ -176,11 +177,18 @@ def test_invalid_project(test_project_name):
     assert response.status_code == 404
 
 
-def test_save_invalid_idea(test_project_name):
+def test_save_invalid_idea(test_project_name, tmp_path):
     """Test saving idea with invalid data."""
-    response = client.post(
-        f"/api/projects/{test_project_name}/ideation/ideas",
-        json={"idea": {}}  # Missing required fields
-    )
+    # The project directory is resolved before the body is validated, so
+    # point it at a real directory to reach validation regardless of what
+    # is registered on this machine
+    app.dependency_overrides[_resolve_project_dir] = lambda: tmp_path
+    try:
+        response = client.post(
+            f"/api/projects/{test_project_name}/ideation/ideas",
+            json={"idea": {}}  # Missing required fields
+        )
+    finally:
+        app.dependency_overrides.pop(_resolve_project_dir, None)
     # Should fail validation
     assert response.status_code in [400, 422]
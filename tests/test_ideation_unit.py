@@ -74,6 +74,24 @@ def test_save_duplicate_idea(ideation_manager, sample_idea):
     assert len(ideas) == 1
 
 
+def test_save_ideas_bulk(ideation_manager, sample_idea):
+    """Test saving several ideas in one call, skipping duplicates."""
+    ideation_manager.save_idea(sample_idea)
+    
+    batch = [
+        dict(sample_idea),  # duplicate of an existing idea
+        {'id': 'idea_2', 'title': 'Add caching', 'description': 'Cache API responses'},
+        {'id': 'idea_3', 'title': 'Add caching', 'description': 'Cache API responses'},  # duplicate within batch
+        {'id': 'idea_4', 'title': 'Dark mode', 'description': 'Add a dark theme'},
+    ]
+    added = ideation_manager.save_ideas(batch)
+    assert added == 2
+    
+    ideas = ideation_manager.get_saved_ideas()
+    assert [i['id'] for i in ideas] == [sample_idea['id'], 'idea_2', 'idea_4']
+    assert all(i['saved'] is True and 'saved_at' in i for i in ideas)
+
+
 def test_delete_idea(ideation_manager, sample_idea):
     """Test deleting an idea."""
     ideation_manager.save_idea(sample_idea)
@@ -174,3 +192,26 @@ def test_ideas_persistence(temp_project_dir, sample_idea):
     
     assert len(ideas) == 1
     assert ideas[0]['id'] == sample_idea['id']
+
+
+def test_get_saved_ideas_sees_external_writes(ideation_manager, sample_idea):
+    """Test that cached reads pick up edits made outside the manager."""
+    ideation_manager.save_idea(sample_idea)
+    assert len(ideation_manager.get_saved_ideas()) == 1
+    
+    ideation_manager.ideas_file.write_text(json.dumps({'ideas': []}), encoding='utf-8')
+    assert ideation_manager.get_saved_ideas() == []
+
+
+def test_failed_write_keeps_existing_ideas(ideation_manager, sample_idea, monkeypatch):
+    """Test that a write that fails leaves ideas.json intact and no temp files behind."""
+    ideation_manager.save_idea(sample_idea)
+    
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr('server.services.ideation.os.replace', fail_replace)
+    assert ideation_manager.delete_idea(sample_idea['id']) is False
+    
+    assert [i['id'] for i in ideation_manager.get_saved_ideas()] == [sample_idea['id']]
+    assert [p.name for p in ideation_manager.ideation_dir.iterdir()] == ['ideas.json']
@@ -117,10 +117,8 @@ def test_export_roadmap_markdown(test_project_name):
     )
     
     assert response.status_code == 200
-    data = response.json()
-    assert data["success"] is True
-    assert data["format"] == "markdown"
-    assert "# Project Roadmap" in data["content"]
+    assert response.headers["content-type"].startswith("text/markdown")
+    assert "# Project Roadmap" in response.text
 
 
 def test_export_roadmap_json(test_project_name):
@@ -134,13 +132,9 @@ def test_export_roadmap_json(test_project_name):
     )
     
     assert response.status_code == 200
-    data = response.json()
-    assert data["success"] is True
-    assert data["format"] == "json"
     
     # Verify JSON content is valid
-    import json
-    roadmap = json.loads(data["content"])
+    roadmap = response.json()
     assert "features" in roadmap
 
 
@@ -155,10 +149,8 @@ def test_export_roadmap_csv(test_project_name):
     )
     
     assert response.status_code == 200
-    data = response.json()
-    assert data["success"] is True
-    assert data["format"] == "csv"
-    assert "ID,Title,Description" in data["content"]
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "ID,Title,Description" in response.text
 
 
 def test_get_roadmap_stats(test_project_name):
@@ -217,7 +209,7 @@ def test_complete_roadmap_workflow(test_project_name):
         f"/api/projects/{test_project_name}/roadmap/export?format=markdown"
     )
     assert export_response.status_code == 200
-    assert "Completed Feature" in export_response.json()["content"]
+    assert "Completed Feature" in export_response.text
 
 
 def test_invalid_project(test_project_name):
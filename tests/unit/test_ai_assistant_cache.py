@@ -0,0 +1,129 @@
+"""
+Unit Tests for the AI Response Cache
+====================================
+
+Tests when AIAssistant._call_ai stores and reuses API responses.
+"""
+
+import orjson
+import pytest
+
+from server.services import ai_assistant
+from server.services.ai_assistant import AIAssistant
+
+
+def _ideas(count: int) -> list[dict]:
+    return [{"title": f"Idea {i}", "description": f"Description {i}"} for i in range(count)]
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    """Configured assistant whose HTTP calls are answered by a fake API."""
+    monkeypatch.setattr(ai_assistant, "get_config_dir", lambda: tmp_path)
+    monkeypatch.setattr(ai_assistant, "get_effective_sdk_env", lambda: {
+        "ANTHROPIC_API_KEY": "test-key",
+        "ANTHROPIC_BASE_URL": "http://ai.test",
+    })
+    monkeypatch.delenv("XAHEEN_AI_CACHE", raising=False)
+    monkeypatch.delenv("XAHEEN_AI_NOCACHE", raising=False)
+    AIAssistant.reload_config()
+
+    class FakeAPI:
+        calls = 0
+        text = orjson.dumps(_ideas(6)).decode()
+        stop_reason = "end_turn"
+
+        def post(self, url, body, headers, timeout=60, on_line=None):
+            self.calls += 1
+            return 200, orjson.dumps({
+                "content": [{"type": "text", "text": self.text}],
+                "stop_reason": self.stop_reason,
+            })
+
+    fake = FakeAPI()
+    monkeypatch.setattr(ai_assistant, "_http_post", fake.post)
+    yield fake
+    AIAssistant.reload_config()
+
+
+@pytest.fixture
+def cache_on(monkeypatch):
+    monkeypatch.setenv("XAHEEN_AI_CACHE", "1")
+
+
+def test_cache_off_by_default(api):
+    """Without XAHEEN_AI_CACHE every call reaches the API."""
+    ai = AIAssistant()
+    assert ai._call_ai("prompt") == ai._call_ai("prompt")
+    assert api.calls == 2
+
+
+def test_cache_hit(api, cache_on):
+    ai = AIAssistant()
+    first = ai._call_ai("prompt")
+    assert ai._call_ai("prompt") == first
+    assert api.calls == 1
+
+
+def test_cache_miss_on_different_request(api, cache_on):
+    ai = AIAssistant()
+    ai._call_ai("prompt")
+    ai._call_ai("other prompt")
+    ai._call_ai("prompt", max_tokens=100)
+    assert api.calls == 3
+
+
+def test_cache_entries_expire(api, cache_on, monkeypatch):
+    monkeypatch.setattr(ai_assistant, "_AI_CACHE_TTL", -1)
+    ai = AIAssistant()
+    ai._call_ai("prompt")
+    ai._call_ai("prompt")
+    assert api.calls == 2
+
+
+def test_nocache_overrides_cache(api, cache_on, monkeypatch):
+    monkeypatch.setenv("XAHEEN_AI_NOCACHE", "1")
+    ai = AIAssistant()
+    ai._call_ai("prompt")
+    ai._call_ai("prompt")
+    assert api.calls == 2
+
+
+def test_rejected_response_not_cached(api, cache_on):
+    """A response the validator rejects is fetched again next time."""
+    ai = AIAssistant()
+    ai._call_ai("prompt", validate=lambda text: False)
+    ai._call_ai("prompt", validate=lambda text: False)
+    assert api.calls == 2
+
+
+def test_too_few_ideas_not_cached(api, cache_on):
+    """generate_ideas' own acceptance check gates the cache."""
+    api.text = orjson.dumps(_ideas(2)).decode()
+    ai = AIAssistant()
+    ai.generate_ideas({"project_name": "demo"})
+    ai.generate_ideas({"project_name": "demo"})
+    assert api.calls == 2
+
+    api.text = orjson.dumps(_ideas(6)).decode()
+    ideas = ai.generate_ideas({"project_name": "demo"})
+    assert [i["title"] for i in ai.generate_ideas({"project_name": "demo"})] == [i["title"] for i in ideas]
+    assert api.calls == 3
+
+
+def test_truncated_response_not_cached(api, cache_on):
+    api.stop_reason = "max_tokens"
+    ai = AIAssistant()
+    ai._call_ai("prompt")
+    ai._call_ai("prompt")
+    assert api.calls == 2
+
+
+def test_streaming_cache_hit_reports_progress(api, cache_on):
+    progress = []
+    ai = AIAssistant(progress_callback=lambda stage, pct, msg: progress.append(pct))
+    # Seed the cache through the non-streaming path
+    ai._call_ai("prompt")
+    ai._call_ai("prompt", stream=True)
+    assert api.calls == 1
+    assert progress == [89]
@@ -0,0 +1,87 @@
+"""
+Unit Tests for AIAssistant.run_all
+==================================
+
+Tests that run_all issues its three AI calls concurrently, returns each
+result under its own key, and keeps the other results when one call fails.
+"""
+
+import threading
+
+import orjson
+import pytest
+
+from server.services import ai_assistant
+from server.services.ai_assistant import AIAssistant
+
+ANALYSIS = {"total_files": 3, "languages": ["python"], "dependencies": []}
+CONTEXT = {"project_name": "demo"}
+
+RESPONSES = {
+    ai_assistant._ANALYZE_SYSTEM: {"assessment": "AI assessment", "strengths": [], "improvements": [], "next_steps": []},
+    ai_assistant._IDEAS_SYSTEM: [{"title": f"AI idea {i}", "description": ""} for i in range(5)],
+    ai_assistant._ROADMAP_SYSTEM: {
+        "milestones": [{"quarter": "Q1 2026", "features": [{"title": f"AI feature {i}"} for i in range(5)]}],
+    },
+}
+
+
+@pytest.fixture
+def ai(monkeypatch):
+    """Configured assistant whose AI calls are answered from RESPONSES."""
+    monkeypatch.setattr(ai_assistant, "get_effective_sdk_env", lambda: {
+        "ANTHROPIC_API_KEY": "test-key",
+        "ANTHROPIC_BASE_URL": "http://ai.test",
+    })
+    AIAssistant.reload_config()
+    assistant = AIAssistant()
+    assert not assistant.use_mock
+
+    # Every call waits for the other two, so serialized calls would time out
+    barrier = threading.Barrier(3)
+    assistant.failing_system = None
+
+    def call_ai(prompt, system="", max_tokens=4000, stream=False, validate=None):
+        barrier.wait(timeout=5)
+        if system == assistant.failing_system:
+            raise RuntimeError("boom")
+        return orjson.dumps(RESPONSES[system]).decode()
+
+    monkeypatch.setattr(assistant, "_call_ai", call_ai)
+    yield assistant
+    AIAssistant.reload_config()
+
+
+def test_results_keyed_by_call(ai):
+    results = ai.run_all(ANALYSIS, CONTEXT)
+
+    assert set(results) == {"analysis", "ideas", "roadmap"}
+    assert results["analysis"]["assessment"] == "AI assessment"
+    assert [i["title"] for i in results["ideas"]] == [f"AI idea {i}" for i in range(5)]
+    features = results["roadmap"]["milestones"][0]["features"]
+    assert [f["title"] for f in features] == [f"AI feature {i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("key,system", [
+    ("analysis", ai_assistant._ANALYZE_SYSTEM),
+    ("ideas", ai_assistant._IDEAS_SYSTEM),
+    ("roadmap", ai_assistant._ROADMAP_SYSTEM),
+])
+def test_failed_call_keeps_other_results(ai, key, system):
+    """A call that raises falls back to its mock; the other two keep their AI results."""
+    ai.failing_system = system
+
+    results = ai.run_all(ANALYSIS, CONTEXT)
+    expected = AIAssistant(use_mock=True).run_all(ANALYSIS, CONTEXT)[key]
+
+    if key == "ideas":
+        # Mock ideas carry fresh IDs and timestamps
+        assert [i["title"] for i in results[key]] == [i["title"] for i in expected]
+    else:
+        assert results[key] == expected
+    if key != "analysis":
+        assert results["analysis"]["assessment"] == "AI assessment"
+    if key != "ideas":
+        assert results["ideas"][0]["title"] == "AI idea 0"
+    if key != "roadmap":
+        assert results["roadmap"]["milestones"][0]["features"][0]["title"] == "AI feature 0"
@@ -0,0 +1,64 @@
+"""
+Unit Tests for Project Helpers
+==============================
+
+Tests resolve_project_dir, the project directory dependency shared by the
+routers, and get_project_xaheen_dir.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from server.utils import project_helpers
+from server.utils.project_helpers import get_project_xaheen_dir, invalidate_project_path, resolve_project_dir
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """Registry mapping project names to paths, with empty helper caches."""
+    paths = {}
+    monkeypatch.setattr(project_helpers, "_registry_get_project_path", paths.get)
+    invalidate_project_path()
+    yield paths
+    invalidate_project_path()
+
+
+def test_returns_registered_directory(registry, tmp_path):
+    registry["demo"] = tmp_path
+    assert resolve_project_dir("demo") == tmp_path
+
+
+@pytest.mark.parametrize("registered", [False, True], ids=["unregistered", "missing-dir"])
+def test_missing_project_is_404(registry, tmp_path, registered):
+    if registered:
+        registry["demo"] = tmp_path / "gone"
+
+    with pytest.raises(HTTPException) as exc:
+        resolve_project_dir("demo")
+    assert exc.value.status_code == 404
+    assert exc.value.detail == "Project 'demo' not found"
+
+
+def test_invalid_name_is_400(registry):
+    with pytest.raises(HTTPException) as exc:
+        resolve_project_dir("../etc")
+    assert exc.value.status_code == 400
+
+
+def test_existence_check_cached_until_invalidated(registry, tmp_path):
+    project_dir = tmp_path / "demo"
+    project_dir.mkdir()
+    registry["demo"] = project_dir
+    resolve_project_dir("demo")
+
+    project_dir.rmdir()
+    assert resolve_project_dir("demo") == project_dir
+
+    invalidate_project_path("demo")
+    with pytest.raises(HTTPException):
+        resolve_project_dir("demo")
+
+
+def test_xaheen_dir_of_unregistered_project(registry):
+    with pytest.raises(ValueError, match="Project 'demo' not found"):
+        get_project_xaheen_dir("demo")
@@ -825,8 +825,7 @@ export async function exportRoadmap(
     `${API_BASE}/projects/${projectName}/roadmap/export?format=${format}`
   )
   if (!response.ok) throw new Error('Failed to export roadmap')
-  const data = await response.json()
-  return data.content
+  return response.text()
 }
 
 export async function getRoadmapStats(projectName: string): Promise<RoadmapStats> {